@@ -0,0 +1,143 @@
+"""
+Throughput of the task views at high concurrency under WSGI and ASGI.
+
+Variants:
+- sync views / WSGI: TaskCreateView etc. through Django's WSGI handler, one
+  thread per concurrent request (like a threaded WSGI server)
+- sync views / ASGI: the same views through Django's ASGI handler, which
+  runs each request's sync code in its own worker thread via sync_to_async
+- async views / ASGI: tasks.async_views through the ASGI handler
+
+Requests are driven in-process (django.test.Client / AsyncClient), so no
+server is needed and the numbers isolate Django's request handling from
+network and server overhead. Listings are measured with the listing cache
+disabled so every request reaches the database.
+
+Usage:
+    python -m benchmarks.bench_async_views [--requests N] [--concurrency C]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from benchmarks.utils import print_results, setup_django, summarise
+
+
+def run_threaded(client_class, path_for: Callable[[int], str], method: str, body_for,
+                 headers: Dict[str, str], requests: int, concurrency: int) -> Dict[str, float]:
+    """Issue requests from ``concurrency`` threads against the WSGI handler"""
+    def call(index: int) -> float:
+        client = client_class()
+        start = time.perf_counter()
+        if method == 'post':
+            response = client.post(path_for(index), json.dumps(body_for(index)),
+                                   content_type='application/json', headers=headers)
+        else:
+            response = client.get(path_for(index), headers=headers)
+        assert response.status_code < 300, response.content
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        timings = list(pool.map(call, range(requests)))
+    return summarise(timings, time.perf_counter() - start)
+
+
+def run_async(client_class, path_for: Callable[[int], str], method: str, body_for,
+              headers: Dict[str, str], requests: int, concurrency: int) -> Dict[str, float]:
+    """
+    Keep ``concurrency`` requests in flight against the ASGI handler.
+
+    Each request runs in its own ThreadSensitiveContext, as under
+    ASGIHandler, so its sync_to_async work gets its own thread and database
+    connection instead of queueing behind every other request's.
+    """
+    from asgiref.sync import ThreadSensitiveContext, sync_to_async
+    from django.db import connections
+
+    async def main() -> List[float]:
+        client = client_class()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(index: int) -> float:
+            async with semaphore, ThreadSensitiveContext():
+                start = time.perf_counter()
+                if method == 'post':
+                    response = await client.post(path_for(index), json.dumps(body_for(index)),
+                                                 content_type='application/json', headers=headers)
+                else:
+                    response = await client.get(path_for(index), headers=headers)
+                elapsed = time.perf_counter() - start
+                # Close the context thread's connections, as request_finished would
+                await sync_to_async(connections.close_all)()
+                assert response.status_code < 300, response.content
+                return elapsed
+
+        return await asyncio.gather(*(call(index) for index in range(requests)))
+
+    start = time.perf_counter()
+    timings = asyncio.run(main())
+    return summarise(timings, time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--tasks', type=int, default=50, help='Tasks in the listed user\'s listing')
+    args = parser.parse_args()
+
+    # A file database, so that concurrent writers wait for the lock instead of failing
+    setup_django(test_database=os.path.join(tempfile.gettempdir(), 'bench_async_views.sqlite3'))
+
+    from django.conf import settings
+    from django.test import AsyncClient, Client
+    from rest_framework_simplejwt.tokens import AccessToken
+    from tasks.models import Task
+    from users.models import User
+
+    settings.ROOT_URLCONF = 'benchmarks.urls'
+    settings.TASK_LIST_CACHE_ENABLED = False
+    settings.MIDDLEWARE = [
+        middleware for middleware in settings.MIDDLEWARE if not middleware.endswith('APILoggingMiddleware')
+    ]
+
+    user = User.objects.create_user(username='bench', password='benchpass123')
+    others = User.objects.bulk_create(
+        [User(username=f'bench-{index}') for index in range(10)]
+    )
+    tasks = Task.objects.bulk_create(
+        [Task(name=f'Task {index}', task_type='W') for index in range(args.tasks)]
+    )
+    Task.add_assignments((task.id, user.id) for task in tasks)
+    Task.add_assignments((task.id, other.id) for task in tasks[:5] for other in others[:3])
+    headers = {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+    scenarios = {
+        'list': ('get', lambda prefix: lambda i: f'/{prefix}/users/{user.id}/tasks/', None),
+        'create': ('post', lambda prefix: lambda i: f'/{prefix}/tasks/create/',
+                   lambda i: {'name': f'Bench {i}', 'task_type': 'W', 'assigned_users': [user.id]}),
+        'assign': ('post', lambda prefix: lambda i: f'/{prefix}/tasks/{tasks[i % len(tasks)].id}/assign/',
+                   lambda i: {'user_ids': [others[i % len(others)].id]}),
+    }
+
+    for name, (method, path, body_for) in scenarios.items():
+        options = (method, body_for, headers, args.requests, args.concurrency)
+        results = {
+            'sync views / WSGI': run_threaded(Client, path('sync'), *options),
+            'sync views / ASGI': run_async(AsyncClient, path('sync'), *options),
+            'async views / ASGI': run_async(AsyncClient, path('async'), *options),
+        }
+        print_results(
+            f'{name}: {args.requests} requests, {args.concurrency} concurrent', results
+        )
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-request cost of JWT authentication.
+
+Variants:
+- simplejwt JWTAuthentication: verifies the signature and loads the user
+  from the database on every request
+- cached user: CachedJWTAuthentication with the verified-token cache
+  disabled, so only the User SELECT is saved
+- cached user + verified token: the default configuration, where a repeated
+  token is neither verified again nor looked up in the database
+
+Usage:
+    python -m benchmarks.bench_auth [--iterations N]
+"""
+import argparse
+
+from benchmarks.utils import measure, print_results, setup_django
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import override_settings
+    from rest_framework.test import APIRequestFactory
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+    from rest_framework_simplejwt.tokens import AccessToken
+    from users.authentication import CachedJWTAuthentication, verified_token_cache
+    from users.models import User
+
+    user = User.objects.create_user(username='bench', password='benchpass123')
+    request = APIRequestFactory().get(
+        '/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}'
+    )
+
+    def authenticate(authenticator):
+        def run():
+            assert authenticator.authenticate(request)[0].pk == user.pk
+        return run
+
+    results = {}
+    results['simplejwt JWTAuthentication'] = measure(
+        authenticate(JWTAuthentication()), args.iterations)
+    with override_settings(JWT_VERIFIED_TOKEN_CACHE_SIZE=0):
+        results['cached user'] = measure(
+            authenticate(CachedJWTAuthentication()), args.iterations)
+    verified_token_cache.reset_stats()
+    results['cached user + verified token'] = measure(
+        authenticate(CachedJWTAuthentication()), args.iterations)
+
+    print_results(f'JWT authentication ({args.iterations} requests each)', results)
+    print(f"verified token cache: {verified_token_cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Overhead and volume of API request logging.
+
+Variants:
+- legacy: the previous tasks.logging and users.logging middlewares, both
+  installed, each logging a request and a response record (the response
+  record carrying the serialized payload)
+- compact: APILoggingMiddleware logging every request
+- compact, sampled: APILoggingMiddleware with API_LOG_SAMPLE_RATE=0.1
+
+Each request is a GET of a user task listing with ``--tasks`` tasks, handled
+by a stub view returning the rendered response, so only the middleware cost
+is timed. Records go through the configured formatter into memory. Volume is
+reported both as plain text (the api.log format) and as JSON lines with the
+extra fields, as a structured log shipper would store them; the timings
+include producing both.
+
+Every configuration, including the one without logging, first runs one
+untimed warm-up request, so none of them pays for imports, URL resolution or
+first-use setup. The configurations are then timed in turn ``--repeats``
+times, and the median of each figure is reported.
+
+Usage:
+    python -m benchmarks.bench_logging [--iterations N] [--repeats N] [--tasks N]
+"""
+import argparse
+import json
+import logging
+import time
+
+from benchmarks.utils import measure, median_summary, print_results, setup_django
+
+
+class CountingHandler(logging.Handler):
+    """Formats records like the file handler and counts their size"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = 0
+        self.text_bytes = 0
+        self.json_bytes = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        self.records += 1
+        self.text_bytes += len(message) + 1
+        extra = {name: getattr(record, name) for name in ('user', 'data', 'path', 'api') if hasattr(record, name)}
+        self.json_bytes += len(json.dumps({'message': message, **extra}, default=str)) + 1
+
+    def reset(self) -> None:
+        self.records = self.text_bytes = self.json_bytes = 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--repeats', type=int, default=5, help="Timed runs per configuration; the median is reported")
+    parser.add_argument('--tasks', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import override_settings
+    from django.urls import resolve
+    from django.utils.deprecation import MiddlewareMixin
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.response import Response
+    from rest_framework.test import APIRequestFactory
+    from tasks.logging import APILoggingMiddleware
+    from users.models import User
+
+    logger = logging.getLogger('api')
+
+    class LegacyAPILoggingMiddleware(MiddlewareMixin):
+        def process_request(self, request):
+            request.start_time = time.time()
+            logger.info(
+                f"Request: {request.method} {request.path}",
+                extra={'user': request.user.username, 'data': request.GET or request.POST}
+            )
+
+        def process_response(self, request, response):
+            duration = time.time() - request.start_time
+            logger.info(
+                f"Response: {response.status_code} ({duration:.2f}s)",
+                extra={'data': getattr(response, 'data', None)}
+            )
+            return response
+
+    user = User.objects.create_user(username='bench', password='benchpass123')
+    path = f'/api/v1/users/{user.id}/tasks/'
+    data = {
+        'status': 'success',
+        'data': {
+            'count': args.tasks,
+            'results': [
+                {
+                    'id': i, 'name': f'Task {i}', 'description': 'Benchmark task ' * 4,
+                    'task_type': 'feature', 'status': 'P', 'created_at': '2026-01-01T00:00:00Z',
+                    'completed_at': None, 'assigned_users': [{'id': user.id, 'username': 'bench'}],
+                }
+                for i in range(args.tasks)
+            ],
+        },
+    }
+
+    def view(request):
+        response = Response(data)
+        response.accepted_renderer = JSONRenderer()
+        response.accepted_media_type = 'application/json'
+        response.renderer_context = {}
+        return response.render()
+
+    factory = APIRequestFactory()
+
+    def make_request():
+        request = factory.get(path)
+        request.user = user
+        request.resolver_match = resolve(path)
+        return request
+
+    def chain(*middleware_classes):
+        handler = view
+        for middleware_class in reversed(middleware_classes):
+            handler = middleware_class(handler)
+
+        def run():
+            assert handler(make_request()).status_code == 200
+        return run
+
+    counter = CountingHandler()
+    logger.handlers, logger.propagate = [counter], False  # Keep the benchmark out of api.log
+    variants = {
+        'no logging': (chain(), 1.0),
+        'legacy (x2 middleware)': (chain(LegacyAPILoggingMiddleware, LegacyAPILoggingMiddleware), 1.0),
+        'compact': (chain(APILoggingMiddleware), 1.0),
+        'compact, sampled 10%': (chain(APILoggingMiddleware), 0.1),
+    }
+    for run, sample_rate in variants.values():
+        with override_settings(API_LOG_SAMPLE_RATE=sample_rate):
+            run()
+
+    runs = {name: [] for name in variants}
+    volumes = {name: [0, 0, 0] for name in variants}
+    for _ in range(args.repeats):
+        for name, (run, sample_rate) in variants.items():
+            counter.reset()
+            with override_settings(API_LOG_SAMPLE_RATE=sample_rate):
+                runs[name].append(measure(run, args.iterations))
+            for index, value in enumerate((counter.records, counter.text_bytes, counter.json_bytes)):
+                volumes[name][index] += value
+    results = {name: median_summary(summaries) for name, summaries in runs.items()}
+
+    print_results(
+        f'API logging middleware ({args.iterations} requests, {args.tasks} tasks each, '
+        f'median of {args.repeats} runs)',
+        results
+    )
+    baseline = results.pop('no logging')
+    requests = args.iterations * args.repeats
+    print(f"\n{'variant':<28}{'overhead ms':>12}{'records':>10}{'text B/req':>12}{'JSON B/req':>12}")
+    for name, stats in results.items():
+        records, text_bytes, json_bytes = volumes[name]
+        overhead = stats['mean_ms'] - baseline['mean_ms']
+        print(
+            f"{name:<28}{overhead:>12.3f}{records // args.repeats:>10}"
+            f"{text_bytes / requests:>12.1f}{json_bytes / requests:>12.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
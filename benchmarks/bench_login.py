@@ -0,0 +1,66 @@
+"""
+Login throughput before and after the single-hash login flow.
+
+The "legacy" variant reproduces the previous CustomTokenObtainPairView,
+which validated the serializer twice and minted an extra token pair.
+
+Usage:
+    python -m benchmarks.bench_login [--iterations N]
+"""
+import argparse
+
+from benchmarks.utils import measure, print_results, setup_django
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.response import Response
+    from rest_framework.test import APIRequestFactory
+    from users.models import User
+    from users.serializers import CustomTokenObtainPairSerializer
+    from users.views import CustomTokenObtainPairView
+
+    class LegacySerializer(CustomTokenObtainPairSerializer):
+        def validate(self, attrs):
+            data = super().validate(attrs)
+            refresh = self.get_token(self.user)
+            data.update({'refresh': str(refresh), 'access': str(refresh.access_token)})
+            return data
+
+    class LegacyLoginView(CustomTokenObtainPairView):
+        serializer_class = LegacySerializer
+
+        def post(self, request, *args, **kwargs):
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            tokens = serializer.validated_data
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            return Response({'status': 'success', 'tokens': tokens})
+
+    User.objects.create_user(username='bench', password='benchpass123', email='bench@example.com')
+    factory = APIRequestFactory()
+    payload = {'username': 'bench', 'password': 'benchpass123'}
+
+    def login(view):
+        def run():
+            response = view(factory.post('/api/v1/auth/login/', payload, format='json'))
+            assert response.status_code == 200, response.data
+        return run
+
+    results = {
+        'legacy (double validate)': measure(
+            login(LegacyLoginView.as_view(throttle_classes=[])), args.iterations),
+        'current (single validate)': measure(
+            login(CustomTokenObtainPairView.as_view(throttle_classes=[])), args.iterations),
+    }
+    print_results(f'Login benchmark ({args.iterations} logins each)', results)
+
+
+if __name__ == '__main__':
+    main()
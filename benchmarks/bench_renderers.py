@@ -0,0 +1,71 @@
+"""
+JSON render and parse time of large task payloads.
+
+Variants:
+- JSONRenderer / JSONParser: DRF's stdlib-json classes
+- FastJSONRenderer / FastJSONParser: the orjson-backed classes in
+  taskmanager.renderers (API_JSON_BACKEND = 'orjson')
+
+The rendered payload is a user task listing envelope holding ``--tasks``
+tasks serialized with TaskSerializer (each with three assigned users); the
+parsed payload is a bulk create request body of the same size.
+
+Usage:
+    python -m benchmarks.bench_renderers [--sizes 1000,10000] [--iterations N]
+"""
+import argparse
+import io
+
+from benchmarks.utils import measure, print_results, setup_django
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', default='1000,10000', help='Comma-separated task counts')
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from benchmarks.dataset import seed_dataset
+    from tasks.models import Task
+    from tasks.serializers import TaskSerializer
+    from taskmanager import renderers
+    from taskmanager.renderers import FastJSONParser, FastJSONRenderer
+
+    if renderers.orjson is None:
+        print("orjson is not installed: FastJSON* fall back to the stdlib classes")
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    seed_dataset(users=50, tasks=max(sizes), fanout=3)
+    tasks = list(Task.objects.prefetch_related('assigned_users').order_by('id'))
+
+    for size in sizes:
+        data = {
+            'status': 'success',
+            'data': {'count': size, 'results': TaskSerializer(tasks[:size], many=True).data},
+        }
+        body = JSONRenderer().render([
+            {'name': task['name'], 'description': task['description'], 'task_type': task['task_type'],
+             'assigned_users': [user['id'] for user in task['assigned_users']]}
+            for task in data['data']['results']
+        ])
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+        results = {
+            'render JSONRenderer': measure(lambda: JSONRenderer().render(data), args.iterations),
+            'render FastJSONRenderer': measure(lambda: FastJSONRenderer().render(data), args.iterations),
+            'parse JSONParser': measure(lambda: JSONParser().parse(io.BytesIO(body)), args.iterations),
+            'parse FastJSONParser': measure(lambda: FastJSONParser().parse(io.BytesIO(body)), args.iterations),
+        }
+        print_results(
+            f'{size} tasks ({len(JSONRenderer().render(data)) // 1024} KiB rendered, '
+            f'{len(body) // 1024} KiB parsed), {args.iterations} iterations', results
+        )
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Seeding of the load-test dataset"""
+import random
+from typing import Dict, List
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+PASSWORD = 'loadtest-pass-123'
+
+
+def seed_dataset(users: int, tasks: int, fanout: int, seed: int = 0,
+                 batch_size: int = 1000) -> Dict[str, List[int]]:
+    """
+    Create ``users`` users and ``tasks`` tasks, each task assigned to
+    ``fanout`` distinct random users.
+
+    All users share the password PASSWORD, hashed once. Rows are built with
+    the factories and inserted with bulk_create, and assignments go straight
+    into the through table, so no delta sync history or events are created.
+    The same seed gives the same data.
+
+    Returns:
+        {'users': [user IDs], 'tasks': [task IDs]}
+    """
+    import factory.random
+    from benchmarks.factories import TaskFactory, UserFactory
+    from tasks.models import Task
+    from users.models import User
+
+    factory.random.reseed_random(seed)
+    rng = random.Random(seed)
+    UserFactory.reset_sequence(0)
+    password = make_password(PASSWORD)
+
+    with transaction.atomic():
+        user_ids = [
+            user.id for user in User.objects.bulk_create(
+                UserFactory.build_batch(users, password=password), batch_size=batch_size
+            )
+        ]
+        task_ids = [
+            task.id for task in Task.objects.bulk_create(TaskFactory.build_batch(tasks), batch_size=batch_size)
+        ]
+        Assignment = Task.assigned_users.through
+        Assignment.objects.bulk_create(
+            [
+                Assignment(task_id=task_id, user_id=user_id)
+                for task_id in task_ids
+                for user_id in rng.sample(user_ids, min(fanout, len(user_ids)))
+            ],
+            batch_size=batch_size
+        )
+    return {'users': user_ids, 'tasks': task_ids}
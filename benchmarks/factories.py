@@ -0,0 +1,34 @@
+"""factory-boy factories for benchmark and load-test data"""
+import factory
+from factory import fuzzy
+from tasks.models import Task
+from users.models import User
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """
+    User named ``loadtest-<n>``. The password hash is passed in by the
+    caller (see benchmarks.dataset), so a batch does not hash one password
+    per user.
+    """
+
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f'loadtest-{n}')
+    first_name = factory.Faker('first_name')
+    last_name = factory.Faker('last_name')
+    email = factory.LazyAttribute(lambda user: f'{user.username}@example.com')
+    mobile = factory.Sequence(lambda n: f'+1{n:010d}')
+
+
+class TaskFactory(factory.django.DjangoModelFactory):
+    """Task with a Faker name and description and a random type and status"""
+
+    class Meta:
+        model = Task
+
+    name = factory.Faker('sentence', nb_words=4)
+    description = factory.Faker('paragraph', nb_sentences=2)
+    task_type = fuzzy.FuzzyChoice(Task.TaskType.values)
+    status = fuzzy.FuzzyChoice(Task.Status.values)
@@ -0,0 +1,271 @@
+"""
+Concurrent API workloads, driven in-process or against a running server.
+
+Used by the ``loadtest`` management command. A workload builds request i
+from the seeded dataset; a driver sends the requests with a fixed number in
+flight and reports latency percentiles, throughput, error count and
+database queries per request (from the X-DB-Queries header, see
+tasks.instrumentation).
+"""
+import asyncio
+import json
+import random
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.dataset import PASSWORD
+from benchmarks.utils import summarise
+
+API = '/api/v1'
+
+# (method, path, JSON body or None, send the bearer token)
+Request = Tuple[str, str, Optional[dict], bool]
+# (status code, latency in seconds, queries or None)
+Result = Tuple[int, float, Optional[int]]
+
+
+@dataclass
+class Context:
+    """Seeded data and the access tokens of the virtual users"""
+    user_ids: List[int]
+    usernames: List[str]
+    task_ids: List[int]
+    fanout: int
+    seed: int = 0
+    tokens: List[Tuple[int, str]] = field(default_factory=list)  # (user ID, access token)
+
+    def rng(self, index: int) -> random.Random:
+        return random.Random(self.seed * 1_000_003 + index)
+
+
+def login(ctx: Context, index: int) -> Request:
+    username = ctx.usernames[index % len(ctx.usernames)]
+    return 'post', f'{API}/auth/login/', {'username': username, 'password': PASSWORD}, False
+
+
+def create(ctx: Context, index: int) -> Request:
+    rng = ctx.rng(index)
+    body = {
+        'name': f'Load test task {index}',
+        'description': 'Created by the load test',
+        'task_type': 'W',
+        'assigned_users': rng.sample(ctx.user_ids, min(ctx.fanout, len(ctx.user_ids))),
+    }
+    return 'post', f'{API}/tasks/create/', body, True
+
+
+def assign(ctx: Context, index: int) -> Request:
+    rng = ctx.rng(index)
+    task_id = rng.choice(ctx.task_ids)
+    return 'post', f'{API}/tasks/{task_id}/assign/', {'user_ids': rng.sample(ctx.user_ids, 1)}, True
+
+
+def list_tasks(ctx: Context, index: int) -> Request:
+    user_id, _ = ctx.tokens[index % len(ctx.tokens)]
+    return 'get', f'{API}/users/{user_id}/tasks/', None, True
+
+
+WORKLOADS: Dict[str, Callable[[Context, int], Request]] = {
+    'login': login,
+    'create': create,
+    'assign': assign,
+    'list': list_tasks,
+}
+
+
+def _queries(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+class WSGIDriver:
+    """Django's test Client through the WSGI handler, one client per thread"""
+
+    is_async = False
+
+    def __init__(self) -> None:
+        from django.test import Client
+        self._client_class = Client
+        self._local = threading.local()
+
+    def send(self, method: str, path: str, body: Optional[dict], token: Optional[str]) -> Result:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self._client_class()
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        start = time.perf_counter()
+        if method == 'post':
+            response = client.post(path, json.dumps(body), content_type='application/json', headers=headers)
+        else:
+            response = client.get(path, headers=headers)
+        return response.status_code, time.perf_counter() - start, _queries(response.get('X-DB-Queries'))
+
+
+class ASGIDriver:
+    """
+    Django's AsyncClient through the ASGI handler.
+
+    Like ASGIHandler in production, each request runs in its own
+    ThreadSensitiveContext, so its sync work (sync middleware and views,
+    sync_to_async ORM calls) gets its own thread and database connection.
+    Without it, every request in flight would share one sync thread: their
+    sync work would be serialized and their queries counted together.
+    """
+
+    is_async = True
+
+    def __init__(self) -> None:
+        from django.test import AsyncClient
+        self._client = AsyncClient()
+
+    async def send(self, method: str, path: str, body: Optional[dict], token: Optional[str]) -> Result:
+        from asgiref.sync import ThreadSensitiveContext, sync_to_async
+        from django.db import connections
+
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        async with ThreadSensitiveContext():
+            start = time.perf_counter()
+            if method == 'post':
+                response = await self._client.post(
+                    path, json.dumps(body), content_type='application/json', headers=headers
+                )
+            else:
+                response = await self._client.get(path, headers=headers)
+            latency = time.perf_counter() - start
+            # The context's thread goes away with it; close its connections
+            # like request_finished does, which the test client disconnects
+            await sync_to_async(connections.close_all)()
+        return response.status_code, latency, _queries(response.get('X-DB-Queries'))
+
+
+class HTTPDriver:
+    """
+    HTTP requests to a running server (``python manage.py runserver``,
+    gunicorn, uvicorn, ...). Queries per request are only reported when the
+    server runs with QUERY_STATS_HEADERS enabled.
+    """
+
+    is_async = False
+
+    def __init__(self, base_url: str, timeout: float = 30) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def send(self, method: str, path: str, body: Optional[dict], token: Optional[str]) -> Result:
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method.upper())
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                status, queries = response.status, response.headers.get('X-DB-Queries')
+        except urllib.error.HTTPError as error:
+            error.read()
+            status, queries = error.code, error.headers.get('X-DB-Queries')
+        return status, time.perf_counter() - start, _queries(queries)
+
+
+def obtain_tokens(driver, ctx: Context, count: int) -> None:
+    """Log in the first ``count`` users through the API and keep their access tokens"""
+    for user_id, username in list(zip(ctx.user_ids, ctx.usernames))[:count]:
+        body = {'username': username, 'password': PASSWORD}
+        status, token = _login(driver, body)
+        if status != 200:
+            raise RuntimeError(f"Login of {username} failed with status {status}")
+        ctx.tokens.append((user_id, token))
+
+
+def _login(driver, body: dict) -> Tuple[int, Optional[str]]:
+    path = f'{API}/auth/login/'
+    if isinstance(driver, HTTPDriver):
+        request = urllib.request.Request(
+            driver.base_url + path, data=json.dumps(body).encode(),
+            headers={'Content-Type': 'application/json'}, method='POST'
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=driver.timeout) as response:
+                return response.status, json.loads(response.read())['tokens']['access']
+        except urllib.error.HTTPError as error:
+            return error.code, None
+
+    from django.test import Client
+    response = Client().post(path, json.dumps(body), content_type='application/json')
+    return response.status_code, response.json()['tokens']['access'] if response.status_code == 200 else None
+
+
+def run_workload(driver, workload: Callable[[Context, int], Request], ctx: Context,
+                 requests: int, concurrency: int) -> Dict[str, float]:
+    """
+    Send ``requests`` requests of ``workload`` with ``concurrency`` in flight.
+
+    Returns:
+        summarise() figures plus requests, errors (status >= 400) and
+        queries_per_request (None when the driver cannot report it)
+    """
+    def build(index: int) -> Tuple[str, str, Optional[dict], Optional[str]]:
+        method, path, body, authenticated = workload(ctx, index)
+        token = ctx.tokens[index % len(ctx.tokens)][1] if authenticated else None
+        return method, path, body, token
+
+    start = time.perf_counter()
+    if driver.is_async:
+        async def main() -> List[Result]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def call(index: int) -> Result:
+                async with semaphore:
+                    return await driver.send(*build(index))
+
+            return await asyncio.gather(*(call(index) for index in range(requests)))
+
+        results = asyncio.run(main())
+    elif concurrency == 1:
+        results = [driver.send(*build(index)) for index in range(requests)]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda index: driver.send(*build(index)), range(requests)))
+    elapsed = time.perf_counter() - start
+
+    summary = summarise([latency for _, latency, _ in results], elapsed)
+    queries = [count for _, _, count in results if count is not None]
+    summary.update({
+        'requests': requests,
+        'errors': sum(1 for status, _, _ in results if status >= 400),
+        'queries_per_request': statistics.mean(queries) if queries else None,
+    })
+    return summary
+
+
+def print_report(title: str, results: Dict[str, Dict[str, float]], write: Callable[[str], None]) -> None:
+    """One row per workload"""
+    write(title)
+    write(f"{'workload':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'queries':>9}")
+    for name, stats in results.items():
+        queries = stats['queries_per_request']
+        write(
+            f"{name:<10}{stats['ops_per_sec']:>10.1f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['errors']:>8}{(f'{queries:.1f}' if queries is not None else '-'):>9}"
+        )
+
+
+def print_comparison(baseline: dict, current: dict, write: Callable[[str], None]) -> None:
+    """Change of each workload's figures against a previous results file"""
+    write(f"Compared with {baseline['meta'].get('commit') or 'unknown commit'} "
+          f"({baseline['meta'].get('timestamp', '?')})")
+    write(f"{'workload':<10}{'metric':<10}{'before':>12}{'after':>12}{'change':>10}")
+    for name, stats in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        for metric in ('ops_per_sec', 'p50_ms', 'p95_ms', 'p99_ms'):
+            old, new = before[metric], stats[metric]
+            change = f'{(new - old) / old * 100:+.1f}%' if old else '-'
+            write(f"{name:<10}{metric:<10}{old:>12.2f}{new:>12.2f}{change:>10}")
@@ -0,0 +1,170 @@
+import json
+import logging
+import os
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from benchmarks.dataset import seed_dataset
+from benchmarks.loadtest import (
+    ASGIDriver, Context, HTTPDriver, WORKLOADS, WSGIDriver, obtain_tokens, print_comparison,
+    print_report, run_workload
+)
+from benchmarks.utils import create_test_database
+
+
+class Command(BaseCommand):
+    """
+    Seed a dataset and measure the API under concurrent load.
+
+    Modes:
+    - wsgi (default) / asgi: requests go through Django's WSGI or ASGI
+      handler in this process (django.test.Client / AsyncClient), against
+      a throwaway SQLite file database, with DEBUG off, throttle limits
+      lifted and query counting headers on. The api log is silenced.
+    - http: requests go to a running server at --url. Use --seed-data to
+      seed the configured database first (it must be the server's); without
+      it, the users and tasks of a previous seeding are used. The server's
+      throttle limits apply, and queries per request are only reported
+      when it runs with QUERY_STATS_HEADERS=True.
+
+    Results are printed and saved as JSON (--output) for comparison between
+    commits with --compare.
+    """
+
+    help = "Seed N users / M tasks and report latency, req/s and queries per request of API workloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mode', choices=['wsgi', 'asgi', 'http'], default='wsgi')
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help="Server for --mode http")
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--tasks', type=int, default=2000)
+        parser.add_argument('--fanout', type=int, default=3, help="Users assigned to each seeded or created task")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed of the dataset and requests")
+        parser.add_argument(
+            '--workloads', default='login,create,assign,list',
+            help=f"Comma-separated, from: {', '.join(WORKLOADS)}"
+        )
+        parser.add_argument('--requests', type=int, default=500, help="Requests per workload")
+        parser.add_argument(
+            '--login-requests', type=int, default=50,
+            help="Requests of the login workload (password hashing makes it slow)"
+        )
+        parser.add_argument('--concurrency', type=int, default=10, help="Requests in flight")
+        parser.add_argument('--output', help="Results file (default: benchmarks/results/loadtest-<commit>-<mode>.json)")
+        parser.add_argument('--compare', help="Previous results file to compare with")
+        parser.add_argument('--seed-data', action='store_true', help="Seed the configured database (http mode)")
+        parser.add_argument(
+            '--use-current-database', action='store_true',
+            help="In-process modes: seed and run against the configured database instead of a throwaway one"
+        )
+
+    def handle(self, *args, **options):
+        workloads = [name.strip() for name in options['workloads'].split(',') if name.strip()]
+        unknown = set(workloads) - set(WORKLOADS)
+        if unknown:
+            raise CommandError(f"Unknown workloads: {', '.join(sorted(unknown))}")
+        if options['concurrency'] < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        if options['mode'] == 'http':
+            results = self.run(HTTPDriver(options['url']), workloads, options, seed=options['seed_data'])
+        else:
+            results = self.run_in_process(workloads, options)
+
+        report = {'meta': self.metadata(workloads, options), 'results': results}
+        output = options['output'] or os.path.join(
+            'benchmarks', 'results', f"loadtest-{report['meta']['commit'] or 'unknown'}-{options['mode']}.json"
+        )
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        with open(output, 'w') as stream:
+            json.dump(report, stream, indent=2)
+
+        write = self.stdout.write
+        print_report(
+            f"{options['mode']}: {options['users']} users, {options['tasks']} tasks, "
+            f"fan-out {options['fanout']}, concurrency {options['concurrency']}",
+            results, write
+        )
+        if options['compare']:
+            with open(options['compare']) as stream:
+                print_comparison(json.load(stream), report, write)
+        self.stdout.write(self.style.SUCCESS(f"Saved results to {output}"))
+
+    def run_in_process(self, workloads, options):
+        throttle_free = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': {
+                scope: '1000000/s' for scope in settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {})
+            },
+        }
+        api_logger = logging.getLogger('api')
+        handlers = api_logger.handlers
+        old_name = connection.settings_dict['NAME']
+        if not options['use_current_database']:
+            create_test_database(os.path.join(tempfile.gettempdir(), 'loadtest.sqlite3'))
+        try:
+            api_logger.handlers = [logging.NullHandler()]
+            with override_settings(
+                DEBUG=False, ALLOWED_HOSTS=['testserver'], QUERY_STATS_HEADERS=True,
+                REST_FRAMEWORK=throttle_free,
+            ):
+                driver = ASGIDriver() if options['mode'] == 'asgi' else WSGIDriver()
+                return self.run(driver, workloads, options, seed=True)
+        finally:
+            api_logger.handlers = handlers
+            if not options['use_current_database']:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def run(self, driver, workloads, options, seed: bool):
+        ctx = self.dataset(options, seed)
+        obtain_tokens(driver, ctx, min(options['concurrency'], len(ctx.user_ids)))
+        return {
+            name: run_workload(
+                driver, WORKLOADS[name], ctx,
+                options['login_requests'] if name == 'login' else options['requests'],
+                options['concurrency']
+            )
+            for name in workloads
+        }
+
+    def dataset(self, options, seed: bool) -> Context:
+        from users.models import User
+
+        if seed:
+            self.stdout.write(f"Seeding {options['users']} users and {options['tasks']} tasks...")
+            ids = seed_dataset(options['users'], options['tasks'], options['fanout'], seed=options['seed'])
+            users = list(User.objects.filter(id__in=ids['users']).order_by('id').values_list('id', 'username'))
+            task_ids = ids['tasks']
+        else:
+            from tasks.models import Task
+            users = list(
+                User.objects.filter(username__startswith='loadtest-').order_by('id').values_list('id', 'username')
+            )
+            task_ids = list(Task.objects.order_by('id').values_list('id', flat=True)[:options['tasks']])
+        if not users or not task_ids:
+            raise CommandError("No load test data found; run with --seed-data first")
+        return Context(
+            user_ids=[user_id for user_id, _ in users], usernames=[username for _, username in users],
+            task_ids=task_ids, fanout=options['fanout'], seed=options['seed'],
+        )
+
+    @staticmethod
+    def metadata(workloads, options) -> dict:
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'workloads': workloads,
+            **{name: options[name] for name in (
+                'mode', 'users', 'tasks', 'fanout', 'seed', 'requests', 'login_requests', 'concurrency'
+            )},
+        }
@@ -0,0 +1,19 @@
+"""
+URLconf for benchmarks that compare view implementations side by side.
+
+Throttling is disabled so that only the request handling is measured.
+"""
+from django.urls import path
+from tasks.async_views import AsyncTaskAssignView, AsyncTaskCreateView, AsyncUserTasksView
+from tasks.views import TaskAssignView, TaskCreateView, UserTasksView
+
+unthrottled = {'throttle_classes': []}
+
+urlpatterns = [
+    path('sync/tasks/create/', TaskCreateView.as_view(**unthrottled)),
+    path('sync/tasks/<int:pk>/assign/', TaskAssignView.as_view(**unthrottled)),
+    path('sync/users/<int:user_id>/tasks/', UserTasksView.as_view(**unthrottled)),
+    path('async/tasks/create/', AsyncTaskCreateView.as_view(**unthrottled)),
+    path('async/tasks/<int:pk>/assign/', AsyncTaskAssignView.as_view(**unthrottled)),
+    path('async/users/<int:user_id>/tasks/', AsyncUserTasksView.as_view(**unthrottled)),
+]
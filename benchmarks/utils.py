@@ -0,0 +1,109 @@
+"""
+Shared helpers for the standalone benchmark scripts.
+
+Each script is run as a module from the repository root, e.g.::
+
+    python -m benchmarks.bench_login
+
+and works against a throwaway test database so it never touches db.sqlite3.
+"""
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+
+def setup_django(test_database: Optional[str] = None) -> None:
+    """
+    Configure Django and create an empty test database.
+
+    Args:
+        test_database: File to use for the SQLite test database instead of
+            the default in-memory one. Needed for concurrent writers, which
+            an in-memory shared-cache database rejects as "table is locked".
+            The file is recreated on every run.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskmanager.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key')
+
+    import django
+    django.setup()
+
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    create_test_database(test_database)
+
+
+def create_test_database(test_database: Optional[str] = None) -> None:
+    """
+    Point the default connection at a new, migrated test database.
+
+    Args:
+        test_database: SQLite file to use instead of an in-memory database
+            (see setup_django()). Ignored for other database engines, which
+            get Django's usual test database name.
+    """
+    from django.db import connection
+
+    if test_database and connection.vendor == 'sqlite':
+        connection.settings_dict['TEST']['NAME'] = test_database
+        # Wait for the write lock, and take it when a transaction starts so that
+        # a read-then-write transaction cannot fail on a lock upgrade
+        connection.settings_dict['OPTIONS'].setdefault('timeout', 30)
+        connection.settings_dict['OPTIONS'].setdefault('transaction_mode', 'IMMEDIATE')
+
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False)
+
+
+def measure(func: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """
+    Call ``func`` repeatedly and summarise its latency.
+
+    Returns:
+        Dict with ops_per_sec and mean/p50/p95 latency in milliseconds
+    """
+    timings: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return summarise(timings, sum(timings))
+
+
+def median_summary(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    """
+    Combine the summaries of repeated runs of one variant.
+
+    Returns:
+        The median of each figure across the runs
+    """
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def summarise(timings: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarise per-operation latencies.
+
+    ``elapsed`` is the wall-clock time of the whole run, which is shorter
+    than the sum of the latencies when operations ran concurrently.
+    """
+    ordered = sorted(timings)
+    return {
+        'ops_per_sec': len(timings) / elapsed if elapsed else float('inf'),
+        'mean_ms': statistics.mean(timings) * 1000,
+        'p50_ms': ordered[len(ordered) // 2] * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+def print_results(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Print one row per benchmark variant"""
+    print(title)
+    print(f"{'variant':<28}{'ops/sec':>12}{'mean ms':>12}{'p50 ms':>12}{'p95 ms':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<28}{stats['ops_per_sec']:>12.2f}{stats['mean_ms']:>12.2f}"
+            f"{stats['p50_ms']:>12.2f}{stats['p95_ms']:>12.2f}"
+        )
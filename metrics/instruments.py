@@ -0,0 +1,38 @@
+"""Metrics recorded by the API, labelled by DRF route name (URL pattern name)"""
+from .registry import registry
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+requests_total = registry.counter(
+    'api_requests_total', 'Requests handled, by route, method and status code.',
+    ['route', 'method', 'status'],
+)
+request_duration = registry.histogram(
+    'api_request_duration_seconds', 'Time to produce the response, by route and method.',
+    ['route', 'method'], buckets=LATENCY_BUCKETS,
+)
+response_size = registry.histogram(
+    'api_response_size_bytes', 'Response body size (streaming responses excluded), by route.',
+    ['route'], buckets=SIZE_BUCKETS,
+)
+db_duration = registry.histogram(
+    'api_db_duration_seconds', 'Database time per request, by route.',
+    ['route'], buckets=LATENCY_BUCKETS,
+)
+db_queries_total = registry.counter(
+    'api_db_queries_total', 'Database queries run, by route.', ['route'],
+)
+throttled_total = registry.counter(
+    'api_throttled_requests_total', 'Requests rejected by a rate throttle, by route and scope.',
+    ['route', 'scope'],
+)
+requests_in_progress = registry.gauge(
+    'api_requests_in_progress', 'Requests currently being handled.',
+)
+
+
+def route_name(request) -> str:
+    """Route label of ``request``: the URL pattern name, or "unmatched" (bounded cardinality)"""
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match and match.view_name else 'unmatched'
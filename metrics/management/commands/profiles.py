@@ -0,0 +1,73 @@
+import os
+import pstats
+from collections import Counter
+from django.core.management.base import BaseCommand, CommandError
+from metrics.profiling import collapsed_stacks, list_profiles, profile_directory
+
+
+class Command(BaseCommand):
+    """
+    Inspect request profiles saved by metrics.profiling.ProfilingMiddleware.
+
+    Actions:
+    - list: saved profiles, oldest first
+    - show: top functions of one or more profiles (merged)
+    - collapse: collapsed stacks of one or more profiles (merged), the input
+      of flamegraph.pl and speedscope::
+
+          python manage.py profiles collapse --route user-tasks -o tasks.folded
+          flamegraph.pl tasks.folded > tasks.svg
+    """
+
+    help = "List, summarise or export request profiles for flame graphs"
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['list', 'show', 'collapse'])
+        parser.add_argument(
+            'profiles', nargs='*',
+            help="Profile file names (defaults to all, or all of --route)"
+        )
+        parser.add_argument('--route', help="Only profiles of this route name")
+        parser.add_argument('--top', type=int, default=30, help="Functions shown by 'show'")
+        parser.add_argument(
+            '--sort', default='cumulative',
+            help="pstats sort key for 'show' (cumulative, tottime, calls, ...)"
+        )
+        parser.add_argument('-o', '--output', help="File for 'collapse' (defaults to stdout)")
+
+    def handle(self, *args, **options):
+        directory = profile_directory()
+        names = options['profiles'] or list_profiles(directory)
+        if options['route']:
+            names = [name for name in names if f"-{options['route']}-" in name]
+        paths = [os.path.join(directory, name) for name in names]
+        missing = [path for path in paths if not os.path.exists(path)]
+        if missing:
+            raise CommandError(f"Profiles not found: {', '.join(missing)}")
+
+        if options['action'] == 'list':
+            for path in paths:
+                self.stdout.write(f"{os.path.basename(path)}  {os.path.getsize(path)} bytes")
+            self.stdout.write(self.style.SUCCESS(f"{len(paths)} profiles in {directory}"))
+            return
+
+        if not paths:
+            raise CommandError(f"No profiles in {directory}")
+        stats = pstats.Stats(*paths, stream=self.stdout)
+
+        if options['action'] == 'show':
+            stats.sort_stats(options['sort']).print_stats(options['top'])
+            return
+
+        folded = Counter()
+        for stack, microseconds in collapsed_stacks(stats.stats):
+            folded[stack] += microseconds
+        lines = [f"{stack} {value}" for stack, value in folded.items()]
+        if options['output']:
+            with open(options['output'], 'w') as stream:
+                stream.write('\n'.join(lines) + '\n')
+            self.stdout.write(self.style.SUCCESS(
+                f"Wrote {len(lines)} stacks from {len(paths)} profiles to {options['output']}"
+            ))
+        else:
+            self.stdout.write('\n'.join(lines))
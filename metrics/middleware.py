@@ -0,0 +1,66 @@
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from .instruments import (
+    db_duration, db_queries_total, request_duration, requests_in_progress, requests_total,
+    response_size, route_name
+)
+from .registry import registry
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status, response size and database time of each request.
+
+    Database figures come from tasks.instrumentation.QueryInstrumentationMiddleware,
+    which must come after this middleware in MIDDLEWARE.
+
+    Supports both sync and async middleware chains. Recording only updates
+    in-memory metrics; the snapshot file is written at most once per
+    METRICS_FLUSH_INTERVAL, so the async path does it inline.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        start = time.perf_counter()
+        requests_in_progress.inc()
+        try:
+            response = self.get_response(request)
+        finally:
+            requests_in_progress.dec()
+        return self.record(request, response, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        requests_in_progress.inc()
+        try:
+            response = await self.get_response(request)
+        finally:
+            requests_in_progress.dec()
+        return self.record(request, response, time.perf_counter() - start)
+
+    @staticmethod
+    def record(request, response, duration: float):
+        """Update the request metrics and flush the snapshot if due"""
+        route = route_name(request)
+        requests_total.inc(route=route, method=request.method, status=response.status_code)
+        request_duration.observe(duration, route=route, method=request.method)
+        if not response.streaming:
+            response_size.observe(len(response.content), route=route)
+
+        query_stats = getattr(request, 'query_stats', None)
+        if query_stats is not None:
+            db_duration.observe(query_stats.duration, route=route)
+            db_queries_total.inc(query_stats.count, route=route)
+
+        registry.flush()
+        return response
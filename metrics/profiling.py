@@ -0,0 +1,199 @@
+import cProfile
+import logging
+import os
+import random
+import re
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from users.authentication import CachedJWTAuthentication
+from .instruments import route_name
+
+logger = logging.getLogger('api')
+
+# pstats function key: (filename, line number, function name)
+FunctionKey = Tuple[str, int, str]
+
+
+def profile_directory() -> str:
+    return str(getattr(settings, 'PROFILING_DIR', 'profiles'))
+
+
+class ProfilingMiddleware:
+    """
+    Run cProfile around the rest of the request for selected requests.
+
+    A request is profiled when a staff user sends the PROFILING_HEADER
+    header (``X-Profile: 1``), or at random with PROFILING_SAMPLE_RATE
+    (0 by default). The profile covers authentication, the view, the ORM,
+    serialization and rendering, and is saved with pstats' format as
+    ``<PROFILING_DIR>/<time>-<route>-<pid>.prof``; only the newest
+    PROFILING_MAX_FILES files are kept. Requests profiled on demand get the
+    file name back in an X-Profile-Id header. Use ``manage.py profiles`` to
+    list them, print their top functions or produce collapsed stacks for
+    flame graphs.
+
+    Must be the last middleware. Supports both sync and async middleware
+    chains. In an async chain the profiler runs on the event loop thread: it
+    captures the async view, but not the work it hands to sync_to_async
+    threads, and may include other requests' coroutines that run while the
+    view awaits. Unselected requests pass straight through in both modes.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        on_demand = self.is_requested(request)
+        profiler = self.start_profiler(on_demand)
+        if profiler is None:
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.finish(profiler, request, response, on_demand)
+
+    async def __acall__(self, request):
+        on_demand = await self.ais_requested(request)
+        profiler = self.start_profiler(on_demand)
+        if profiler is None:
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+        return await sync_to_async(self.finish)(profiler, request, response, on_demand)
+
+    @staticmethod
+    def start_profiler(on_demand: bool) -> Optional[cProfile.Profile]:
+        """Enabled profiler if the request is selected, otherwise None"""
+        sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0)
+        if not on_demand and not (sample_rate and random.random() < sample_rate):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # Another profiler is active in this thread
+            return None
+        return profiler
+
+    def finish(self, profiler: cProfile.Profile, request, response, on_demand: bool):
+        """Save the profile and, for on-demand requests, return its name"""
+        try:
+            profile_id = self.save(profiler, request)
+        except OSError:
+            logger.exception("Could not save request profile")
+            return response
+        if on_demand:
+            response['X-Profile-Id'] = profile_id
+        return response
+
+    @staticmethod
+    def has_header(request) -> bool:
+        header = getattr(settings, 'PROFILING_HEADER', 'X-Profile')
+        return bool(request.headers.get(header))
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """Whether a staff user asked for this request to be profiled"""
+        if not cls.has_header(request):
+            return False
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            try:
+                # DRF authenticates inside the view; check the bearer token up front
+                user_auth = CachedJWTAuthentication().authenticate(request)
+            except (AuthenticationFailed, InvalidToken):
+                return False
+            user = user_auth[0] if user_auth else None
+        return bool(user and user.is_staff)
+
+    @classmethod
+    async def ais_requested(cls, request) -> bool:
+        """Async counterpart of is_requested()"""
+        if not cls.has_header(request):
+            return False
+        user = await request.auser() if hasattr(request, 'auser') else None
+        if user is None or not user.is_authenticated:
+            try:
+                user_auth = await CachedJWTAuthentication().aauthenticate(request)
+            except (AuthenticationFailed, InvalidToken):
+                return False
+            user = user_auth[0] if user_auth else None
+        return bool(user and user.is_staff)
+
+    def save(self, profiler: cProfile.Profile, request) -> str:
+        """Write the profile and drop the oldest ones beyond PROFILING_MAX_FILES"""
+        directory = profile_directory()
+        os.makedirs(directory, exist_ok=True)
+        route = re.sub(r'[^A-Za-z0-9_-]', '_', route_name(request))
+        now = time.time()
+        profile_id = f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}.{int(now % 1 * 1000):03d}-{route}-{os.getpid()}.prof"
+        profiler.dump_stats(os.path.join(directory, profile_id))
+
+        max_files = getattr(settings, 'PROFILING_MAX_FILES', 500)
+        files = list_profiles(directory)
+        for name in files[:max(len(files) - max_files, 0)]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass  # Removed by another process
+        return profile_id
+
+
+def list_profiles(directory: Optional[str] = None) -> List[str]:
+    """Profile file names, oldest first"""
+    directory = directory or profile_directory()
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name for name in os.listdir(directory) if name.endswith('.prof'))
+
+
+def collapsed_stacks(stats: Dict, max_depth: int = 64) -> Iterator[Tuple[str, int]]:
+    """
+    Approximate collapsed stacks ("root;caller;callee microseconds") of a
+    pstats stats table, for flamegraph.pl or speedscope.
+
+    cProfile records time per caller-callee edge, not full stacks, so each
+    function's time is split between its callers in proportion to the time
+    spent on each edge. Recursive calls are cut at the first repetition.
+    """
+    callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_cumtime) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_cumtime))
+    roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+
+    def label(func: FunctionKey) -> str:
+        filename, line, name = func
+        if filename == '~':
+            return name  # Built-in
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def walk(func: FunctionKey, share: float, stack: List[str], seen: set) -> Iterator[Tuple[str, int]]:
+        tottime = stats[func][2]
+        stack = stack + [label(func)]
+        self_us = int(tottime * share * 1e6)
+        if self_us:
+            yield ';'.join(stack), self_us
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_cumtime in callees.get(func, ()):
+            callee_cumtime = stats[callee][3]
+            if callee in seen or not callee_cumtime:
+                continue
+            yield from walk(callee, share * min(edge_cumtime / callee_cumtime, 1.0), stack, seen | {callee})
+
+    for root in roots:
+        yield from walk(root, 1.0, [], {root})
@@ -0,0 +1,277 @@
+import bisect
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from django.conf import settings
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric:
+    """
+    Base class of the metric types: a named family of samples, one per
+    combination of label values.
+    """
+
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._samples: Dict[LabelValues, object] = {}
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def snapshot(self) -> dict:
+        """JSON-serialisable copy of the current samples"""
+        with self._lock:
+            samples = [[list(key), self._copy(value)] for key, value in self._samples.items()]
+        return {
+            'type': self.type, 'help': self.documentation,
+            'labelnames': list(self.labelnames), 'samples': samples,
+        }
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+class Counter(Metric):
+    """Monotonically increasing total"""
+
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down, e.g. requests in progress"""
+
+    type = 'gauge'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = self._samples.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._samples[key] = value
+
+
+class Histogram(Metric):
+    """
+    Distribution over fixed buckets.
+
+    Each sample is [count per bucket (non-cumulative, last is +Inf), sum,
+    count]; observe() is a bisect and three additions.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                sample = self._samples[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            sample[0][index] += 1
+            sample[1] += value
+            sample[2] += 1
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    def snapshot(self) -> dict:
+        data = super().snapshot()
+        data['buckets'] = list(self.buckets)
+        return data
+
+
+class Registry:
+    """
+    Metrics of this process, and their aggregation across processes.
+
+    Under a pre-forking server every worker has its own registry. When
+    METRICS_MULTIPROC_DIR is set, each process writes a snapshot of its
+    metrics to ``<dir>/<pid>.json`` at most every METRICS_FLUSH_INTERVAL
+    seconds (from flush(), called after each request), and collect() merges
+    the snapshots of all processes: counters and histograms are summed over
+    every file, including those of exited workers, while gauges are summed
+    over live processes only. Other workers' figures can therefore be up to
+    METRICS_FLUSH_INTERVAL seconds old. The directory must be emptied when
+    the server is (re)started.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = ()) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    @property
+    def directory(self) -> Optional[str]:
+        return getattr(settings, 'METRICS_MULTIPROC_DIR', None) or None
+
+    def flush(self, force: bool = False) -> None:
+        """Write this process's snapshot to the shared directory, if it is due"""
+        directory = self.directory
+        if directory is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0):
+            return
+        self._last_flush = now
+
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as stream:
+            json.dump(self.snapshot(), stream)
+        os.replace(tmp_path, os.path.join(directory, f'{os.getpid()}.json'))  # Atomic for readers
+
+    def collect(self) -> Dict[str, dict]:
+        """Snapshot of this process merged with those of the other processes"""
+        directory = self.directory
+        if directory is None:
+            return self.snapshot()
+
+        self.flush(force=True)
+        merged: Dict[str, dict] = {}
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith('.json'):
+                continue
+            pid = int(filename[:-len('.json')])
+            try:
+                with open(os.path.join(directory, filename)) as stream:
+                    snapshot = json.load(stream)
+            except (OSError, ValueError):
+                continue  # Removed or replaced while listing
+            self._merge(merged, snapshot, alive=_is_alive(pid))
+        return merged
+
+    @staticmethod
+    def _merge(merged: Dict[str, dict], snapshot: Dict[str, dict], alive: bool) -> None:
+        for name, data in snapshot.items():
+            if data['type'] == 'gauge' and not alive:
+                continue
+            target = merged.setdefault(name, {**data, 'samples': []})
+            samples = {tuple(key): value for key, value in target['samples']}
+            for key, value in data['samples']:
+                key = tuple(key)
+                current = samples.get(key)
+                if current is None:
+                    samples[key] = value
+                elif data['type'] == 'histogram':
+                    samples[key] = [
+                        [a + b for a, b in zip(current[0], value[0])],
+                        current[1] + value[1], current[2] + value[2],
+                    ]
+                else:
+                    samples[key] = current + value
+            target['samples'] = [[list(key), value] for key, value in samples.items()]
+
+    def expose(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for name, data in sorted(self.collect().items()):
+            lines.append(f"# HELP {name} {_escape_help(data['help'])}")
+            lines.append(f"# TYPE {name} {data['type']}")
+            labelnames = data['labelnames']
+            for key, value in sorted(data['samples']):
+                labels = list(zip(labelnames, key))
+                if data['type'] != 'histogram':
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                    continue
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket_count in zip(list(data['buckets']) + [float('inf')], counts):
+                    cumulative += bucket_count
+                    lines.append(f"{name}_bucket{_labels(labels + [('le', _number(bound))])} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+                lines.append(f"{name}_count{_labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in labels]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return f'{float(value):.1f}'
+    return repr(float(value))
+
+
+registry = Registry()
@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import MetricsView
+
+
+urlpatterns = [
+    # GET - Prometheus metrics (internal addresses only)
+    path('', MetricsView.as_view(), name='metrics'),
+]
@@ -0,0 +1,45 @@
+import hmac
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.permissions import BasePermission
+from rest_framework.views import APIView
+from .registry import registry
+
+
+class IsInternalRequest(BasePermission):
+    """
+    Allows scrapers holding METRICS_TOKEN or calling from METRICS_ALLOWED_IPS.
+
+    Nothing is trusted by default: with neither setting configured every
+    request is refused. Loopback is not special, because a reverse proxy
+    on the same host makes every client look like 127.0.0.1.
+    """
+
+    def has_permission(self, request, view) -> bool:
+        token = getattr(settings, 'METRICS_TOKEN', None)
+        if token:
+            header = request.META.get('HTTP_AUTHORIZATION', '')
+            if hmac.compare_digest(header.encode('utf-8'), f'Bearer {token}'.encode('utf-8')):
+                return True
+        return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ())
+
+
+class MetricsView(APIView):
+    """
+    API endpoint exposing the metrics in the Prometheus text format.
+
+    Only reachable with METRICS_TOKEN or from METRICS_ALLOWED_IPS (see
+    IsInternalRequest); not authenticated as a user or throttled, so scrapes
+    neither need a JWT nor count against any rate.
+
+    Returns:
+        text/plain exposition of every metric, merged across worker
+        processes when METRICS_MULTIPROC_DIR is set
+    """
+
+    authentication_classes = []
+    permission_classes = [IsInternalRequest]
+    throttle_classes = []
+
+    def get(self, request):
+        return HttpResponse(registry.expose(), content_type='text/plain; version=0.0.4; charset=utf-8')
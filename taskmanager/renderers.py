@@ -0,0 +1,82 @@
+"""
+orjson-backed JSON renderer and parser for DRF.
+
+orjson is an optional dependency. Without it both classes behave exactly
+like DRF's JSONRenderer and JSONParser, so they can be configured
+unconditionally.
+"""
+import codecs
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised by patching orjson to None
+    orjson = None
+
+# Encodes what orjson does not handle natively (lazy translation strings,
+# Decimals, QuerySets, ...) and datetimes, which are passed through so that
+# they are formatted exactly as by DRF ('Z' for UTC)
+_default = JSONEncoder().default
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same bytes with orjson.
+
+    orjson serializes dicts, lists, strings and numbers in C, several times
+    faster than the stdlib encoder with DRF's JSONEncoder, which matters for
+    large task listings. Types orjson lacks go through DRF's encoder, so the
+    output matches JSONRenderer, including the \\u2028 / \\u2029 escaping.
+
+    Falls back to JSONRenderer when orjson is not installed, when indented
+    output is requested (browsable API, ``; indent=N``), when UNICODE_JSON
+    or COMPACT_JSON is off, and for values orjson cannot encode (integers
+    beyond 64 bits). Unlike STRICT_JSON with the stdlib encoder, NaN and
+    infinity are rendered as null rather than raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None or data is None or self.ensure_ascii or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            # U+2028 / U+2029, escaped like JSONRenderer to stay a JavaScript subset
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser decoding UTF-8 request bodies with orjson.
+
+    Rejects NaN and infinity like JSONParser with STRICT_JSON. Other
+    encodings, STRICT_JSON off and installs without orjson use JSONParser.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -46,6 +46,9 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'django_extensions',
     'users',
+    'throttling',
+    'metrics',
+    'benchmarks',  # Provides the loadtest management command
     'sslserver',
     'corsheaders',
 ]
@@ -59,8 +62,10 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'metrics.middleware.MetricsMiddleware',
     'tasks.logging.APILoggingMiddleware',
-    'users.logging.APILoggingMiddleware',
+    'tasks.instrumentation.QueryInstrumentationMiddleware',  # After the two above, which read its stats
+    'metrics.profiling.ProfilingMiddleware',  # Last, so it only wraps the view
 ]
 
 ROOT_URLCONF = 'taskmanager.urls'
@@ -81,20 +86,38 @@ TEMPLATES = [
     },
 ]
 
+# JSON rendering and parsing: 'orjson' (taskmanager.renderers, falls back to the
+# stdlib when orjson is not installed) or 'stdlib' (DRF's own classes)
+API_JSON_BACKEND = os.getenv('API_JSON_BACKEND', 'orjson')
+if API_JSON_BACKEND == 'orjson':
+    JSON_RENDERER, JSON_PARSER = 'taskmanager.renderers.FastJSONRenderer', 'taskmanager.renderers.FastJSONParser'
+else:
+    JSON_RENDERER, JSON_PARSER = 'rest_framework.renderers.JSONRenderer', 'rest_framework.parsers.JSONParser'
+
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        JSON_RENDERER,
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        JSON_PARSER,
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'throttling.throttles.AnonRateThrottle',
+        'throttling.throttles.UserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '50/minute',  # For unauthenticated users
         'user': '50/minute',  # For authenticated users
+        'tasks': '100/minute',  # Views with throttle_scope = 'tasks'
     }
 }
 
@@ -108,8 +131,22 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=10),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
+    # Rotated refresh tokens are blacklisted in the users.BlacklistedToken
+    # table (users.blacklist); `manage.py purge_token_blacklist` removes
+    # expired entries
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.BlacklistTokenRefreshSerializer',
 }
 
+# Users resolved by users.authentication.CachedJWTAuthentication are cached
+# for this many seconds; saving or deleting a user drops the entry. The
+# 'auth' cache must be shared (e.g. Redis) for the drop to reach every
+# worker; with the local-memory backend other workers keep the old row until
+# the timeout. QuerySet.update() and raw SQL do not drop entries at all
+JWT_USER_CACHE_ALIAS = 'auth'
+JWT_USER_CACHE_TIMEOUT = 60
+# Access tokens whose signature was verified, per process (0 disables)
+JWT_VERIFIED_TOKEN_CACHE_SIZE = 10000
+
 # Required for HTTPS redirects
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 SESSION_COOKIE_SECURE = True
@@ -126,6 +163,56 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The local-memory backend evicts least-recently-used entries once
+# MAX_ENTRIES is reached; point 'auth' and 'tasks' at a shared backend
+# (e.g. Redis or Memcached) in multi-process deployments.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth-users',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    'tasks': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'task-lists',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+            'CULL_FREQUENCY': 10,
+        },
+    },
+}
+
+# Serialized user task listings (tasks.cache.TaskListCache)
+TASK_LIST_CACHE_ALIAS = 'tasks'
+TASK_LIST_CACHE_ENABLED = True
+
+# Delta sync change log (tasks.models.TaskChange); older rows are removed by
+# `manage.py purge_task_changes` and older sync tokens get 410 Gone
+TASK_CHANGE_RETENTION_DAYS = 30
+
+# Server-Sent Events stream (tasks.streaming); swap the backend for a
+# broker-backed one to fan events out across processes
+TASK_EVENTS_BACKEND = 'tasks.events.LocalEventBackend'
+TASK_EVENTS_BUFFER_SIZE = 100  # Events buffered per connection before dropping
+TASK_EVENTS_HEARTBEAT_SECONDS = 15
+TASK_EVENTS_MAX_STREAM_SECONDS = 300  # Clients reconnect after this
+TASK_EVENTS_MAX_CONNECTIONS = 5  # Open streams per user and process
+TASK_EVENTS_REPLAY_LIMIT = 100  # Missed changes replayed on reconnect before sending resync
+
+# Serve task creation, assignment and listing with the async views in
+# tasks.async_views; only worthwhile under taskmanager.asgi.application
+TASK_ASYNC_VIEWS = os.getenv('TASK_ASYNC_VIEWS', 'False').lower() in ('true', '1')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -171,13 +258,45 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'users.User'
 
 # Logging
+# Share of successful API requests logged by tasks.logging.APILoggingMiddleware
+# (0.0 - 1.0); errors are always logged
+API_LOG_SAMPLE_RATE = float(os.getenv('API_LOG_SAMPLE_RATE', '1.0'))
+
+# Requests running more queries than this are logged as warnings
+# (tasks.instrumentation.QueryInstrumentationMiddleware)
+QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', '20'))
+# Send X-DB-Queries / X-DB-Time-Ms response headers; for development only
+QUERY_STATS_HEADERS = os.getenv('QUERY_STATS_HEADERS', 'False').lower() in ('true', '1')
+
+# Prometheus metrics (/metrics/). Scrapers authenticate with
+# "Authorization: Bearer <METRICS_TOKEN>" or come from METRICS_ALLOWED_IPS;
+# with neither set the endpoint is closed. Loopback is not trusted by
+# default, since behind a reverse proxy every request arrives from it.
+# With several worker processes, set METRICS_MULTIPROC_DIR to a directory
+# shared by them and emptied on restart
+METRICS_TOKEN = os.getenv('METRICS_TOKEN') or None
+METRICS_ALLOWED_IPS = [ip for ip in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if ip]
+METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR')
+METRICS_FLUSH_INTERVAL = 1.0  # Seconds between snapshots written by each process
+
+# Request profiling (metrics.profiling.ProfilingMiddleware): staff users can send
+# `X-Profile: 1`, and PROFILING_SAMPLE_RATE (0.0 - 1.0) profiles a random share
+# of all requests. Inspect the results with `manage.py profiles`
+PROFILING_HEADER = 'X-Profile'
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_DIR = os.getenv('PROFILING_DIR', str(BASE_DIR / 'profiles'))
+PROFILING_MAX_FILES = 500
+
 LOGGING = {
     'version': 1,
     'handlers': {
         'file': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
+            # Written by a background thread; records beyond `capacity` queued ones are dropped
+            'class': 'tasks.logging.QueueFileHandler',
             'filename': 'api.log',
+            'capacity': 10000,
+            'batch_size': 256,
         },
     },
     'loggers': {
@@ -25,4 +25,7 @@ urlpatterns = [
         path('', include('tasks.urls')),  
         path('auth/', include('users.urls')),
     ])),
+
+    # Internal metrics for Prometheus
+    path('metrics/', include('metrics.urls')),
 ]
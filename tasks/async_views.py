@@ -0,0 +1,203 @@
+import asyncio
+from typing import Iterable, Set
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from rest_framework import exceptions, status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from users.authentication import CachedJWTAuthentication
+from users.models import User
+from .cache import task_list_cache
+from .models import Task
+from .views import TaskAssignView, TaskCreateView, UserTasksView
+
+
+class AsyncAPIViewMixin:
+    """
+    Run a DRF view's request cycle natively on the event loop.
+
+    Mixed into the sync views so that serializers, permissions, throttles
+    and the custom error responses are shared. Handlers are coroutines:
+    reads use the async ORM and writes run their transaction in a single
+    sync_to_async call, instead of the whole request being moved to a
+    worker thread. Authentication uses ``aauthenticate()`` when the
+    authenticator provides it.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Async counterpart of APIView.dispatch()"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response  # options() and errors stay sync
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs) -> None:
+        """Same checks as APIView.initial(), with authentication awaited"""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        await sync_to_async(self.check_throttles)(request)  # Throttle counters live in the database
+
+    async def aperform_authentication(self, request) -> None:
+        """Authenticate eagerly, mirroring rest_framework.request.Request._authenticate"""
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, 'aauthenticate'):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # Serializers must not query synchronously; the view checks user IDs itself
+        context['defer_user_check'] = True
+        return context
+
+    async def acheck_users_exist(self, field: str, user_ids: Iterable[int]) -> None:
+        """
+        Raise the serializer's ValidationError if any user ID is unknown.
+
+        Raises:
+            ValidationError: {field: ["User IDs not found: [...]"]}
+        """
+        user_ids = set(user_ids)
+        existing: Set[int] = {
+            user_id async for user_id in User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        }
+        missing_ids = user_ids - existing
+        if missing_ids:
+            raise ValidationError({field: [f"User IDs not found: {sorted(missing_ids)}"]})
+
+
+class AsyncTaskCreateView(AsyncAPIViewMixin, TaskCreateView):
+    """
+    Async TaskCreateView for ASGI deployments (same request and responses).
+    """
+
+    async def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        await self.acheck_users_exist(
+            'assigned_users', serializer.validated_data.get('assigned_users', [])
+        )
+
+        await sync_to_async(self.perform_create)(serializer)
+
+        return Response(
+            {
+                'status': 'success',
+                'task_id': serializer.instance.id,
+                'data': serializer.data
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+
+class AsyncTaskAssignView(AsyncAPIViewMixin, TaskAssignView):
+    """
+    Async TaskAssignView for ASGI deployments (same request and responses).
+    """
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            try:
+                task = await self.get_queryset().aget(pk=self.kwargs['pk'])
+            except Task.DoesNotExist:
+                raise NotFound("Task not found")
+
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            user_ids = list(dict.fromkeys(serializer.validated_data['user_ids']))
+            await self.acheck_users_exist('user_ids', user_ids)
+
+            await sync_to_async(self.perform_assign)(task, user_ids)
+
+            return Response(
+                {
+                    'status': 'success',
+                    'assigned_users': user_ids,
+                    'task_id': task.id
+                },
+                status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=getattr(e, 'status_code', status.HTTP_400_BAD_REQUEST)
+            )
+
+    def perform_assign(self, task: Task, user_ids) -> None:
+        with transaction.atomic():
+            Task.add_assignments((task.id, user_id) for user_id in user_ids)
+
+
+class AsyncUserTasksView(AsyncAPIViewMixin, UserTasksView):
+    """
+    Async UserTasksView for ASGI deployments (same parameters, caching,
+    ETags and responses).
+    """
+
+    async def get(self, request, *args, **kwargs):
+        user_id = self.kwargs['user_id']
+        variant = self.get_cache_variant()
+        fingerprint = await self.get_etag_queryset().aaggregate(**self.get_etag_aggregates())
+        etag = self.make_etag(variant, fingerprint)
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        cache_key = task_list_cache.make_key(user_id, variant)
+        data = task_list_cache.get(cache_key)
+        cache_hit = data is not None
+        if not cache_hit:
+            data = await self.aget_list_data()
+            task_list_cache.set(cache_key, data)
+        return self.listing_response(data, etag, cache_hit)
+
+    async def aget_list_data(self) -> dict:
+        """Async counterpart of UserTasksView.get_list_data()"""
+        user_id = self.kwargs['user_id']
+        queryset = self.filter_queryset(self.get_user_tasks(user_id))
+        page = await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.list_envelope(await self.paginator.aget_paginated_data(serializer.data))
+        return self.list_envelope(self.unpaginated_data([task async for task in queryset]))
@@ -0,0 +1,125 @@
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class TaskListCache:
+    """
+    Cache of serialized user task listings.
+
+    Entries are keyed by user and query string, and namespaced by a per-user
+    version number. Invalidating a user bumps their version, which makes
+    every cached listing of that user unreachable at once; the stale entries
+    are then evicted by the backend's TTL/LRU policy.
+
+    The backend is the Django cache named by ``TASK_LIST_CACHE_ALIAS``, so
+    any cache backend can be plugged in. Hit/miss counters are kept per
+    process and reported by stats().
+    """
+
+    key_prefix = 'tasks:list'
+
+    def __init__(self, alias: Optional[str] = None) -> None:
+        self._alias = alias
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    @property
+    def alias(self) -> str:
+        return self._alias or getattr(settings, 'TASK_LIST_CACHE_ALIAS', 'default')
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'TASK_LIST_CACHE_ENABLED', True)
+
+    def _version_key(self, user_id: int) -> str:
+        return f'{self.key_prefix}:version:{user_id}'
+
+    def version(self, user_id: int) -> int:
+        """
+        Return the current listing version of a user.
+
+        A missing (never set or evicted) version is initialised from the
+        clock, so it cannot collide with a version served before eviction.
+        """
+        key = self._version_key(user_id)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, time.time_ns() // 1000, timeout=None)
+            version = self.cache.get(key)
+        return version
+
+    def make_key(self, user_id: int, query_string: str) -> str:
+        """
+        Build the entry key for one listing of a user.
+
+        Callers should build the key before reading from the database and
+        reuse it for set(), so a listing computed before an invalidation is
+        never stored under the new version.
+        """
+        digest = hashlib.md5(query_string.encode('utf-8')).hexdigest()
+        return f'{self.key_prefix}:{user_id}:{self.version(user_id)}:{digest}'
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached listing, or None on a miss"""
+        if not self.enabled:
+            return None
+        data = self.cache.get(key)
+        self._count('misses' if data is None else 'hits')
+        return data
+
+    def set(self, key: str, data: Any) -> None:
+        """Store a serialized listing"""
+        if self.enabled:
+            self.cache.set(key, data)
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """
+        Drop every cached listing of the given users.
+
+        The versions are bumped immediately and again once the surrounding
+        transaction commits, so a listing read from the pre-commit state
+        cannot outlive the write.
+        """
+        user_ids = set(user_ids)
+        if not user_ids:
+            return
+        self._bump(user_ids)
+        transaction.on_commit(lambda: self._bump(user_ids))
+
+    def _bump(self, user_ids: Iterable[int]) -> None:
+        for user_id in user_ids:
+            try:
+                self.cache.incr(self._version_key(user_id))
+            except ValueError:
+                # No version stored yet, so nothing is cached for this user
+                continue
+            self._count('invalidations')
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this process"""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters['hits'] + counters['misses']
+        counters['hit_rate'] = counters['hits'] / lookups if lookups else 0.0
+        return counters
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+task_list_cache = TaskListCache()
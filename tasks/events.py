@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """
+    A change to one user's task listing, pushed to that user's streams.
+
+    Attributes:
+        user_id: The user whose listing changed
+        task_id: The changed task
+        event: Event name, e.g. task.assigned or task.updated
+        change_id: TaskChange id (usable as a delta sync position), if known
+        data: Extra fields for the client, e.g. the new status
+    """
+    user_id: int
+    task_id: int
+    event: str
+    change_id: Optional[int] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class Subscription:
+    """
+    One open event stream.
+
+    Events are buffered in a bounded queue owned by the stream's event loop.
+    When a slow client lets the buffer fill up, the oldest event is dropped
+    and counted, and the stream tells the client to resynchronise.
+    """
+
+    def __init__(self, user_id: int, maxsize: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def deliver(self, event: TaskEvent) -> None:
+        """Enqueue an event; must run on the subscription's loop"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[TaskEvent]:
+        """Wait up to ``timeout`` seconds for the next event"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def take_dropped(self) -> int:
+        """Return and reset the number of events dropped since the last call"""
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class TooManySubscriptions(Exception):
+    """Raised by EventBus.subscribe() when a user has ``limit`` open streams"""
+
+
+class EventBus:
+    """
+    In-process fan-out of task events to open streams, keyed by user.
+
+    dispatch() may be called from any thread; events are handed to each
+    subscription's event loop with call_soon_threadsafe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+
+    def subscribe(self, user_id: int, maxsize: Optional[int] = None,
+                  loop: Optional[asyncio.AbstractEventLoop] = None,
+                  limit: Optional[int] = None) -> Subscription:
+        """
+        Open a subscription for ``user_id``.
+
+        The ``limit`` check and the registration happen under one lock, so
+        concurrent connections cannot both pass the check.
+
+        Raises:
+            TooManySubscriptions: If the user already has ``limit`` subscriptions
+        """
+        subscription = Subscription(
+            user_id,
+            maxsize or getattr(settings, 'TASK_EVENTS_BUFFER_SIZE', 100),
+            loop or asyncio.get_running_loop()
+        )
+        with self._lock:
+            subscribers = self._subscribers.setdefault(user_id, set())
+            if limit is not None and len(subscribers) >= limit:
+                if not subscribers:
+                    self._subscribers.pop(user_id, None)
+                raise TooManySubscriptions(user_id)
+            subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id, set())
+            subscribers.discard(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.user_id, None)
+
+    def subscriber_count(self, user_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(user_id, ()))
+
+    def dispatch(self, events: Iterable[TaskEvent]) -> None:
+        """Deliver events to the local subscriptions of their users"""
+        for event in events:
+            with self._lock:
+                subscribers = list(self._subscribers.get(event.user_id, ()))
+            for subscription in subscribers:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+                except RuntimeError:
+                    # The stream's loop has shut down; it will unsubscribe itself
+                    continue
+
+
+class BaseEventBackend:
+    """
+    Transport between the processes that write tasks and those holding streams.
+
+    publish() is called by writers. A cross-process backend forwards events
+    to a broker and, in every process, hands received events to
+    ``bus.dispatch()``.
+    """
+
+    def __init__(self, bus: EventBus) -> None:
+        self.bus = bus
+
+    def publish(self, events: List[TaskEvent]) -> None:
+        raise NotImplementedError('`publish()` must be implemented.')
+
+
+class LocalEventBackend(BaseEventBackend):
+    """Single-process backend: events go straight to the local bus"""
+
+    def publish(self, events: List[TaskEvent]) -> None:
+        self.bus.dispatch(events)
+
+
+task_events = EventBus()
+
+
+@lru_cache(maxsize=None)
+def get_event_backend() -> BaseEventBackend:
+    """Backend configured by TASK_EVENTS_BACKEND"""
+    path = getattr(settings, 'TASK_EVENTS_BACKEND', 'tasks.events.LocalEventBackend')
+    return import_string(path)(task_events)
+
+
+def publish(events: List[TaskEvent]) -> None:
+    """Publish events through the configured backend"""
+    if events:
+        get_event_backend().publish(events)
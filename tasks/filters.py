@@ -0,0 +1,99 @@
+from datetime import datetime, time
+from typing import List, Optional
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from .models import Task
+
+
+class TaskListFilter(BaseFilterBackend):
+    """
+    Filter and order task listings in SQL from query parameters.
+
+    Query Parameters:
+    - status: Comma-separated status codes (e.g. P,I)
+    - task_type: Comma-separated task type codes (e.g. W)
+    - created_after / created_before: ISO date or datetime bounds (inclusive)
+    - completed_after / completed_before: ISO date or datetime bounds (inclusive)
+    - ordering: created_at (default) or -created_at
+
+    Every filter combination is covered by an index on Task, and the
+    ordering always ends with id so keyset pagination stays stable.
+    """
+
+    CHOICE_FILTERS = {
+        'status': Task.Status,
+        'task_type': Task.TaskType,
+    }
+    RANGE_FILTERS = {
+        'created_after': 'created_at__gte',
+        'created_before': 'created_at__lte',
+        'completed_after': 'completed_at__gte',
+        'completed_before': 'completed_at__lte',
+    }
+    ORDERINGS = {
+        'created_at': ('created_at', 'id'),
+        '-created_at': ('-created_at', '-id'),
+    }
+    ordering_param = 'ordering'
+    default_ordering = 'created_at'
+
+    def filter_queryset(self, request, queryset: QuerySet, view) -> QuerySet:
+        params = request.query_params
+        errors = {}
+        filters = {}
+
+        for param, choices in self.CHOICE_FILTERS.items():
+            if param not in params:
+                continue
+            values = self._parse_choices(params[param])
+            invalid = sorted(set(values) - set(choices.values))
+            if invalid:
+                errors[param] = f"Invalid values {invalid}. Valid options: {', '.join(choices.values)}"
+            else:
+                filters[f'{param}__in'] = values
+
+        for param, lookup in self.RANGE_FILTERS.items():
+            if param not in params:
+                continue
+            bound = self._parse_bound(params[param], end_of_day=param.endswith('_before'))
+            if bound is None:
+                errors[param] = "Expected an ISO 8601 date or datetime."
+            else:
+                filters[lookup] = bound
+
+        ordering = params.get(self.ordering_param, self.default_ordering)
+        if ordering not in self.ORDERINGS:
+            errors[self.ordering_param] = f"Valid options: {', '.join(self.ORDERINGS)}"
+
+        if errors:
+            raise ValidationError(errors)
+
+        return queryset.filter(**filters).order_by(*self.ORDERINGS[ordering])
+
+    def _parse_choices(self, raw: str) -> List[str]:
+        """Split a comma-separated choice list"""
+        return [value.strip() for value in raw.split(',') if value.strip()]
+
+    def _parse_bound(self, raw: str, end_of_day: bool) -> Optional[datetime]:
+        """
+        Parse a date or datetime bound into an aware datetime.
+
+        Plain dates cover the whole day: the start of the day for lower
+        bounds and the end of the day for upper bounds.
+        """
+        try:
+            value = parse_datetime(raw)
+            if value is None:
+                day = parse_date(raw)
+                if day is None:
+                    return None
+                value = datetime.combine(day, time.max if end_of_day else time.min)
+        except ValueError:
+            return None
+
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        return value
@@ -0,0 +1,117 @@
+import logging
+import time
+from contextlib import ExitStack
+from typing import Optional
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('api')
+
+
+class QueryStats:
+    """
+    Database execute wrapper counting the queries of one request.
+
+    Installed with connection.execute_wrapper(), so every statement run
+    through the ORM or a raw cursor is timed, whether or not DEBUG is on.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_sql: Optional[str] = None
+        self.slowest_duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.duration += elapsed
+            if elapsed >= self.slowest_duration:
+                self.slowest_duration = elapsed
+                self.slowest_sql = sql
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record the query count, total database time and slowest statement of
+    each request in ``request.query_stats``.
+
+    APILoggingMiddleware adds the count and time to the API log record, so
+    this middleware must come after it in MIDDLEWARE. Requests running more
+    than QUERY_BUDGET queries are logged as a warning with their slowest
+    statement. With QUERY_STATS_HEADERS enabled the figures are also sent as
+    X-DB-Queries, X-DB-Time-Ms and, when over budget, X-DB-Query-Budget
+    response headers; keep it off in production.
+
+    Queries run while a streaming response is consumed are not counted.
+
+    Supports both sync and async middleware chains, so async views are not
+    switched to a thread by this middleware. Connections are per thread and
+    the async ORM runs its queries through sync_to_async, so in an async
+    chain the wrappers are installed and removed in that thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        stats = QueryStats()
+        request.query_stats = stats
+        with self.instrument(stats):
+            response = self.get_response(request)
+        return self.process_stats(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        request.query_stats = stats
+        stack = await sync_to_async(self.instrument)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.process_stats(request, response, stats)
+
+    @staticmethod
+    def instrument(stats: QueryStats) -> ExitStack:
+        """Install ``stats`` as an execute wrapper on every connection"""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        return stack
+
+    def process_stats(self, request, response, stats: QueryStats):
+        """Log requests over QUERY_BUDGET and add the optional headers"""
+        budget = getattr(settings, 'QUERY_BUDGET', None)
+        over_budget = budget is not None and stats.count > budget
+        if over_budget:
+            match = getattr(request, 'resolver_match', None)
+            logger.warning(
+                f"Query budget exceeded: route={match.view_name if match else request.path} "
+                f"queries={stats.count} budget={budget} db_ms={stats.duration_ms:.1f} "
+                f"slowest_ms={stats.slowest_duration * 1000:.1f} slowest={stats.slowest_sql[:500]!r}",
+                extra={'path': request.path}
+            )
+
+        if getattr(settings, 'QUERY_STATS_HEADERS', False):
+            response['X-DB-Queries'] = str(stats.count)
+            response['X-DB-Time-Ms'] = f'{stats.duration_ms:.1f}'
+            if over_budget:
+                response['X-DB-Query-Budget'] = f'exceeded ({budget})'
+        return response
@@ -1,29 +1,207 @@
 # api_logging.py
 import logging
+import os
+import queue
+import random
+import threading
 import time
+from typing import Dict, List, Optional
+from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger('api')
 
+
+class QueueFileHandler(logging.Handler):
+    """
+    File handler that writes from a background thread.
+
+    emit() only puts the record on a bounded queue, so request threads never
+    wait for the disk. A writer thread takes every record waiting in the
+    queue (up to ``batch_size``), writes them and flushes the file once per
+    batch. When the queue is full the record is dropped and counted instead
+    of blocking the request; the writer logs the number of dropped records
+    to the file once the queue has room again.
+
+    The writer thread is started on first use (and again in a forked child
+    process). flush() and close() wait for queued records to be written.
+    """
+
+    _sentinel = None
+
+    def __init__(self, filename: str, capacity: int = 10000, batch_size: int = 256,
+                 mode: str = 'a', encoding: Optional[str] = None) -> None:
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.mode = mode
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self._queue: 'queue.Queue[Optional[logging.LogRecord]]' = queue.Queue(maxsize=capacity)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self._dropped = 0
+        self._dropped_reported = 0
+        self._written = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._ensure_writer()
+            self._queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            self._dropped += 1  # Approximate under contention; only used for reporting
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve what cannot wait for the writer thread: the message arguments
+        and the traceback, which may change or be released after emit().
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def _ensure_writer(self) -> None:
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        with self._start_lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='api-log-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        with open(self.filename, self.mode, encoding=self.encoding) as stream:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                records = [record for record in batch if record is not self._sentinel]
+                try:
+                    self.write_batch(stream, records)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(records) < len(batch):
+                    return
+
+    def write_batch(self, stream, records: List[logging.LogRecord]) -> None:
+        """Write ``records`` and any pending drop notice, then flush once"""
+        lines = []
+        dropped = self._dropped
+        if dropped > self._dropped_reported:
+            lines.append(f"Dropped {dropped - self._dropped_reported} log records (queue full)")
+            self._dropped_reported = dropped
+
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        if lines:
+            stream.write('\n'.join(lines) + '\n')
+            stream.flush()
+        self._written += len(records)
+
+    def stats(self) -> Dict[str, int]:
+        """Records written, dropped and waiting in this process"""
+        return {'written': self._written, 'dropped': self._dropped, 'queued': self._queue.qsize()}
+
+    def flush(self) -> None:
+        """Wait until every queued record has been written"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            self._queue.put(self._sentinel)
+            thread.join()
+        self._thread = None
+        super().close()
+
+
 class APILoggingMiddleware(MiddlewareMixin):
+    """
+    Log one compact record per API request.
+
+    Successful requests (status < 400) are logged at INFO as a single
+    key=value line: method, route name, status, duration, user ID and
+    response size, plus the query count and database time when
+    QueryInstrumentationMiddleware is installed. Only API_LOG_SAMPLE_RATE of them are kept (1.0 logs all,
+    0 none). Client and server errors are always logged, as WARNING and ERROR,
+    with the path, query string and response body. Unhandled exceptions also
+    get their traceback. Payloads of successful responses are never logged.
+
+    The same fields are attached to the record as ``record.api`` for
+    structured handlers.
+    """
+
     def process_request(self, request):
-        request.start_time = time.time()
-        logger.info(
-            f"Request: {request.method} {request.path}",
-            extra={'user': request.user.username, 'data': request.GET or request.POST}
-        )
+        request.start_time = time.perf_counter()
 
     def process_response(self, request, response):
-        duration = time.time() - request.start_time
-        logger.info(
-            f"Response: {response.status_code} ({duration:.2f}s)",
-            extra={'data': getattr(response, 'data', None)}
-        )
+        start = getattr(request, 'start_time', None)
+        duration_ms = (time.perf_counter() - start) * 1000 if start is not None else None
+        status_code = response.status_code
+
+        if status_code < 400:
+            sample_rate = getattr(settings, 'API_LOG_SAMPLE_RATE', 1.0)
+            if sample_rate < 1 and random.random() >= sample_rate:
+                return response
+            if not logger.isEnabledFor(logging.INFO):
+                return response
+
+        fields = self.get_fields(request, response, duration_ms)
+        message = ' '.join(f'{name}={value}' for name, value in fields.items())
+        if status_code < 400:
+            logger.info(message, extra={'api': fields})
+        else:
+            detail = {
+                'path': request.path,
+                'query': request.META.get('QUERY_STRING', ''),
+                'data': getattr(response, 'data', None),
+            }
+            logger.log(
+                logging.ERROR if status_code >= 500 else logging.WARNING,
+                f"{message} path={detail['path']} query={detail['query']!r} data={detail['data']!r}",
+                extra={'api': {**fields, **detail}}
+            )
         return response
 
     def process_exception(self, request, exception):
         logger.error(
-            f"Error: {str(exception)}", 
+            f"Error: {str(exception)}",
             exc_info=True,
             extra={'path': request.path}
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def get_fields(request, response, duration_ms: Optional[float]) -> Dict[str, object]:
+        """Fields of the compact record"""
+        match = getattr(request, 'resolver_match', None)
+        user = getattr(request, 'user', None)
+        size = None if response.streaming else len(response.content)
+        fields = {
+            'method': request.method,
+            'route': (match.view_name if match and match.view_name else '-'),
+            'status': response.status_code,
+            'duration_ms': f'{duration_ms:.1f}' if duration_ms is not None else '-',
+            'user': user.pk if user is not None and user.is_authenticated else '-',
+            'bytes': size if size is not None else '-',
+        }
+        query_stats = getattr(request, 'query_stats', None)  # tasks.instrumentation
+        if query_stats is not None:
+            fields['queries'] = query_stats.count
+            fields['db_ms'] = f'{query_stats.duration_ms:.1f}'
+        return fields
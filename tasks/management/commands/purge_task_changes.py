@@ -0,0 +1,40 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from tasks.models import TaskChange, TaskChangePurge
+
+
+class Command(BaseCommand):
+    """
+    Delete delta sync change rows older than the retention period.
+
+    Rows are deleted up to the newest expired id and that id is recorded
+    as a TaskChangePurge watermark. Clients whose sync position is below
+    the watermark get 410 Gone and fall back to a full sync, so purged rows
+    are never needed again.
+    """
+
+    help = "Delete TaskChange rows older than TASK_CHANGE_RETENTION_DAYS"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=getattr(settings, 'TASK_CHANGE_RETENTION_DAYS', 30),
+            help="Retention in days (defaults to TASK_CHANGE_RETENTION_DAYS)"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted = 0
+        with transaction.atomic():
+            position = TaskChange.objects.filter(
+                created_at__lt=cutoff
+            ).aggregate(position=Max('id'))['position']
+            if position is not None:
+                TaskChangePurge.objects.create(position=position)
+                deleted, _ = TaskChange.objects.filter(id__lte=position).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} task changes older than {cutoff:%Y-%m-%d %H:%M}"))
@@ -0,0 +1,170 @@
+import bisect
+import itertools
+import random
+import time
+from array import array
+from typing import Iterator, List, Tuple
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from tasks.cache import task_list_cache
+from tasks.models import Task, TaskAssignment
+from users.models import User
+
+
+class Command(BaseCommand):
+    """
+    Generate a large, production-like task dataset.
+
+    Tasks are created in chunks with bulk_create, and their assignments are
+    written straight into the through table with multi-row INSERT
+    statements, one transaction per chunk; only one chunk and the user
+    popularity table are held in memory.
+
+    Both sides of the assignment relation are power-law distributed:
+
+    - users per task follow a Pareto distribution with shape
+      --task-alpha, scaled so the mean matches --assignments / --tasks
+      (capped at --max-users-per-task)
+    - each assignment picks its user with Zipf weights rank^-user_alpha
+      over a seeded random ranking of the users, so a few users hold many
+      tasks and most hold a few
+
+    The same --seed gives the same tasks and assignments. No delta sync
+    history or task events are recorded for seeded rows.
+    """
+
+    help = "Bulk-generate tasks and power-law distributed assignments (e.g. 10M) for local load testing"
+
+    ROWS_PER_INSERT = 500  # (task, user) pairs per INSERT statement
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1_000_000)
+        parser.add_argument(
+            '--assignments', type=int, default=None,
+            help="Target number of assignments (default: 3 per task); the exact count is reported"
+        )
+        parser.add_argument('--users', type=int, default=10_000, help="Users to spread tasks over (created as needed)")
+        parser.add_argument('--task-alpha', type=float, default=2.5, help="Pareto shape of users per task (> 1)")
+        parser.add_argument('--user-alpha', type=float, default=1.1, help="Zipf exponent of tasks per user")
+        parser.add_argument('--max-users-per-task', type=int, default=500)
+        parser.add_argument('--chunk-size', type=int, default=10_000, help="Tasks per chunk / transaction")
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options['task_alpha'] <= 1:
+            raise CommandError("--task-alpha must be greater than 1")
+        if options['tasks'] < 1 or options['users'] < 1:
+            raise CommandError("--tasks and --users must be positive")
+
+        rng = random.Random(options['seed'])
+        started = time.perf_counter()
+        self.tune_connection()
+
+        user_ids = self.ensure_users(options['users'])
+        rng.shuffle(user_ids)  # Popularity rank, independent of ID order
+        cum_weights = array('d', itertools.accumulate(
+            (rank ** -options['user_alpha'] for rank in range(1, len(user_ids) + 1))
+        ))
+
+        mean = (options['assignments'] if options['assignments'] is not None else 3 * options['tasks']) / options['tasks']
+        alpha = options['task_alpha']
+        scale = mean * (alpha - 1) / alpha  # Pareto minimum giving this mean
+        max_per_task = min(options['max_users_per_task'], len(user_ids))
+
+        sample = self.names(rng)
+        created = assigned = 0
+        touched = set()
+        while created < options['tasks']:
+            size = min(options['chunk_size'], options['tasks'] - created)
+            with transaction.atomic():
+                tasks = Task.objects.bulk_create(
+                    [
+                        Task(
+                            name=f"{rng.choice(sample)} #{created + index + 1}",
+                            description=rng.choice(sample),
+                            task_type=rng.choice(Task.TaskType.values),
+                            status=rng.choice(Task.Status.values),
+                        )
+                        for index in range(size)
+                    ],
+                    batch_size=size
+                )
+                pairs = list(self.assignments(
+                    rng, [task.id for task in tasks], user_ids, cum_weights, scale, alpha, max_per_task
+                ))
+                self.insert_assignments(pairs)
+            touched.update(user_id for _, user_id in pairs)
+            created += size
+            assigned += len(pairs)
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{created}/{options['tasks']} tasks, {assigned} assignments "
+                f"({elapsed:.0f}s, {assigned / elapsed:.0f} assignments/s)"
+            )
+
+        task_list_cache.invalidate(touched)
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {created} tasks and {assigned} assignments over {len(touched)} users "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def tune_connection(self) -> None:
+        """Trade durability for speed on SQLite; a crash only loses seed data"""
+        if connection.vendor == 'sqlite' and not connection.in_atomic_block:
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA synchronous = OFF')
+                cursor.execute('PRAGMA cache_size = -200000')  # 200 MB page cache
+
+    def ensure_users(self, count: int) -> List[int]:
+        """IDs of ``count`` seed users, creating the missing ones"""
+        existing = list(
+            User.objects.filter(username__startswith='seed-user-').order_by('id').values_list('id', flat=True)[:count]
+        )
+        missing = count - len(existing)
+        if missing > 0:
+            start = User.objects.filter(username__startswith='seed-user-').count()
+            for offset in range(0, missing, 10_000):
+                users = User.objects.bulk_create([
+                    User(username=f'seed-user-{start + index}', password='!')  # Unusable password
+                    for index in range(offset, min(offset + 10_000, missing))
+                ])
+                existing.extend(user.id for user in users)
+        return existing
+
+    @staticmethod
+    def names(rng: random.Random) -> List[str]:
+        """Pool of Faker sentences (generating one per row would dominate the run time)"""
+        from faker import Faker
+
+        faker = Faker()
+        faker.seed_instance(rng.randrange(2 ** 32))
+        return [faker.sentence(nb_words=5).rstrip('.') for _ in range(1000)]
+
+    @staticmethod
+    def assignments(rng: random.Random, task_ids: List[int], user_ids: List[int], cum_weights: array,
+                    scale: float, alpha: float, max_per_task: int) -> Iterator[Tuple[int, int]]:
+        total = cum_weights[-1]
+        last = len(user_ids) - 1
+        for task_id in task_ids:
+            count = min(max(1, round(scale * (1 - rng.random()) ** (-1 / alpha))), max_per_task)
+            chosen = set()
+            for _ in range(count * 4):  # Popular users repeat; give up after a few rounds
+                chosen.add(user_ids[min(bisect.bisect(cum_weights, rng.random() * total), last)])
+                if len(chosen) == count:
+                    break
+            for user_id in chosen:
+                yield task_id, user_id
+
+    def insert_assignments(self, pairs: List[Tuple[int, int]]) -> None:
+        """Multi-row INSERTs into the through table, bypassing model instances"""
+        quote = connection.ops.quote_name
+        table = quote(TaskAssignment._meta.db_table)
+        columns = f"{quote('task_id')}, {quote('user_id')}"
+        with connection.cursor() as cursor:
+            for start in range(0, len(pairs), self.ROWS_PER_INSERT):
+                rows = pairs[start:start + self.ROWS_PER_INSERT]
+                cursor.execute(
+                    f"INSERT INTO {table} ({columns}) VALUES {', '.join(['(%s, %s)'] * len(rows))}",
+                    [value for row in rows for value in row]
+                )
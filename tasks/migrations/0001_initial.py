@@ -0,0 +1,65 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('task_type', models.CharField(choices=[('P', 'Personal'), ('C', 'College'), ('W', 'Work'), ('O', 'Other')], default='O', max_length=1)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('I', 'In Progress'), ('C', 'Completed')], default='P', max_length=1)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='TaskAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tasks.task')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'tasks_task_assigned_users',
+            },
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='assigned_users',
+            field=models.ManyToManyField(related_name='tasks', through='tasks.TaskAssignment', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='taskassignment',
+            index=models.Index(fields=['user', 'task'], name='task_assignment_user_task_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='taskassignment',
+            constraint=models.UniqueConstraint(fields=('task', 'user'), name='task_assignment_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'created_at'], name='task_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['task_type', 'status', 'created_at'], name='task_type_status_created_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['completed_at'], name='task_completed_at_idx'),
+        ),
+    ]
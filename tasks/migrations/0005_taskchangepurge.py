@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-17 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_taskchange'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskChangePurge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.BigIntegerField()),
+                ('purged_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
 from users.models import User
+from .cache import task_list_cache
+from .events import TaskEvent, publish as publish_events
 
 
 class Task(models.Model):
@@ -11,6 +16,7 @@ class Task(models.Model):
         name (str): The name/title of the task
         description (str): Detailed description of the task
         created_at (datetime): Auto-set timestamp when task is created
+        updated_at (datetime): Auto-set timestamp of the last modification
         task_type (str): Category of task (Personal, College, Work, Other)
         completed_at (datetime): Timestamp when task was completed
         status (str): Current status of the task (Pending, In Progress, Completed)
@@ -34,11 +40,259 @@ class Task(models.Model):
     name = models.CharField(max_length=100) # Name of task
     description = models.TextField(blank=True, null=True) # Description of task
     created_at = models.DateTimeField(auto_now_add=True) # Auto-set timestamp when task is created
+    updated_at = models.DateTimeField(auto_now=True) # Auto-set timestamp of the last modification (used for ETags)
     task_type = models.CharField(max_length=1, choices=TaskType.choices, default=TaskType.OTHER) # Category of the task (default: OTHER)
     completed_at = models.DateTimeField(blank=True, null=True) # Timestamp when task was marked completed
     status = models.CharField(max_length=1, choices=Status.choices, default=Status.PENDING) # Current progress status of the task (default: PENDING)
-    assigned_users = models.ManyToManyField(User, related_name='tasks') # Users assigned to this task
+    assigned_users = models.ManyToManyField(User, related_name='tasks', through='TaskAssignment') # Users assigned to this task
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of a user's tasks orders by (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='task_created_id_idx'),
+            # "My pending tasks" / "my work tasks" listings, newest first
+            models.Index(fields=['status', 'created_at'], name='task_status_created_idx'),
+            models.Index(fields=['task_type', 'status', 'created_at'], name='task_type_status_created_idx'),
+            # completed_after / completed_before range filters
+            models.Index(fields=['completed_at'], name='task_completed_at_idx'),
+        ]
     
     def __str__(self) -> str:
         """String representation of the task"""
-        return self.name
\ No newline at end of file
+        return self.name
+
+    @classmethod
+    def existing_assignments(cls, pairs: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """
+        Return which of the (task_id, user_id) pairs are already assigned.
+
+        Uses a single SELECT on the through table, grouped by task.
+        """
+        users_by_task: Dict[int, Set[int]] = {}
+        for task_id, user_id in pairs:
+            users_by_task.setdefault(task_id, set()).add(user_id)
+        if not users_by_task:
+            return set()
+
+        condition = Q()
+        for task_id, user_ids in users_by_task.items():
+            condition |= Q(task_id=task_id, user_id__in=user_ids)
+        return set(
+            cls.assigned_users.through.objects.filter(condition).values_list('task_id', 'user_id')
+        )
+
+    @classmethod
+    def assignee_pairs(cls, task_ids: Iterable[int]) -> Set[Tuple[int, int]]:
+        """(task_id, user_id) of every current assignment of the given tasks"""
+        return set(
+            cls.assigned_users.through.objects.filter(
+                task_id__in=set(task_ids)
+            ).values_list('task_id', 'user_id')
+        )
+
+    @classmethod
+    def touch(cls, task_ids: Iterable[int]) -> None:
+        """
+        Move updated_at of the given tasks to now.
+
+        Used when the rendered tasks change without a save(), e.g. a new
+        co-assignee, so the ETags of every assignee's listing change too.
+        """
+        cls.objects.filter(id__in=set(task_ids)).update(updated_at=timezone.now())
+
+    @classmethod
+    def add_assignments(cls, pairs: Iterable[Tuple[int, int]], batch_size: int = 500,
+                        event: str = 'task.assigned', check_existing: bool = True) -> int:
+        """
+        Insert (task_id, user_id) assignments in bulk.
+
+        Pairs that are already assigned are filtered out with one SELECT, so
+        no change, event or cache invalidation is recorded for them. Pass
+        check_existing=False for freshly created tasks, which cannot have
+        assignments yet. The insert still ignores conflicts, so a concurrent
+        assignment of the same pair is not an error.
+
+        Listings render every assignee of a task, so the users already on
+        the tasks get an upsert change and their cached listings invalidated
+        as well, and the tasks are touched to change their ETags.
+
+        Returns:
+            Number of assignments added
+        """
+        Assignment = cls.assigned_users.through
+        pairs = set(pairs)
+        if check_existing and pairs:
+            pairs -= cls.existing_assignments(pairs)
+        if not pairs:
+            return 0
+
+        Assignment.objects.bulk_create(
+            [Assignment(task_id=task_id, user_id=user_id) for task_id, user_id in pairs],
+            batch_size=batch_size,
+            ignore_conflicts=True
+        )
+        TaskChange.record(pairs, TaskChange.Kind.UPSERT, event=event)
+        co_assignees = set()
+        if check_existing:
+            task_ids = {task_id for task_id, _ in pairs}
+            cls.touch(task_ids)
+            co_assignees = cls.assignee_pairs(task_ids) - pairs
+            TaskChange.record(co_assignees, TaskChange.Kind.UPSERT)
+        task_list_cache.invalidate(user_id for _, user_id in pairs | co_assignees)
+        return len(pairs)
+
+    @classmethod
+    def remove_assignments(cls, pairs: Iterable[Tuple[int, int]]) -> int:
+        """
+        Delete (task_id, user_id) assignments with a single DELETE.
+
+        Only pairs that were actually assigned are recorded as removals. The
+        users still assigned to the tasks get an upsert change, the cached
+        listings of both are invalidated, and the tasks are touched.
+
+        Returns:
+            Number of assignments removed
+        """
+        existing = cls.existing_assignments(pairs)
+        if not existing:
+            return 0
+
+        condition = Q()
+        for task_id, user_id in existing:
+            condition |= Q(task_id=task_id, user_id=user_id)
+        deleted, _ = cls.assigned_users.through.objects.filter(condition).delete()
+        TaskChange.record(existing, TaskChange.Kind.REMOVED)
+        task_ids = {task_id for task_id, _ in existing}
+        cls.touch(task_ids)
+        co_assignees = cls.assignee_pairs(task_ids)
+        TaskChange.record(co_assignees, TaskChange.Kind.UPSERT)
+        task_list_cache.invalidate(user_id for _, user_id in existing | co_assignees)
+        return deleted
+
+
+class TaskAssignment(models.Model):
+    """
+    Through table for Task.assigned_users.
+
+    Declared explicitly (keeping Django's default table name) so that the
+    user -> tasks direction gets a covering (user, task) index in addition
+    to the (task, user) unique constraint.
+
+    Attributes:
+        task (Task): The assigned task
+        user (User): The user the task is assigned to
+    """
+
+    # Single-column FK indexes are covered by the composite indexes below
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_index=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        db_table = 'tasks_task_assigned_users'
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'user'], name='task_assignment_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'task'], name='task_assignment_user_task_idx'),
+        ]
+
+    def __str__(self) -> str:
+        """String representation of the assignment"""
+        return f"{self.task_id} -> {self.user_id}"
+
+
+class TaskChange(models.Model):
+    """
+    Per-user change log of task listings, used for delta sync.
+
+    One row is written for every user whose listing a write affects. The
+    auto-incrementing id doubles as the sync position: a client that has
+    seen changes up to id N only needs rows with id > N. Rows for removed
+    tasks are tombstones, so task_id is a plain integer rather than a
+    foreign key and outlives the task.
+
+    Attributes:
+        user (User): The user whose task listing changed
+        task_id (int): The changed task
+        kind (str): Upsert (created/updated/assigned) or Removed (unassigned/deleted)
+        created_at (datetime): When the change was recorded (used for retention)
+    """
+
+    class Kind(models.TextChoices):
+        """Enumeration of change kinds"""
+        UPSERT = 'U', 'Upsert'
+        REMOVED = 'R', 'Removed'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', db_index=False)
+    task_id = models.BigIntegerField()
+    kind = models.CharField(max_length=1, choices=Kind.choices)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Delta sync reads one user's changes after a given id
+            models.Index(fields=['user', 'id'], name='task_change_user_id_idx'),
+        ]
+
+    def __str__(self) -> str:
+        """String representation of the change"""
+        return f"{self.get_kind_display()} task {self.task_id} for user {self.user_id}"
+
+    @classmethod
+    def default_event(cls, kind: str) -> str:
+        """Event name published for a change of ``kind`` when none is given"""
+        return 'task.unassigned' if kind == cls.Kind.REMOVED else 'task.updated'
+
+    @classmethod
+    def record(cls, pairs: Iterable[Tuple[int, int]], kind: str, event: Optional[str] = None,
+               data: Optional[Dict[str, Any]] = None, batch_size: int = 500) -> None:
+        """
+        Log a change of kind ``kind`` for each (task_id, user_id) pair.
+
+        Once the transaction commits, a TaskEvent named ``event`` (default
+        task.updated / task.unassigned) is published to the users' streams.
+        """
+        changes = cls.objects.bulk_create(
+            [cls(task_id=task_id, user_id=user_id, kind=kind) for task_id, user_id in set(pairs)],
+            batch_size=batch_size
+        )
+        if not changes:
+            return
+
+        event = event or cls.default_event(kind)
+        events = [
+            TaskEvent(
+                user_id=change.user_id,
+                task_id=change.task_id,
+                event=event,
+                change_id=change.pk,
+                data=data or {}
+            )
+            for change in changes
+        ]
+        transaction.on_commit(lambda: publish_events(events))
+
+
+class TaskChangePurge(models.Model):
+    """
+    One run of purge_task_changes, recording how far the change log was cut.
+
+    Every TaskChange with id <= position has been deleted, so a sync
+    position below the highest recorded position may have missed changes.
+
+    Attributes:
+        position (int): Highest TaskChange id deleted by the run
+        purged_at (datetime): When the run happened
+    """
+
+    position = models.BigIntegerField()
+    purged_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        """String representation of the purge"""
+        return f"Changes up to {self.position} purged at {self.purged_at:%Y-%m-%d %H:%M}"
+
+    @classmethod
+    def watermark(cls) -> int:
+        """Highest purged change id (0 if nothing was ever purged)"""
+        return cls.objects.aggregate(position=models.Max('position'))['position'] or 0
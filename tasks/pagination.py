@@ -0,0 +1,171 @@
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset (cursor) pagination for task listings.
+
+    Pages are ordered by (created_at, id), ascending or descending, and each
+    page is fetched with a ``WHERE (created_at, id) > (cursor)`` predicate
+    instead of an OFFSET, so the cost of a page does not grow with how deep
+    the client has scrolled.
+
+    Query Parameters:
+    - cursor: Opaque cursor returned as ``next`` by the previous page
+    - page_size: Number of tasks per page (max 500)
+    - count: 'true' for the exact total, 'estimate' for a count capped at 10000
+
+    Pagination is opt-in: without ``cursor`` or ``page_size`` the view keeps
+    returning the full, unpaginated list.
+    """
+
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    count_query_param = 'count'
+    count_estimate_cap = 10000
+    ordering: Tuple[str, str] = ('created_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request) -> bool:
+        """Whether the client asked for a paginated response"""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> Optional[List[Any]]:
+        page_queryset = self.get_page_queryset(queryset, request)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request, view=None) -> Optional[List[Any]]:
+        """Async counterpart of paginate_queryset() for async views"""
+        page_queryset = self.get_page_queryset(queryset, request)
+        if page_queryset is None:
+            return None
+        return self.set_page([task async for task in page_queryset])
+
+    def get_page_queryset(self, queryset: QuerySet, request) -> Optional[QuerySet]:
+        """
+        Build (without evaluating) the query for the requested page.
+
+        Returns None when the client did not ask for pagination.
+        """
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.base_queryset = queryset
+        self.current_page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        # Keep a descending (created_at, id) order applied by the filter backend
+        descending = tuple(queryset.query.order_by) == ('-created_at', '-id')
+        ordering = [f'-{field}' if descending else field for field in self.ordering]
+        ordered = queryset.order_by(*ordering)
+        if position is not None:
+            created_at, pk = position
+            if descending:
+                ordered = ordered.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                )
+            else:
+                ordered = ordered.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                )
+
+        # Fetch one extra row to find out whether another page exists
+        return ordered[:self.current_page_size + 1]
+
+    def set_page(self, results: List[Any]) -> List[Any]:
+        """Split the fetched rows into the page and the has-next flag"""
+        self.has_next = len(results) > self.current_page_size
+        self.page = results[:self.current_page_size]
+        return self.page
+
+    def get_page_size(self, request) -> int:
+        """Read and clamp the requested page size"""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(last))
+
+    def get_count_queryset(self) -> Optional[QuerySet]:
+        """
+        Return the query counting the total requested via ``?count=``.
+
+        'true' runs an exact COUNT(*). 'estimate' counts at most
+        ``count_estimate_cap`` rows, so its cost stays bounded for heavy users.
+        No count is computed by default so that paging stays constant-cost.
+        """
+        mode = self.request.query_params.get(self.count_query_param, '').lower()
+        if mode in ('true', '1', 'exact'):
+            return self.base_queryset
+        if mode == 'estimate':
+            return self.base_queryset.order_by()[:self.count_estimate_cap]
+        return None
+
+    def get_count(self) -> Optional[int]:
+        queryset = self.get_count_queryset()
+        return None if queryset is None else queryset.count()
+
+    async def aget_count(self) -> Optional[int]:
+        queryset = self.get_count_queryset()
+        return None if queryset is None else await queryset.acount()
+
+    def get_paginated_data(self, data: List[Any]) -> Dict[str, Any]:
+        """Pagination fields merged into the view's response envelope"""
+        return self._paginated_data(data, self.get_count())
+
+    async def aget_paginated_data(self, data: List[Any]) -> Dict[str, Any]:
+        return self._paginated_data(data, await self.aget_count())
+
+    def _paginated_data(self, data: List[Any], count: Optional[int]) -> Dict[str, Any]:
+        paginated = {'tasks': data, 'next': self.get_next_link()}
+        if count is not None:
+            paginated['count'] = count
+        return paginated
+
+    def encode_cursor(self, task) -> str:
+        """Encode the (created_at, id) position of a task as an opaque token"""
+        raw = f"{task.created_at.isoformat()}|{task.id}"
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request) -> Optional[Tuple[Any, int]]:
+        """
+        Decode the cursor query parameter.
+
+        Raises:
+            NotFound: If the cursor is malformed
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('ascii')
+            created_at, pk = raw.rsplit('|', 1)
+            parsed = parse_datetime(created_at)
+            if parsed is None:
+                raise ValueError(created_at)
+            return parsed, int(pk)
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
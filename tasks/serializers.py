@@ -2,13 +2,20 @@ from rest_framework import serializers
 from .models import Task
 from users.models import User
 from users.serializers import UserSerializer
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from django.db import transaction
 
 
 class TaskSerializer(serializers.ModelSerializer):
     """
     Serializer for displaying Task details with assigned users.
+
+    Listings should prefetch ``assigned_users`` (limited to
+    ASSIGNED_USER_FIELDS) to avoid one query per task.
     """
+    # User columns needed to render the nested UserSerializer
+    ASSIGNED_USER_FIELDS = ('id', 'username', 'first_name', 'last_name', 'email', 'mobile')
+
     assigned_users = UserSerializer(many=True, read_only=True)
     
     class Meta:
@@ -16,6 +23,84 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'created_at', 'task_type', 
                  'completed_at', 'status', 'assigned_users']
 
+class BulkTaskCreateListSerializer(serializers.ListSerializer):
+    """
+    List serializer used by TaskCreateSerializer(many=True).
+
+    Unlike the stock ListSerializer, invalid items do not fail the whole
+    batch: they are collected in ``item_errors`` (index -> errors) and only
+    the valid items are created, unless ``context['atomic']`` is set.
+    Assigned user IDs of the whole batch are checked with a single query.
+    """
+
+    batch_size = 500  # Rows per INSERT statement
+
+    def to_internal_value(self, data: Any) -> List[Dict[str, Any]]:
+        """Validate each item, keeping per-item errors instead of raising"""
+        if not isinstance(data, list):
+            raise serializers.ValidationError({
+                'non_field_errors': ["Expected a list of tasks."]
+            })
+        if self.max_length is not None and len(data) > self.max_length:
+            raise serializers.ValidationError({
+                'non_field_errors': [f"Ensure this batch has no more than {self.max_length} tasks."]
+            })
+
+        self.item_errors: Dict[int, Any] = {}
+        self.valid_indexes: List[int] = []
+        valid_items = []
+        for index, item in enumerate(data):
+            try:
+                valid_items.append((index, self.child.run_validation(item)))
+            except serializers.ValidationError as exc:
+                self.item_errors[index] = exc.detail
+
+        # One query for every user referenced anywhere in the batch
+        requested_ids = {
+            user_id for _, item in valid_items for user_id in item.get('assigned_users', [])
+        }
+        existing_ids = set(
+            User.objects.filter(id__in=requested_ids).values_list('id', flat=True)
+        )
+        missing_ids = requested_ids - existing_ids
+
+        result = []
+        for index, item in valid_items:
+            missing = missing_ids.intersection(item.get('assigned_users', []))
+            if missing:
+                self.item_errors[index] = {
+                    'assigned_users': [f"User IDs not found: {sorted(missing)}"]
+                }
+                continue
+            self.valid_indexes.append(index)
+            result.append(item)
+
+        if self.item_errors and (self.context.get('atomic') or not result):
+            raise serializers.ValidationError([
+                self.item_errors.get(index, {}) for index in range(len(data))
+            ])
+        return result
+
+    def create(self, validated_data: List[Dict[str, Any]]) -> List[Task]:
+        """Insert tasks and their assignments with two bulk statements"""
+        assignments = [item.pop('assigned_users', []) for item in validated_data]
+        tasks = [Task(**item) for item in validated_data]
+
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=self.batch_size)
+            Task.add_assignments(
+                (
+                    (task.id, user_id)
+                    for task, user_ids in zip(tasks, assignments)
+                    for user_id in user_ids
+                ),
+                batch_size=self.batch_size,
+                event='task.created',
+                check_existing=False
+            )
+        return tasks
+
+
 class TaskCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating new tasks with validation.
@@ -23,10 +108,18 @@ class TaskCreateSerializer(serializers.ModelSerializer):
     Validates:
     - Task type matches available choices
     - Name length (100 chars max)
+    - Optional assigned user IDs exist
     """
+    assigned_users = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        write_only=True
+    )
+
     class Meta:
         model = Task
-        fields = ['name', 'description', 'task_type']
+        fields = ['name', 'description', 'task_type', 'assigned_users']
+        list_serializer_class = BulkTaskCreateListSerializer
         extra_kwargs = {
             'name': {
                 'max_length': 100
@@ -46,6 +139,26 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             )
         return value
 
+    def validate_assigned_users(self, value: List[int]) -> List[int]:
+        """
+        Ensure assigned user IDs exist.
+
+        Skipped for bulk creation, where the list serializer checks the IDs
+        of the whole batch in one query, and when ``context['defer_user_check']``
+        is set by async views, which check them with the async ORM.
+        """
+        if isinstance(self.parent, serializers.ListSerializer) or self.context.get('defer_user_check'):
+            return value
+
+        missing_ids = set(value) - set(
+            User.objects.filter(id__in=value).values_list('id', flat=True)
+        )
+        if missing_ids:
+            raise serializers.ValidationError(
+                f"User IDs not found: {sorted(missing_ids)}"
+            )
+        return value
+
 class TaskAssignSerializer(serializers.Serializer):
     """
     Serializer for assigning users to tasks.
@@ -68,6 +181,9 @@ class TaskAssignSerializer(serializers.Serializer):
         Raises:
             ValidationError: If any user IDs are invalid
         """
+        if self.context.get('defer_user_check'):
+            return value  # Checked by the async view
+
         existing_users = User.objects.filter(id__in=value)
         existing_ids = set(existing_users.values_list('id', flat=True))
         missing_ids = set(value) - existing_ids
@@ -77,4 +193,59 @@ class TaskAssignSerializer(serializers.Serializer):
                 f"User IDs not found: {sorted(missing_ids)}"
             )
             
-        return value
\ No newline at end of file
+        return value
+
+
+class TaskBulkAssignSerializer(serializers.Serializer):
+    """
+    Serializer for assigning (or unassigning) users across many tasks.
+
+    Expects a mapping of task IDs to user IDs. All task IDs and all user IDs
+    are validated with one query per table.
+    """
+
+    assignments = serializers.DictField(
+        child=serializers.ListField(child=serializers.IntegerField()),
+        allow_empty=False
+    )
+
+    def validate_assignments(self, value: Dict[str, List[int]]) -> Dict[int, List[int]]:
+        """
+        Validate that all task and user IDs exist.
+        Args:
+            value: Mapping of task ID (JSON object key) to user IDs
+        Returns:
+            Mapping with integer task IDs
+        Raises:
+            ValidationError: If any task or user IDs are invalid
+        """
+        try:
+            assignments = {int(task_id): user_ids for task_id, user_ids in value.items()}
+        except ValueError:
+            raise serializers.ValidationError("Task IDs must be integers")
+
+        user_ids = {user_id for ids in assignments.values() for user_id in ids}
+        missing_tasks = set(assignments) - set(
+            Task.objects.filter(id__in=assignments).values_list('id', flat=True)
+        )
+        missing_users = user_ids - set(
+            User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        )
+
+        errors = {}
+        if missing_tasks:
+            errors['missing_tasks'] = sorted(missing_tasks)
+        if missing_users:
+            errors['missing_users'] = sorted(missing_users)
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return assignments
+
+    def get_pairs(self) -> List[Tuple[int, int]]:
+        """Flatten the validated mapping into (task_id, user_id) pairs"""
+        return [
+            (task_id, user_id)
+            for task_id, user_ids in self.validated_data['assignments'].items()
+            for user_id in user_ids
+        ]
@@ -0,0 +1,116 @@
+from typing import Any, Dict, List, Optional, Tuple
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from users.models import User
+from .cache import task_list_cache
+from .models import Task, TaskAssignment, TaskChange
+from .serializers import TaskSerializer
+
+
+def _record(pairs: List[Tuple[int, int]], kind: str, event: Optional[str] = None,
+            data: Optional[Dict[str, Any]] = None) -> None:
+    """Log (task_id, user_id) changes and invalidate the affected listings"""
+    TaskChange.record(pairs, kind, event=event, data=data)
+    task_list_cache.invalidate(user_id for _, user_id in pairs)
+
+
+def _task_pairs(task: Task) -> List[Tuple[int, int]]:
+    """(task_id, user_id) for every user assigned to ``task``"""
+    return [(task.pk, user_id) for user_id in task.assigned_users.values_list('id', flat=True)]
+
+
+@receiver(post_save, sender=Task)
+def track_task_update(sender, instance: Task, created: bool, **kwargs) -> None:
+    """A changed task changes the listings of everyone assigned to it"""
+    if created:
+        return  # A new task has no assignments yet
+    _record(
+        _task_pairs(instance),
+        TaskChange.Kind.UPSERT,
+        event='task.updated',
+        data={'status': instance.status}
+    )
+
+
+@receiver(pre_delete, sender=Task)
+def track_task_delete(sender, instance: Task, **kwargs) -> None:
+    """Collect assignees before the cascade removes the through rows"""
+    _record(_task_pairs(instance), TaskChange.Kind.REMOVED, event='task.deleted')
+
+
+@receiver(m2m_changed, sender=TaskAssignment)
+def track_assignment_change(sender, instance, action: str, reverse: bool,
+                            pk_set, **kwargs) -> None:
+    """
+    Handle add/remove/clear through the related managers in both directions.
+
+    Bulk writes through Task.add_assignments/remove_assignments record their
+    changes explicitly, since bulk operations do not send signals.
+
+    The other users assigned to the affected tasks render the changed
+    assignee list too, so they get an upsert change as well and the tasks
+    are touched to change their ETags.
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if action == 'post_add':
+        kind, event = TaskChange.Kind.UPSERT, 'task.assigned'
+    else:
+        kind, event = TaskChange.Kind.REMOVED, 'task.unassigned'
+
+    if action == 'pre_clear':
+        if reverse:
+            pairs = [(task_id, instance.pk) for task_id in instance.tasks.values_list('id', flat=True)]
+        else:
+            pairs = _task_pairs(instance)
+    elif reverse:
+        # user.tasks.add(...): pk_set holds task IDs
+        pairs = [(task_id, instance.pk) for task_id in pk_set or ()]
+    else:
+        pairs = [(instance.pk, user_id) for user_id in pk_set or ()]
+    task_ids = {task_id for task_id, _ in pairs}
+    Task.touch(task_ids)
+    co_assignees = Task.assignee_pairs(task_ids) - set(pairs)
+    _record(pairs, kind, event=event)
+    _record(co_assignees, TaskChange.Kind.UPSERT)
+
+
+def _co_assignment_pairs(user: User) -> List[Tuple[int, int]]:
+    """(task_id, user_id) of every assignment on tasks shared with ``user``"""
+    shared_tasks = TaskAssignment.objects.filter(user=user).values('task_id')
+    return list(
+        TaskAssignment.objects.filter(task_id__in=shared_tasks).values_list('task_id', 'user_id')
+    )
+
+
+@receiver(post_save, sender=User)
+def track_user_save(sender, instance: User, created: bool, update_fields=None,
+                    **kwargs) -> None:
+    """
+    Users are rendered inside other users' listings, so a profile change
+    changes every task they are assigned to. New users invalidate their own
+    ID, which may have belonged to a deleted user.
+
+    Saves that leave the rendered fields as they were loaded (password
+    changes, last_login, admin edits of other fields) fan out nothing.
+    """
+    if created:
+        task_list_cache.invalidate([instance.pk])
+        return
+    if update_fields and not set(update_fields) & set(TaskSerializer.ASSIGNED_USER_FIELDS):
+        return  # e.g. password or last_login only
+    if not instance.has_changed(*TaskSerializer.ASSIGNED_USER_FIELDS):
+        return
+    # The rendered tasks changed, so move their last-modified time (and ETags) too
+    Task.objects.filter(assigned_users=instance).update(updated_at=timezone.now())
+    _record(_co_assignment_pairs(instance), TaskChange.Kind.UPSERT)
+
+
+@receiver(pre_delete, sender=User)
+def track_user_delete(sender, instance: User, **kwargs) -> None:
+    """Co-assignees' tasks lose this user; collect them before the cascade"""
+    pairs = [pair for pair in _co_assignment_pairs(instance) if pair[1] != instance.pk]
+    Task.objects.filter(assigned_users=instance).update(updated_at=timezone.now())
+    _record(pairs, TaskChange.Kind.UPSERT)
+    task_list_cache.invalidate([instance.pk])
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from typing import AsyncIterator, List, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from users.authentication import CachedJWTAuthentication
+from .events import Subscription, TaskEvent, TooManySubscriptions, task_events
+from .models import TaskChange, TaskChangePurge
+
+
+def format_event(event: TaskEvent) -> str:
+    """Render a TaskEvent as a Server-Sent Events frame"""
+    payload = json.dumps({'task_id': event.task_id, 'user_id': event.user_id, **event.data})
+    frame = f"event: {event.event}\ndata: {payload}\n\n"
+    if event.change_id is not None:
+        frame = f"id: {event.change_id}\n{frame}"
+    return frame
+
+
+def format_resync(**data) -> str:
+    """Tell the client to catch up through the delta sync endpoint"""
+    return f"event: resync\ndata: {json.dumps(data)}\n\n"
+
+
+async def replay_events(user_id: int, last_event_id: int) -> Optional[List[TaskEvent]]:
+    """
+    Rebuild the events a reconnecting client missed after ``last_event_id``.
+
+    Returns:
+        The missed events, oldest first, or None if the gap cannot be filled
+        because changes were purged or more than TASK_EVENTS_REPLAY_LIMIT
+        are missing
+    """
+    limit = getattr(settings, 'TASK_EVENTS_REPLAY_LIMIT', 100)
+    if last_event_id < await sync_to_async(TaskChangePurge.watermark)():
+        return None
+    rows = [
+        row async for row in TaskChange.objects.filter(user_id=user_id, id__gt=last_event_id)
+        .order_by('id')
+        .values_list('id', 'task_id', 'kind')[:limit + 1]
+    ]
+    if len(rows) > limit:
+        return None
+    return [
+        TaskEvent(user_id=user_id, task_id=task_id, event=TaskChange.default_event(kind), change_id=change_id)
+        for change_id, task_id, kind in rows
+    ]
+
+
+async def event_stream(subscription: Subscription, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    Yield SSE frames for one subscription until the stream lifetime ends.
+
+    A reconnecting client (``last_event_id`` from the Last-Event-ID header)
+    first gets the changes it missed, replayed from the TaskChange log, or a
+    ``resync`` event when they cannot be replayed. Sends a keep-alive
+    comment when idle, and a ``resync`` event when events had to be dropped
+    because the client read too slowly. The subscription is closed when the
+    stream ends or the client disconnects.
+    """
+    loop = asyncio.get_running_loop()
+    heartbeat = getattr(settings, 'TASK_EVENTS_HEARTBEAT_SECONDS', 15)
+    deadline = loop.time() + getattr(settings, 'TASK_EVENTS_MAX_STREAM_SECONDS', 300)
+    try:
+        yield "retry: 3000\n: connected\n\n"
+        # Subscribed before replaying, so changes committed meanwhile are
+        # delivered live; those already replayed are skipped by position
+        position = 0
+        if last_event_id is not None:
+            missed = await replay_events(subscription.user_id, last_event_id)
+            if missed is None:
+                yield format_resync(last_event_id=last_event_id)
+            else:
+                for event in missed:
+                    yield format_event(event)
+                position = missed[-1].change_id if missed else last_event_id
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            event = await subscription.get(timeout=min(heartbeat, remaining))
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield format_resync(dropped=dropped)
+            if event is not None and event.change_id is not None and event.change_id <= position:
+                continue
+            yield format_event(event) if event is not None else ": keep-alive\n\n"
+    finally:
+        task_events.unsubscribe(subscription)
+
+
+class EventStreamResponse(StreamingHttpResponse):
+    """
+    text/event-stream response owning a bus subscription.
+
+    The subscription is opened before the response is returned (so the
+    connection limit is enforced atomically) and released on close(), even
+    if the client went away before the stream started.
+    """
+
+    def __init__(self, subscription: Subscription, last_event_id: Optional[int] = None) -> None:
+        super().__init__(event_stream(subscription, last_event_id), content_type='text/event-stream')
+        self.subscription = subscription
+        self['Cache-Control'] = 'no-cache'
+        self['X-Accel-Buffering'] = 'no'  # Disable proxy buffering (nginx)
+
+    def close(self) -> None:
+        task_events.unsubscribe(self.subscription)
+        super().close()
+
+
+def parse_last_event_id(request) -> Optional[int]:
+    """Change id from the Last-Event-ID header sent by reconnecting clients"""
+    try:
+        return int(request.headers['Last-Event-ID'])
+    except (KeyError, ValueError):
+        return None
+
+
+@require_GET
+async def task_event_stream(request):
+    """
+    Server-Sent Events stream of task changes for the authenticated user
+    (ASGI only).
+
+    Method:GET
+
+    Headers:
+    - Authorization: Bearer <access token>
+    - Last-Event-ID: id of the last event received (sent by EventSource on reconnect)
+
+    Events:
+    - task.created / task.assigned / task.updated / task.unassigned / task.deleted
+    - resync: events were dropped or could not be replayed; fetch
+      /tasks/changes/ to catch up
+
+    Returns:
+    - 200 OK: text/event-stream, closed after TASK_EVENTS_MAX_STREAM_SECONDS
+    - 401 Unauthorized: Missing or invalid token
+    - 429 Too Many Requests: Too many open streams for this user
+    """
+    authenticator = CachedJWTAuthentication()
+    try:
+        header = authenticator.get_header(request)
+        raw_token = authenticator.get_raw_token(header) if header else None
+        if raw_token is None:
+            return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+        validated_token = authenticator.get_validated_token(raw_token)
+        user = await authenticator.aget_user(validated_token)
+    except (InvalidToken, AuthenticationFailed, TokenError) as exc:
+        return JsonResponse({'detail': str(exc)}, status=401)
+
+    try:
+        subscription = task_events.subscribe(
+            user.id, limit=getattr(settings, 'TASK_EVENTS_MAX_CONNECTIONS', 5)
+        )
+    except TooManySubscriptions:
+        return JsonResponse({'detail': 'Too many open event streams.'}, status=429)
+
+    return EventStreamResponse(subscription, parse_last_event_id(request))
@@ -1,20 +1,59 @@
+from django.conf import settings
 from django.urls import path
-from .views import TaskCreateView, TaskAssignView, UserTasksView
+from .views import (
+    TaskCreateView, TaskBulkCreateView, TaskAssignView, TaskBulkAssignView,
+    TaskBulkUnassignView, UserTasksView, UserTaskChangesView, TaskCacheStatsView
+)
+from .streaming import task_event_stream
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+# ASGI deployments can serve creation, assignment and listing with async views
+if settings.TASK_ASYNC_VIEWS:
+    from .async_views import (
+        AsyncTaskCreateView as TaskCreateView,
+        AsyncTaskAssignView as TaskAssignView,
+        AsyncUserTasksView as UserTasksView,
+    )
+
 
 urlpatterns = [
     # POST - Create new task
     # Body: { name, description, task_type }
     path('tasks/create/', TaskCreateView.as_view(), name='task-create'),
 
+    # POST - Create many tasks in one request
+    # Query: ?atomic=true to reject the whole batch on any invalid item
+    # Body: [ { name, description, task_type, assigned_users: [<user_id>...] }, ... ]
+    path('tasks/bulk/', TaskBulkCreateView.as_view(), name='task-bulk-create'),
+
     # POST - Assign users to a specific task
     # Parameters: pk (Task ID)
     # Body: { user_ids: [<user_id1>, <user_id2>...] }
     path('tasks/<int:pk>/assign/', TaskAssignView.as_view(), name='task-assign'),
 
+    # POST - Assign users across many tasks
+    # Body: { assignments: { "<task_id>": [<user_id1>, <user_id2>...], ... } }
+    path('tasks/assign/bulk/', TaskBulkAssignView.as_view(), name='task-bulk-assign'),
+
+    # POST - Remove users from many tasks
+    # Body: { assignments: { "<task_id>": [<user_id1>, <user_id2>...], ... } }
+    path('tasks/unassign/bulk/', TaskBulkUnassignView.as_view(), name='task-bulk-unassign'),
+
     # GET - Retrieve tasks assigned to a specific user
     # Parameters: user_id (User ID)
     # Returns: List of tasks with details
     path('users/<int:user_id>/tasks/', UserTasksView.as_view(), name='user-tasks'),
+
+    # GET - Tasks changed since a sync token (delta sync)
+    # Parameters: user_id (User ID)
+    # Query: ?since=<sync_token>&limit=<n>
+    # Returns: Changed tasks, removed task IDs and the next sync token
+    path('users/<int:user_id>/tasks/changes/', UserTaskChangesView.as_view(), name='user-task-changes'),
+
+    # GET - Server-Sent Events stream of the authenticated user's task changes (ASGI)
+    # Headers: Authorization: Bearer <token>
+    path('tasks/events/', task_event_stream, name='task-events'),
+
+    # GET - Task listing cache counters (staff only)
+    path('tasks/cache/stats/', TaskCacheStatsView.as_view(), name='task-cache-stats'),
 ]
\ No newline at end of file
@@ -1,15 +1,27 @@
+import hashlib
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from .models import Task
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.exceptions import ValidationError, NotFound
 from django.shortcuts import get_object_or_404
 from django.db import transaction
-from .serializers import TaskSerializer, TaskCreateSerializer, TaskAssignSerializer
+from django.db.models import Count, Max, Prefetch
+from django.utils.http import parse_etags, quote_etag, urlencode
+from .serializers import (
+    TaskSerializer, TaskCreateSerializer, TaskAssignSerializer, TaskBulkAssignSerializer
+)
+from .pagination import TaskCursorPagination
+from .filters import TaskListFilter
+from .cache import task_list_cache
+from .sync import (
+    ExpiredSyncToken, InvalidSyncToken, changes_since, current_position,
+    decode_sync_token, encode_sync_token
+)
 from users.serializers import UserSerializer, UserRegistrationSerializer
 from users.models import User
-from rest_framework.throttling import UserRateThrottle
+from throttling.throttles import UserRateThrottle
 from rest_framework.exceptions import Throttled
 
 class TaskCreateView(generics.CreateAPIView):
@@ -84,6 +96,73 @@ class TaskCreateView(generics.CreateAPIView):
         return super().handle_exception(exc)
 
 
+class TaskBulkCreateView(generics.CreateAPIView):
+    """
+    API endpoint for creating many tasks in one request.
+    
+    Method:POST
+
+    Request Body:
+    - JSON array of { name, description, task_type, assigned_users (optional) }
+
+    Query Parameters:
+    - atomic: 'true' to reject the whole batch if any item is invalid
+
+    Returns:
+    - 201 Created: Every task created
+    - 207 Multi-Status: Valid tasks created, per-item errors for the rest
+    - 400 Bad Request: No task could be created (or atomic batch was invalid)
+    - 401 Unauthorized: Authentication required
+    """
+
+    throttle_classes = [UserRateThrottle]
+    throttle_scope = 'tasks'
+    permission_classes = [IsAuthenticated]
+    queryset = Task.objects.all()
+    serializer_class = TaskCreateSerializer
+    max_batch_size = 1000
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['atomic'] = self.request.query_params.get('atomic', '').lower() in ('true', '1')
+        return context
+
+    def create(self, request, *args, **kwargs):
+        """Validate the batch, bulk insert the valid items and report the rest"""
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=self.max_batch_size
+        )
+        serializer.is_valid(raise_exception=True)
+        tasks = serializer.save()
+
+        errors = [
+            {'index': index, 'errors': detail}
+            for index, detail in sorted(serializer.item_errors.items())
+        ]
+        return Response(
+            {
+                'status': 'partial' if errors else 'success',
+                'created': [
+                    {'index': index, 'task_id': task.id}
+                    for index, task in zip(serializer.valid_indexes, tasks)
+                ],
+                'errors': errors
+            },
+            status=status.HTTP_207_MULTI_STATUS if errors else status.HTTP_201_CREATED
+        )
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            # Custom response when throttled
+            return Response({
+                'detail': 'You are making too many requests. Please wait.',
+                'wait_time': f"{exc.wait} seconds"
+            }, status=429)
+        return super().handle_exception(exc)
+
+
 class TaskAssignView(generics.GenericAPIView):
     """
     API endpoint for assigning users to a specific task
@@ -122,23 +201,14 @@ class TaskAssignView(generics.GenericAPIView):
                 serializer = self.get_serializer(data=request.data)
                 serializer.is_valid(raise_exception=True)
                 
-                user_ids = serializer.validated_data['user_ids']
-                users = User.objects.filter(id__in=user_ids)
-
-                # Validate all users exist
-                if len(users) != len(user_ids):
-                    missing_ids = set(user_ids) - set(users.values_list('id', flat=True))
-                    raise ValidationError(
-                        {'missing_users': list(missing_ids)},
-                        code=status.HTTP_404_NOT_FOUND
-                    )
-        
-                task.assigned_users.add(*users)
+                # The serializer has already checked that every user exists
+                user_ids = list(dict.fromkeys(serializer.validated_data['user_ids']))
+                Task.add_assignments((task.id, user_id) for user_id in user_ids)
                 
                 return Response(
                     {
                         'status': 'success',
-                        'assigned_users': list(users.values_list('id', flat=True)),
+                        'assigned_users': user_ids,
                         'task_id': task.id
                     },
                     status=status.HTTP_200_OK
@@ -159,32 +229,79 @@ class TaskAssignView(generics.GenericAPIView):
         return super().handle_exception(exc)
 
 
-class UserTasksView(generics.ListAPIView):
+class TaskBulkAssignView(generics.GenericAPIView):
     """
-    API endpoint that returns tasks assigned to a specific user
+    API endpoint for assigning users across many tasks in one request
     
+    Method:POST
+
+    Required Fields:
+    - assignments: mapping of task ID to a list of user IDs
+
     Returns:
-    - 200 OK: List of tasks
-    - 404 Not Found: If requested user doesn't exist
+    - 200 OK: All assignments written (existing ones are kept)
+    - 400 Bad Request: Unknown task or user IDs; nothing is written
     """
+
     throttle_classes = [UserRateThrottle]
     throttle_scope = 'tasks'
     permission_classes = [IsAuthenticated]
-    serializer_class = TaskSerializer
+    serializer_class = TaskBulkAssignSerializer
+
+    def perform_bulk(self, pairs) -> dict:
+        """Write the assignments with a single conflict-ignoring insert"""
+        Task.add_assignments(pairs)
+        return {'assignments': len(pairs)}
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        pairs = serializer.get_pairs()
+
+        with transaction.atomic():
+            result = self.perform_bulk(pairs)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
         return Response(
             {
                 'status': 'success',
-                'user_id': self.kwargs['user_id'],
-                'tasks': serializer.data,
-                'count': queryset.count()
+                'task_ids': sorted(serializer.validated_data['assignments']),
+                **result
             },
             status=status.HTTP_200_OK
         )
 
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            # Custom response when throttled
+            return Response({
+                'detail': 'You are making too many requests. Please wait.',
+                'wait_time': f"{exc.wait} seconds"
+            }, status=429)
+        return super().handle_exception(exc)
+
+
+class TaskBulkUnassignView(TaskBulkAssignView):
+    """
+    API endpoint for removing users from many tasks in one request
+    
+    Method:POST
+
+    Required Fields:
+    - assignments: mapping of task ID to a list of user IDs to remove
+
+    Returns:
+    - 200 OK: Number of assignments removed
+    - 400 Bad Request: Unknown task or user IDs; nothing is removed
+    """
+
+    def perform_bulk(self, pairs) -> dict:
+        """Remove the assignments with a single DELETE"""
+        return {'removed': Task.remove_assignments(pairs)}
+
+
+class UserTasksQuerysetMixin:
+    """Tasks assigned to the user in the URL, for listing endpoints"""
+
     def get_queryset(self):
         """Get validated queryset"""
         user_id = self.kwargs['user_id']
@@ -192,9 +309,224 @@ class UserTasksView(generics.ListAPIView):
         # Validate user exists
         if not User.objects.filter(id=user_id).exists():
             raise NotFound(f"User {user_id} not found")
-        
-        return Task.objects.filter(assigned_users__id=user_id)
+        return self.get_user_tasks(user_id)
+
+    def get_user_tasks(self, user_id: int):
+        """Tasks assigned to ``user_id``, without checking that the user exists"""
+        # Load every task's assigned users in one extra query instead of one per task
+        assigned_users = Prefetch(
+            'assigned_users',
+            queryset=User.objects.only(*TaskSerializer.ASSIGNED_USER_FIELDS)
+        )
+        return Task.objects.filter(assigned_users__id=user_id).prefetch_related(assigned_users)
+
+
+class UserTasksView(UserTasksQuerysetMixin, generics.ListAPIView):
+    """
+    API endpoint that returns tasks assigned to a specific user
+    
+    Query Parameters:
+    - status / task_type: Comma-separated codes to filter on
+    - created_after / created_before / completed_after / completed_before: Date ranges
+    - ordering: created_at (default) or -created_at
+    - cursor / page_size: Switch to keyset pagination ordered by (created_at, id)
+    - count: 'true' or 'estimate' to include a total when paginating
+
+    Responses are cached per user and query string (X-Cache: HIT/MISS) and
+    invalidated whenever that user's tasks or assignments change. Responses
+    carry a strong ETag; a matching If-None-Match gets 304 Not Modified.
+
+    Returns:
+    - 200 OK: List of tasks
+    - 304 Not Modified: The client's copy (If-None-Match) is current
+    - 400 Bad Request: Invalid filter or ordering values
+    - 404 Not Found: If requested user doesn't exist or the cursor is invalid
+    """
+    throttle_classes = [UserRateThrottle]
+    throttle_scope = 'tasks'
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskSerializer
+    pagination_class = TaskCursorPagination
+    filter_backends = [TaskListFilter]
+
+    def list(self, request, *args, **kwargs):
+        variant = self.get_cache_variant()
+        etag = self.get_etag(variant)
+        if self.is_not_modified(etag):
+            return self.not_modified_response(etag)
+
+        # Build the key before touching the database (see TaskListCache.make_key)
+        cache_key = task_list_cache.make_key(self.kwargs['user_id'], variant)
+        data = task_list_cache.get(cache_key)
+        cache_hit = data is not None
+        if not cache_hit:
+            data = self.get_list_data()
+            task_list_cache.set(cache_key, data)
+        return self.listing_response(data, etag, cache_hit)
+
+    def get_cache_variant(self) -> str:
+        """Host and normalised query string; each combination is cached separately"""
+        query = urlencode(sorted(self.request.query_params.lists()), doseq=True)
+        return f"{self.request.get_host()}?{query}"
+
+    def get_etag_aggregates(self) -> dict:
+        """
+        Aggregates over the user's assignments that fingerprint the listing.
+
+        The fingerprint changes when a task of the user is modified
+        (updated_at), assigned (highest assignment ID) or unassigned
+        (assignment count), without loading or serializing any task.
+        user_exists is 0 for an unknown user, so the same query also
+        replaces the existence check.
+        """
+        return {
+            'user_exists': Count('id', distinct=True),
+            'assignments': Count('taskassignment'),
+            'last_assignment': Max('taskassignment__id'),
+            'last_modified': Max('taskassignment__task__updated_at'),
+        }
+
+    def get_etag_queryset(self):
+        """The URL's user, aggregated over by get_etag_aggregates()"""
+        return User.objects.filter(id=self.kwargs['user_id'])
+
+    def get_etag(self, variant: str) -> str:
+        """Strong ETag for the listing, computed with one aggregate query"""
+        fingerprint = self.get_etag_queryset().aggregate(**self.get_etag_aggregates())
+        return self.make_etag(variant, fingerprint)
+
+    def make_etag(self, variant: str, fingerprint: dict) -> str:
+        """
+        Hash the fingerprint into an ETag.
+
+        Raises NotFound for an unknown user, before any conditional response.
+        """
+        if not fingerprint.pop('user_exists'):
+            raise NotFound(f"User {self.kwargs['user_id']} not found")
+        raw = f"{self.kwargs['user_id']}|{variant}|{sorted(fingerprint.items())}"
+        return quote_etag(hashlib.md5(raw.encode('utf-8')).hexdigest())
+
+    def is_not_modified(self, etag: str) -> bool:
+        return etag in parse_etags(self.request.headers.get('If-None-Match', ''))
+
+    def not_modified_response(self, etag: str) -> Response:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        return response
+
+    def listing_response(self, data: dict, etag: str, cache_hit: bool) -> Response:
+        response = Response(data, status=status.HTTP_200_OK)
+        response['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+        response['ETag'] = etag
+        return response
+
+    def get_list_data(self) -> dict:
+        """Query and serialize the listing (the user was checked by get_etag)"""
+        queryset = self.filter_queryset(self.get_user_tasks(self.kwargs['user_id']))
+        page = self.paginate_queryset(queryset)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.list_envelope(self.paginator.get_paginated_data(serializer.data))
+        return self.list_envelope(self.unpaginated_data(queryset))
+
+    def list_envelope(self, fields: dict) -> dict:
+        return {
+            'status': 'success',
+            'user_id': self.kwargs['user_id'],
+            **fields
+        }
+
+    def unpaginated_data(self, tasks) -> dict:
+        data = self.get_serializer(tasks, many=True).data
+        return {
+            'tasks': data,
+            'count': len(data)  # Already evaluated, avoids a second COUNT query
+        }
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            # Custom response when throttled
+            return Response({
+                'detail': 'You are making too many requests. Please wait.',
+                'wait_time': f"{exc.wait} seconds"
+            }, status=429)
+        return super().handle_exception(exc)
+
+
+class UserTaskChangesView(UserTasksQuerysetMixin, generics.GenericAPIView):
+    """
+    API endpoint for delta sync of a user's task listing
     
+    Method:GET
+
+    Query Parameters:
+    - since: Sync token from the previous response (omit for an initial sync)
+    - limit: Maximum number of change records to consume (default 500, max 1000)
+
+    Returns:
+    - 200 OK: Changed tasks, removed task IDs and a new sync_token
+      (call again with has_more=true until it is false)
+    - 400 Bad Request: Malformed sync token
+    - 404 Not Found: If requested user doesn't exist
+    - 410 Gone: Changes after the token were purged; do a full sync
+    """
+    throttle_classes = [UserRateThrottle]
+    throttle_scope = 'tasks'
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskSerializer
+    default_limit = 500
+    max_limit = 1000
+
+    def get_limit(self) -> int:
+        try:
+            limit = int(self.request.query_params['limit'])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get(self, request, *args, **kwargs):
+        user_id = self.kwargs['user_id']
+        token = request.query_params.get('since')
+        queryset = self.get_queryset()
+
+        if not token:
+            # Initial sync: read the position first so no later change is missed
+            position = current_position(user_id)
+            tasks = self.get_serializer(queryset.order_by('created_at', 'id'), many=True).data
+            return self._response(tasks, [], position, has_more=False)
+
+        try:
+            position = decode_sync_token(token)
+        except ExpiredSyncToken:
+            return Response(
+                {'error': 'Sync token expired, perform a full sync'},
+                status=status.HTTP_410_GONE
+            )
+        except InvalidSyncToken:
+            raise ValidationError({'since': 'Invalid sync token'})
+
+        delta = changes_since(user_id, position, self.get_limit())
+        tasks = list(queryset.filter(id__in=delta.changed_ids).order_by('created_at', 'id'))
+        # Anything no longer assigned by now is reported as removed
+        removed = sorted(set(delta.removed_ids) | (set(delta.changed_ids) - {task.id for task in tasks}))
+        return self._response(
+            self.get_serializer(tasks, many=True).data, removed, delta.position, delta.has_more
+        )
+
+    def _response(self, changed, removed, position: int, has_more: bool) -> Response:
+        return Response(
+            {
+                'status': 'success',
+                'user_id': self.kwargs['user_id'],
+                'changed': changed,
+                'removed': removed,
+                'sync_token': encode_sync_token(position),
+                'has_more': has_more
+            },
+            status=status.HTTP_200_OK
+        )
+
     def handle_exception(self, exc):
         if isinstance(exc, Throttled):
             # Custom response when throttled
@@ -204,3 +536,25 @@ class UserTasksView(generics.ListAPIView):
             }, status=429)
         return super().handle_exception(exc)
 
+
+class TaskCacheStatsView(generics.GenericAPIView):
+    """
+    API endpoint exposing task listing cache counters for monitoring
+    
+    Method:GET
+
+    Returns:
+    - 200 OK: Hit/miss/invalidation counters of the serving process
+    - 403 Forbidden: Requesting user is not staff
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                'status': 'success',
+                'cache_alias': task_list_cache.alias,
+                'stats': task_list_cache.stats()
+            },
+            status=status.HTTP_200_OK
+        )
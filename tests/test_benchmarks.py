@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import tempfile
+from django.core.management import call_command
+from django.test import TestCase
+from benchmarks.dataset import seed_dataset
+from tasks.models import Task
+from users.models import User
+
+
+class LoadTestCommandTest(TestCase):
+    """Test suite for the load-test dataset and management command."""
+
+    def test_seed_dataset(self) -> None:
+        """
+        Test the dataset has the requested size and fan-out.
+
+        Verifies:
+        - users and tasks are created in bulk
+        - every task has ``fanout`` distinct users
+        """
+        ids = seed_dataset(users=10, tasks=20, fanout=3, seed=1)
+        self.assertEqual(User.objects.filter(username__startswith='loadtest-').count(), 10)
+        self.assertEqual(len(ids['tasks']), 20)
+        for task in Task.objects.prefetch_related('assigned_users'):
+            self.assertEqual(len(task.assigned_users.all()), 3)
+
+    def test_command_reports_and_saves_results(self) -> None:
+        """
+        Test the command runs the workloads in-process and saves the results.
+
+        Verifies:
+        - no request fails
+        - latency percentiles and queries per request are reported
+        - the JSON file records the parameters
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            out = io.StringIO()
+            call_command(
+                'loadtest', '--use-current-database', '--users', '5', '--tasks', '10',
+                '--workloads', 'create,assign,list', '--requests', '4', '--concurrency', '1',
+                '--output', output, stdout=out
+            )
+            with open(output) as stream:
+                report = json.load(stream)
+
+        self.assertIn('Saved results to', out.getvalue())
+        self.assertEqual(report['meta']['users'], 5)
+        self.assertEqual(set(report['results']), {'create', 'assign', 'list'})
+        for stats in report['results'].values():
+            self.assertEqual(stats['requests'], 4)
+            self.assertEqual(stats['errors'], 0)
+            self.assertGreater(stats['queries_per_request'], 0)
+            self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
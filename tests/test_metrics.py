@@ -0,0 +1,180 @@
+import json
+import os
+import tempfile
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from metrics.instruments import requests_in_progress
+from metrics.middleware import MetricsMiddleware
+from metrics.registry import Registry, registry
+from users.models import User
+
+
+class RegistryTest(SimpleTestCase):
+    """Test suite for the metrics registry and its exposition format."""
+
+    def setUp(self) -> None:
+        """Create a registry with one metric of each type."""
+        self.registry = Registry()
+        self.counter = self.registry.counter('hits_total', 'Hits.', ['route'])
+        self.gauge = self.registry.gauge('busy', 'Busy workers.')
+        self.histogram = self.registry.histogram('latency_seconds', 'Latency.', ['route'], buckets=(0.1, 1))
+
+    def test_exposition_format(self) -> None:
+        """
+        Test metrics are rendered in the Prometheus text format.
+
+        Verifies:
+        - HELP and TYPE lines
+        - escaped label values
+        - cumulative histogram buckets with +Inf, sum and count
+        """
+        self.counter.inc(route='a"b')
+        self.counter.inc(2, route='a"b')
+        self.gauge.set(3)
+        for value in (0.05, 0.5, 5):
+            self.histogram.observe(value, route='x')
+
+        text = self.registry.expose()
+        self.assertIn('# HELP hits_total Hits.\n# TYPE hits_total counter\nhits_total{route="a\\"b"} 3.0\n', text)
+        self.assertIn('busy 3.0\n', text)
+        self.assertIn(
+            'latency_seconds_bucket{route="x",le="0.1"} 1\n'
+            'latency_seconds_bucket{route="x",le="1.0"} 2\n'
+            'latency_seconds_bucket{route="x",le="+Inf"} 3\n'
+            'latency_seconds_sum{route="x"} 5.55\n'
+            'latency_seconds_count{route="x"} 3\n',
+            text
+        )
+
+    def test_labels_are_checked(self) -> None:
+        """Test a sample with the wrong label names is rejected."""
+        with self.assertRaises(ValueError):
+            self.counter.inc(path='/')
+
+    def test_processes_are_merged(self) -> None:
+        """
+        Test snapshots of other processes in the shared directory are merged.
+
+        Verifies:
+        - counters and histograms are summed, including exited processes
+        - gauges of exited processes are ignored
+        """
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_MULTIPROC_DIR=directory):
+            self.counter.inc(route='a')
+            self.gauge.set(1)
+            self.histogram.observe(0.5, route='x')
+            other = self.registry.snapshot()
+            with open(os.path.join(directory, f'{2 ** 22 + 1}.json'), 'w') as stream:
+                json.dump(other, stream)  # A worker that has exited
+
+            text = self.registry.expose()
+
+        self.assertIn('hits_total{route="a"} 2.0\n', text)
+        self.assertIn('busy 1.0\n', text)
+        self.assertIn('latency_seconds_count{route="x"} 2\n', text)
+
+
+@override_settings(METRICS_TOKEN='scrape-secret', METRICS_ALLOWED_IPS=[])
+class MetricsViewTest(APITestCase):
+    """Test suite for request metrics and the metrics endpoint."""
+
+    def setUp(self) -> None:
+        """Create an authenticated user and reset the metrics."""
+        cache.clear()  # Cached listings and users outlive each test
+        registry.clear()
+        self.user = User.objects.create_user(username='metricsuser', password='metricspass123')
+        self.client.force_authenticate(user=self.user)
+        self.tasks_url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    def _scrape(self, **extra):
+        """GET the metrics endpoint with the scrape token."""
+        return self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret', **extra)
+
+    def test_requests_are_recorded_by_route(self) -> None:
+        """
+        Test request metrics are exposed per route name.
+
+        Verifies:
+        - status, latency, size and database metrics of the listing
+        - text/plain exposition content type
+        """
+        self.client.get(self.tasks_url)
+        response = self._scrape()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        text = response.content.decode()
+        self.assertIn('api_requests_total{route="user-tasks",method="GET",status="200"} 1.0', text)
+        self.assertIn('api_request_duration_seconds_count{route="user-tasks",method="GET"} 1', text)
+        self.assertIn('api_response_size_bytes_count{route="user-tasks"} 1', text)
+        self.assertIn('api_db_queries_total{route="user-tasks"}', text)
+
+    @override_settings(REST_FRAMEWORK={
+        'DEFAULT_THROTTLE_RATES': {'anon': '50/minute', 'user': '50/minute', 'tasks': '1/minute'},
+    })
+    def test_throttle_rejections_are_counted(self) -> None:
+        """Test rejected requests are counted by route and scope."""
+        self.client.get(self.tasks_url)
+        self.client.get(self.tasks_url)
+        text = self._scrape().content.decode()
+        self.assertIn('api_throttled_requests_total{route="user-tasks",scope="tasks"} 1.0', text)
+
+    def test_scrapes_need_token_or_allowed_address(self) -> None:
+        """
+        Test the endpoint is only served to METRICS_TOKEN or METRICS_ALLOWED_IPS.
+
+        Verifies:
+        - loopback without the token is rejected
+        - a wrong token is rejected
+        - an explicitly allowed address needs no token
+        """
+        url = reverse('metrics')
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='127.0.0.1').status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self._scrape(REMOTE_ADDR='203.0.113.7').status_code, status.HTTP_200_OK)
+        with override_settings(METRICS_ALLOWED_IPS=['10.0.0.5']):
+            self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.5').status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_closed_by_default(self) -> None:
+        """Test nothing is trusted when no token or address is configured."""
+        response = self.client.get(reverse('metrics'), REMOTE_ADDR='127.0.0.1')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AsyncMetricsMiddlewareTest(SimpleTestCase):
+    """Test suite for the metrics middleware in async chains."""
+
+    def setUp(self) -> None:
+        """Reset the metrics."""
+        registry.clear()
+
+    def test_middleware_is_async_capable(self) -> None:
+        """
+        Test the middleware adapts to the chain it is placed in.
+        """
+        self.assertTrue(MetricsMiddleware.sync_capable)
+        self.assertTrue(MetricsMiddleware.async_capable)
+        self.assertFalse(iscoroutinefunction(MetricsMiddleware(lambda request: HttpResponse())))
+
+        async def get_response(request):
+            return HttpResponse()
+        self.assertTrue(iscoroutinefunction(MetricsMiddleware(get_response)))
+
+    async def test_async_requests_are_recorded(self) -> None:
+        """
+        Test the async path records the request and tracks in-progress ones.
+        """
+        async def get_response(request):
+            self.assertEqual(requests_in_progress.snapshot()['samples'], [[[], 1.0]])
+            return HttpResponse(status=204)
+
+        response = await MetricsMiddleware(get_response)(RequestFactory().get('/nowhere/'))
+        self.assertEqual(response.status_code, 204)
+        self.assertIn('api_requests_total{route="unmatched",method="GET",status="204"} 1.0', registry.expose())
@@ -0,0 +1,136 @@
+import io
+import logging
+import os
+import tempfile
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpResponse
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from metrics.profiling import ProfilingMiddleware, list_profiles
+from users.models import User
+
+
+class ProfilingMiddlewareTest(APITestCase):
+    """Test suite for on-demand and sampled request profiling."""
+
+    def setUp(self) -> None:
+        """Create a staff and a regular user and an empty profile directory."""
+        cache.clear()  # Cached listings and users outlive each test
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        settings_override = override_settings(PROFILING_DIR=self.directory)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.staff = User.objects.create_user(username='staffuser', password='staffpass123', is_staff=True)
+        self.user = User.objects.create_user(username='plainuser', password='plainpass123')
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    def _get(self, user: User, **headers):
+        return self.client.get(
+            self.url, HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}', **headers
+        )
+
+    def test_staff_header_profiles_request(self) -> None:
+        """
+        Test a staff user can profile a request with the X-Profile header.
+
+        Verifies:
+        - the profile is saved under the route name
+        - its name is returned in X-Profile-Id
+        - the profile can be listed, shown and collapsed
+        """
+        response = self._get(self.staff, HTTP_X_PROFILE='1')
+
+        profile_id = response['X-Profile-Id']
+        self.assertEqual(list_profiles(self.directory), [profile_id])
+        self.assertIn('-user-tasks-', profile_id)
+
+        out = io.StringIO()
+        call_command('profiles', 'list', stdout=out)
+        self.assertIn(profile_id, out.getvalue())
+
+        out = io.StringIO()
+        call_command('profiles', 'show', '--route', 'user-tasks', '--top', '5', stdout=out)
+        self.assertIn('function calls', out.getvalue())
+
+        folded = os.path.join(self.directory, 'out.folded')
+        call_command('profiles', 'collapse', profile_id, '-o', folded, stdout=io.StringIO())
+        with open(folded) as stream:
+            stacks = stream.read().splitlines()
+        self.assertTrue(any(';dispatch (views.py:' in line for line in stacks))
+        for line in stacks:
+            self.assertGreater(int(line.rsplit(' ', 1)[1]), 0)
+
+    def test_middleware_is_async_capable(self) -> None:
+        """
+        Test the middleware adapts to the chain it is placed in.
+        """
+        self.assertTrue(ProfilingMiddleware.sync_capable)
+        self.assertTrue(ProfilingMiddleware.async_capable)
+        self.assertFalse(iscoroutinefunction(ProfilingMiddleware(lambda request: HttpResponse())))
+
+        async def get_response(request):
+            return HttpResponse()
+        self.assertTrue(iscoroutinefunction(ProfilingMiddleware(get_response)))
+
+    @override_settings(DEBUG=True)
+    def test_asgi_chain_needs_no_adapters(self) -> None:
+        """
+        Test the configured middleware runs natively under ASGI.
+
+        Django logs every sync/async adaptation it inserts while DEBUG is on;
+        the logger is disabled by the LOGGING config, so enable it here.
+        """
+        logger = logging.getLogger('django.request')
+        self.addCleanup(setattr, logger, 'disabled', logger.disabled)
+        logger.disabled = False
+        with self.assertNoLogs(logger, 'DEBUG'):
+            ASGIHandler()
+
+    async def test_async_chain_profiles_on_demand(self) -> None:
+        """
+        Test a staff X-Profile request is profiled in an async chain.
+
+        Verifies:
+        - the bearer token is checked with the async authenticator
+        - the profile is saved and named in X-Profile-Id
+        - requests without the header pass straight through
+        """
+        async def get_response(request):
+            return HttpResponse()
+
+        middleware = ProfilingMiddleware(get_response)
+        token = AccessToken.for_user(self.staff)
+        request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}', HTTP_X_PROFILE='1')
+        response = await middleware(request)
+        self.assertEqual(list_profiles(self.directory), [response['X-Profile-Id']])
+
+        response = await middleware(RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertEqual(len(list_profiles(self.directory)), 1)
+
+    def test_header_is_ignored_for_other_users(self) -> None:
+        """Test non-staff users cannot trigger profiling."""
+        response = self._get(self.user, HTTP_X_PROFILE='1')
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertEqual(list_profiles(self.directory), [])
+
+    @override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_MAX_FILES=2)
+    def test_sampled_requests_are_profiled_and_pruned(self) -> None:
+        """
+        Test sampled requests are profiled without a header.
+
+        Verifies:
+        - no X-Profile-Id header is sent
+        - only the newest PROFILING_MAX_FILES profiles are kept
+        """
+        for _ in range(3):
+            self.assertNotIn('X-Profile-Id', self._get(self.user))
+        self.assertEqual(len(list_profiles(self.directory)), 2)
@@ -0,0 +1,64 @@
+import datetime
+import decimal
+import io
+import uuid
+from unittest import mock
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from taskmanager import renderers
+from taskmanager.renderers import FastJSONParser, FastJSONRenderer
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    """Test suite for the orjson renderer and parser."""
+
+    data = {
+        'status': 'success',
+        'created_at': datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+        'local': timezone.make_aware(datetime.datetime(2026, 1, 2, 3, 4, 5), datetime.timezone(datetime.timedelta(hours=2))),
+        'due': datetime.date(2026, 1, 2),
+        'estimate': decimal.Decimal('1.50'),
+        'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'label': gettext_lazy('Pending'),
+        'name': 'Tâche\u2028\u2029✓',
+        7: [1, 2.5, None, True],
+    }
+
+    def test_output_matches_json_renderer(self) -> None:
+        """
+        Test the rendered bytes are identical to DRF's JSONRenderer.
+
+        Verifies:
+        - datetimes (UTC as 'Z'), dates, Decimals, UUIDs and lazy strings
+        - non-ASCII text and the U+2028 escape
+        - non-string keys
+        """
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_indent_and_missing_orjson_fall_back(self) -> None:
+        """Test indented output and installs without orjson use JSONRenderer."""
+        expected = JSONRenderer().render(self.data, 'application/json; indent=4')
+        self.assertEqual(FastJSONRenderer().render(self.data, 'application/json; indent=4'), expected)
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+        self.assertEqual(FastJSONRenderer().render({'big': 2 ** 70}), b'{"big":1180591620717411303424}')
+
+    def test_parser(self) -> None:
+        """
+        Test request bodies are parsed like JSONParser.
+
+        Verifies:
+        - UTF-8 bodies are decoded
+        - invalid JSON and NaN raise ParseError
+        """
+        body = '{"name": "Tâche", "assigned_users": [1, 2]}'.encode()
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body))
+        )
+        for invalid in (b'{"name": ', b'{"value": NaN}'):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(invalid))
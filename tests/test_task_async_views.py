@@ -0,0 +1,161 @@
+import json
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import AsyncRequestFactory, TestCase
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+from tasks.async_views import AsyncTaskAssignView, AsyncTaskCreateView, AsyncUserTasksView
+from tasks.models import Task
+from tasks.views import UserTasksView
+from users.models import User
+
+
+class AsyncTaskViewTests(TestCase):
+    """Test suite for the async task views used under ASGI."""
+
+    def setUp(self) -> None:
+        """
+        Create two users, one task assigned to the primary user and a
+        Bearer token for the primary user.
+        """
+        cache.clear()
+        self.user = User.objects.create_user(username='asyncuser', password='asyncpass123')
+        self.other_user = User.objects.create_user(username='asyncother', password='otherpass123')
+        self.task = Task.objects.create(name='Async Task', description='Listed', status='P')
+        self.task.assigned_users.add(self.user)
+        self.factory = AsyncRequestFactory()
+        self.auth = {'Authorization': f'Bearer {AccessToken.for_user(self.user)}'}
+
+    def _post(self, view, path: str, data: dict, **kwargs):
+        request = self.factory.post(
+            path, json.dumps(data), content_type='application/json', headers=self.auth
+        )
+        return view.as_view()(request, **kwargs)
+
+    def _list(self, query: str = '', headers=None, user_id=None):
+        request = self.factory.get(
+            f'/api/v1/users/{self.user.id}/tasks/{query}',
+            headers={**self.auth, **(headers or {})}
+        )
+        return AsyncUserTasksView.as_view()(request, user_id=user_id or self.user.id)
+
+    def test_views_are_async(self) -> None:
+        """
+        Test Django dispatches the views as coroutines (no thread hop per request).
+        """
+        for view in (AsyncTaskCreateView, AsyncTaskAssignView, AsyncUserTasksView):
+            self.assertTrue(view.view_is_async, view.__name__)
+
+    async def test_requires_authentication(self) -> None:
+        """
+        Test requests without a valid Bearer token are rejected.
+        """
+        request = self.factory.get(f'/api/v1/users/{self.user.id}/tasks/')
+        response = await AsyncUserTasksView.as_view()(request, user_id=self.user.id)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        request = self.factory.get(
+            f'/api/v1/users/{self.user.id}/tasks/', headers={'Authorization': 'Bearer nope'}
+        )
+        response = await AsyncUserTasksView.as_view()(request, user_id=self.user.id)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_create_task(self) -> None:
+        """
+        Test task creation with assigned users.
+
+        Verifies:
+        - 201 Created with the task ID
+        - Task and assignment are written
+        - Unknown user IDs are rejected with 400
+        """
+        response = await self._post(AsyncTaskCreateView, '/api/v1/tasks/create/', {
+            'name': 'Created async',
+            'task_type': 'W',
+            'assigned_users': [self.other_user.id]
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        task = await Task.objects.aget(id=response.data['task_id'])
+        self.assertEqual(
+            [user.id async for user in task.assigned_users.all()], [self.other_user.id]
+        )
+
+        response = await self._post(AsyncTaskCreateView, '/api/v1/tasks/create/', {
+            'name': 'Bad users',
+            'task_type': 'W',
+            'assigned_users': [999999]
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('999999', response.data['error'])
+        self.assertEqual(await Task.objects.acount(), 2)
+
+    async def test_assign_task(self) -> None:
+        """
+        Test assigning users to a task.
+
+        Verifies:
+        - 200 OK and the assignment is written
+        - Unknown task returns 404
+        - Unknown user returns 400
+        """
+        path = f'/api/v1/tasks/{self.task.id}/assign/'
+        response = await self._post(
+            AsyncTaskAssignView, path, {'user_ids': [self.other_user.id]}, pk=self.task.id
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(await self.task.assigned_users.acount(), 2)
+
+        response = await self._post(
+            AsyncTaskAssignView, '/api/v1/tasks/999999/assign/', {'user_ids': [self.user.id]}, pk=999999
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = await self._post(AsyncTaskAssignView, path, {'user_ids': [999999]}, pk=self.task.id)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_listing_matches_sync_view(self) -> None:
+        """
+        Test the async listing returns the same payload as UserTasksView.
+
+        Verifies:
+        - Same body and ETag as the sync view
+        - Second request is served from the cache
+        - Matching If-None-Match returns 304
+        """
+        response = await self._list('?ordering=-created_at')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+        sync_request = APIRequestFactory().get(f'/api/v1/users/{self.user.id}/tasks/?ordering=-created_at')
+        force_authenticate(sync_request, user=self.user)
+        sync_response = await sync_to_async(UserTasksView.as_view())(sync_request, user_id=self.user.id)
+        self.assertEqual(response.data, sync_response.data)
+        self.assertEqual(response['ETag'], sync_response['ETag'])
+
+        response = await self._list('?ordering=-created_at')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        response = await self._list('?ordering=-created_at', headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_listing_pagination_and_errors(self) -> None:
+        """
+        Test paginated listing and error responses.
+
+        Verifies:
+        - page_size/count are honoured
+        - Unknown user returns 404
+        - Invalid filter returns 400
+        """
+        response = await self._list('?page_size=1&count=true')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tasks']), 1)
+        self.assertEqual(response.data['count'], 1)
+        self.assertIsNone(response.data['next'])
+
+        response = await self._list(user_id=999999)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = await self._list('?status=X')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,200 @@
+import asyncio
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+from tasks.events import EventBus, TaskEvent, TooManySubscriptions, task_events
+from tasks.models import Task, TaskChange, TaskChangePurge
+from users.models import User
+
+
+class EventBusTest(TestCase):
+    """Test suite for the in-process task event bus."""
+
+    def setUp(self) -> None:
+        """Create a private event loop for subscriptions."""
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def _drain(self, subscription) -> list:
+        """Run pending deliveries and return every buffered event."""
+        self.loop.run_until_complete(asyncio.sleep(0))
+        events = []
+        while not subscription.queue.empty():
+            events.append(subscription.queue.get_nowait())
+        return events
+
+    def test_dispatch_only_reaches_the_users_streams(self) -> None:
+        """
+        Test events are routed by user ID.
+        """
+        bus = EventBus()
+        mine = bus.subscribe(1, loop=self.loop)
+        other = bus.subscribe(2, loop=self.loop)
+        bus.dispatch([TaskEvent(user_id=1, task_id=10, event='task.assigned')])
+        self.assertEqual([event.task_id for event in self._drain(mine)], [10])
+        self.assertEqual(self._drain(other), [])
+
+    def test_subscribe_enforces_limit(self) -> None:
+        """
+        Test the connection limit is checked when subscribing.
+
+        Verifies:
+        - subscribing past the limit raises without registering
+        - a slot freed by unsubscribe can be reused
+        """
+        bus = EventBus()
+        first = bus.subscribe(1, loop=self.loop, limit=1)
+        with self.assertRaises(TooManySubscriptions):
+            bus.subscribe(1, loop=self.loop, limit=1)
+        self.assertEqual(bus.subscriber_count(1), 1)
+        bus.unsubscribe(first)
+        bus.subscribe(1, loop=self.loop, limit=1)
+        self.assertEqual(bus.subscriber_count(1), 1)
+
+    def test_bounded_buffer_drops_oldest(self) -> None:
+        """
+        Test a full buffer drops the oldest events and counts them.
+
+        Verifies:
+        - the buffer never exceeds its size
+        - the newest events are kept
+        - dropped events are reported once
+        """
+        bus = EventBus()
+        subscription = bus.subscribe(1, maxsize=2, loop=self.loop)
+        bus.dispatch([TaskEvent(user_id=1, task_id=i, event='task.updated') for i in range(5)])
+        self.assertEqual([event.task_id for event in self._drain(subscription)], [3, 4])
+        self.assertEqual(subscription.take_dropped(), 3)
+        self.assertEqual(subscription.take_dropped(), 0)
+
+    def test_task_writes_publish_on_commit(self) -> None:
+        """
+        Test task changes are published once the transaction commits.
+
+        Verifies:
+        - assignment publishes task.assigned
+        - status change publishes task.updated with the new status
+        """
+        user = User.objects.create_user(username='eventuser')
+        subscription = task_events.subscribe(user.id, loop=self.loop)
+        self.addCleanup(task_events.unsubscribe, subscription)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(name='Event Task')
+            task.assigned_users.add(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            task.status = 'C'
+            task.save()
+
+        events = self._drain(subscription)
+        self.assertEqual([event.event for event in events], ['task.assigned', 'task.updated'])
+        self.assertEqual(events[1].data, {'status': 'C'})
+
+
+@override_settings(TASK_EVENTS_HEARTBEAT_SECONDS=0.05, TASK_EVENTS_MAX_STREAM_SECONDS=0.5)
+class TaskEventStreamTest(TestCase):
+    """Test suite for the Server-Sent Events endpoint."""
+
+    def setUp(self) -> None:
+        """Create a user and an access token."""
+        self.user = User.objects.create_user(username='streamuser', password='streampass')
+        self.token = str(AccessToken.for_user(self.user))
+        self.url = reverse('task-events')
+
+    async def test_requires_authentication(self) -> None:
+        """
+        Test the stream rejects requests without a valid token.
+        """
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(self.url, headers={'Authorization': 'Bearer nope'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_streams_events_for_the_user(self) -> None:
+        """
+        Test published events are pushed to the user's open stream.
+
+        Verifies:
+        - text/event-stream response
+        - keep-alive comments while idle
+        - events rendered as SSE frames
+        - the stream ends and unsubscribes after its lifetime
+        """
+        response = await self.async_client.get(
+            self.url, headers={'Authorization': f'Bearer {self.token}'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        stream = aiter(response.streaming_content)
+        self.assertIn(b': connected', await anext(stream))
+        self.assertEqual(task_events.subscriber_count(self.user.id), 1)
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+
+        task_events.dispatch([
+            TaskEvent(user_id=self.user.id, task_id=7, event='task.assigned', change_id=42)
+        ])
+        frame = await anext(stream)
+        self.assertIn(b'id: 42\nevent: task.assigned\n', frame)
+        self.assertIn(b'"task_id": 7', frame)
+
+        async for frame in stream:
+            self.assertEqual(frame, b': keep-alive\n\n')
+        self.assertEqual(task_events.subscriber_count(self.user.id), 0)
+
+    def _open(self, **headers):
+        """Open a stream with the user's token and extra headers."""
+        return self.async_client.get(
+            self.url, headers={'Authorization': f'Bearer {self.token}', **headers}
+        )
+
+    @override_settings(TASK_EVENTS_MAX_CONNECTIONS=1)
+    async def test_connection_limit(self) -> None:
+        """
+        Test a user cannot open more streams than TASK_EVENTS_MAX_CONNECTIONS.
+
+        Verifies:
+        - the slot is taken before the response starts streaming
+        - a second stream gets 429
+        """
+        response = await self._open()
+        self.assertEqual(task_events.subscriber_count(self.user.id), 1)
+        self.assertEqual((await self._open()).status_code, 429)
+        response.close()
+        self.assertEqual(task_events.subscriber_count(self.user.id), 0)
+
+    async def test_last_event_id_replays_missed_changes(self) -> None:
+        """
+        Test a reconnecting client gets the changes after Last-Event-ID.
+
+        Verifies:
+        - missed changes are replayed in order with their ids
+        - a live event already replayed is not sent twice
+        """
+        seen = await TaskChange.objects.acreate(user=self.user, task_id=1, kind='U')
+        missed = [
+            await TaskChange.objects.acreate(user=self.user, task_id=2, kind='U'),
+            await TaskChange.objects.acreate(user=self.user, task_id=3, kind='R'),
+        ]
+        response = await self._open(**{'Last-Event-ID': str(seen.id)})
+        stream = aiter(response.streaming_content)
+        self.assertIn(b': connected', await anext(stream))
+        self.assertIn(f'id: {missed[0].id}\nevent: task.updated\n'.encode(), await anext(stream))
+        self.assertIn(f'id: {missed[1].id}\nevent: task.unassigned\n'.encode(), await anext(stream))
+
+        task_events.dispatch([
+            TaskEvent(user_id=self.user.id, task_id=3, event='task.unassigned', change_id=missed[1].id)
+        ])
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+        await stream.aclose()
+
+    async def test_last_event_id_before_purge_sends_resync(self) -> None:
+        """
+        Test a gap that cannot be replayed asks the client to resync.
+        """
+        await TaskChangePurge.objects.acreate(position=100)
+        response = await self._open(**{'Last-Event-ID': '5'})
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+        self.assertEqual(await anext(stream), b'event: resync\ndata: {"last_event_id": 5}\n\n')
+        await stream.aclose()
@@ -0,0 +1,117 @@
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from tasks.instrumentation import QueryInstrumentationMiddleware, QueryStats
+from tasks.models import Task
+from users.models import User
+
+
+class QueryStatsTest(SimpleTestCase):
+    """Test suite for the per-request query counter."""
+
+    databases = {'default'}
+
+    def test_counts_and_times_queries(self) -> None:
+        """
+        Test each executed statement is counted and timed.
+
+        Verifies:
+        - the count and total time
+        - the slowest statement is kept
+        """
+        stats = QueryStats()
+        with connection.execute_wrapper(stats):
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.execute('SELECT 2')
+        self.assertEqual(stats.count, 2)
+        self.assertGreater(stats.duration, 0)
+        self.assertIn(stats.slowest_sql, ('SELECT 1', 'SELECT 2'))
+
+
+class QueryInstrumentationMiddlewareTest(APITestCase):
+    """Test suite for the query instrumentation middleware."""
+
+    def setUp(self) -> None:
+        """Create an authenticated user with one task."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='queryuser', password='querypass123')
+        Task.objects.create(name='Counted Task').assigned_users.add(self.user)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    @override_settings(QUERY_STATS_HEADERS=True)
+    def test_headers_and_api_log(self) -> None:
+        """
+        Test the query count is reported in headers and in the API log.
+
+        Verifies:
+        - X-DB-Queries matches the queries actually run
+        - the API log record carries the same count
+        """
+        with self.assertLogs('api', level='INFO') as logs, self.assertNumQueries(4) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-DB-Queries'], str(len(queries)))
+        self.assertIn('X-DB-Time-Ms', response)
+        self.assertNotIn('X-DB-Query-Budget', response)
+        self.assertEqual(logs.records[-1].api['queries'], len(queries))
+
+    def test_headers_are_opt_in(self) -> None:
+        """Test no headers are sent by default."""
+        self.assertNotIn('X-DB-Queries', self.client.get(self.url))
+
+    @override_settings(QUERY_BUDGET=2, QUERY_STATS_HEADERS=True)
+    def test_over_budget_is_flagged(self) -> None:
+        """
+        Test a request over the query budget is flagged.
+
+        Verifies:
+        - a warning naming the route and the slowest statement
+        - the X-DB-Query-Budget header
+        """
+        with self.assertLogs('api', level='WARNING') as logs:
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-DB-Query-Budget'], 'exceeded (2)')
+        message = logs.records[0].getMessage()
+        self.assertIn('Query budget exceeded: route=user-tasks', message)
+        self.assertIn('slowest=', message)
+
+
+class AsyncQueryInstrumentationTest(TestCase):
+    """Test suite for the query instrumentation middleware in async chains."""
+
+    def test_middleware_is_async_capable(self) -> None:
+        """
+        Test the middleware adapts to the chain it is placed in.
+
+        Verifies:
+        - it declares sync and async support
+        - it is a coroutine function only when get_response is one
+        """
+        self.assertTrue(QueryInstrumentationMiddleware.sync_capable)
+        self.assertTrue(QueryInstrumentationMiddleware.async_capable)
+        self.assertFalse(iscoroutinefunction(QueryInstrumentationMiddleware(lambda request: HttpResponse())))
+
+        async def get_response(request):
+            return HttpResponse()
+        self.assertTrue(iscoroutinefunction(QueryInstrumentationMiddleware(get_response)))
+
+    @override_settings(QUERY_STATS_HEADERS=True)
+    async def test_counts_async_orm_queries(self) -> None:
+        """
+        Test queries of an async view are counted without a sync adapter.
+        """
+        async def get_response(request):
+            await User.objects.acount()
+            await User.objects.filter(username='nobody').aexists()
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(get_response)
+        request = RequestFactory().get('/')
+        response = await middleware(request)
+        self.assertEqual(request.query_stats.count, 2)
+        self.assertEqual(response['X-DB-Queries'], '2')
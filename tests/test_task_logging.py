@@ -0,0 +1,145 @@
+import logging
+import os
+import tempfile
+import threading
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from tasks.logging import QueueFileHandler
+from tasks.models import Task
+from users.models import User
+
+
+class QueueFileHandlerTest(SimpleTestCase):
+    """Test suite for the background-thread log file handler."""
+
+    def setUp(self) -> None:
+        """Create a handler writing to a temporary file."""
+        fd, self.filename = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+        self.addCleanup(os.remove, self.filename)
+        self.logger = logging.getLogger('tests.queue_file_handler')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def _handler(self, handler: QueueFileHandler) -> QueueFileHandler:
+        handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+        self.logger.addHandler(handler)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.addCleanup(handler.close)
+        return handler
+
+    def _lines(self):
+        with open(self.filename) as stream:
+            return stream.read().splitlines()
+
+    def test_records_are_written_in_order(self) -> None:
+        """
+        Test records are formatted and written by the writer thread.
+
+        Verifies:
+        - message arguments are merged before queueing
+        - flush() waits for the writes
+        - tracebacks are kept
+        """
+        handler = self._handler(QueueFileHandler(self.filename))
+        for i in range(5):
+            self.logger.info("Request %d", i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("Error")
+        handler.flush()
+
+        lines = self._lines()
+        self.assertEqual(lines[:6], [f'INFO Request {i}' for i in range(5)] + ['ERROR Error'])
+        self.assertIn('ValueError: boom', lines[-1])
+        self.assertEqual(handler.stats(), {'written': 6, 'dropped': 0, 'queued': 0})
+
+    def test_full_queue_drops_and_counts(self) -> None:
+        """
+        Test a stalled writer never blocks logging calls.
+
+        Verifies:
+        - records beyond the queue capacity are dropped and counted
+        - the drop count is written once the writer catches up
+        """
+        stalled, release = threading.Event(), threading.Event()
+
+        class StalledHandler(QueueFileHandler):
+            def write_batch(self, stream, records):
+                stalled.set()
+                release.wait(5)
+                super().write_batch(stream, records)
+
+        handler = self._handler(StalledHandler(self.filename, capacity=2, batch_size=1))
+        self.logger.info("first")
+        self.assertTrue(stalled.wait(5))  # The writer holds "first" and the queue is empty
+        for i in range(10):
+            self.logger.info("queued %d", i)
+        self.assertEqual(handler.stats()['dropped'], 8)
+
+        release.set()
+        handler.flush()
+        self.logger.info("after")
+        handler.flush()
+        lines = self._lines()
+        self.assertIn('Dropped 8 log records (queue full)', lines)
+        self.assertEqual(lines[-1], 'INFO after')
+
+
+class APILoggingMiddlewareTest(APITestCase):
+    """Test suite for the API request logging middleware."""
+
+    def setUp(self) -> None:
+        """Create an authenticated user with one task."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='loguser', password='logpass123')
+        Task.objects.create(name='Logged Task').assigned_users.add(self.user)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    def test_success_is_logged_once_without_payload(self) -> None:
+        """
+        Test a successful request produces one compact record.
+
+        Verifies:
+        - method, route, status, user ID and response size are logged
+        - the response payload is not
+        """
+        with self.assertLogs('api', level='INFO') as logs:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0]
+        self.assertEqual(record.levelname, 'INFO')
+        self.assertEqual(record.api['method'], 'GET')
+        self.assertEqual(record.api['route'], 'user-tasks')
+        self.assertEqual(record.api['status'], 200)
+        self.assertEqual(record.api['user'], self.user.pk)
+        self.assertEqual(record.api['bytes'], len(response.content))
+        self.assertNotIn('Logged Task', record.getMessage())
+
+    @override_settings(API_LOG_SAMPLE_RATE=0)
+    def test_errors_bypass_sampling(self) -> None:
+        """
+        Test sampled-out successes are skipped but errors are logged in full.
+
+        Verifies:
+        - no record for a successful request
+        - a 404 is logged as WARNING with its path and response body
+        """
+        with self.assertNoLogs('api', level='INFO'):
+            self.client.get(self.url)
+
+        url = reverse('user-tasks', kwargs={'user_id': 999})
+        with self.assertLogs('api', level='INFO') as logs:
+            self.client.get(url)
+
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0]
+        self.assertEqual(record.levelname, 'WARNING')
+        self.assertEqual(record.api['status'], 404)
+        self.assertEqual(record.api['path'], url)
+        self.assertIn('User 999 not found', record.getMessage())
@@ -1,8 +1,11 @@
 from django.test import TestCase
 from django.core.exceptions import ValidationError
-from tasks.models import Task
+from tasks.models import Task, TaskAssignment, TaskChange
 from users.models import User
-from datetime import datetime
+from datetime import datetime, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
 from django.contrib.auth.hashers import check_password
 
 class TaskModelTest(TestCase):
@@ -95,4 +98,114 @@ class TaskModelTest(TestCase):
         task.assigned_users.add(self.user1, self.user2)
         
         self.assertEqual(task.assigned_users.count(), 2)
-        self.assertIn(self.user1, task.assigned_users.all())
\ No newline at end of file
+        self.assertIn(self.user1, task.assigned_users.all())
+
+class TaskChangeModelTest(TestCase):
+    """Test suite for the TaskChange delta sync log."""
+
+    def setUp(self) -> None:
+        """Create a task assigned to one user."""
+        self.user = User.objects.create(username="changeuser", email="change@test.com")
+        self.task = Task.objects.create(name="Tracked", task_type="W")
+        self.task.assigned_users.add(self.user)
+
+    def test_writes_are_recorded(self) -> None:
+        """
+        Test assignments, updates and bulk removals are logged per user.
+
+        Verifies:
+        - assignment and update record upserts
+        - bulk removal records a tombstone
+        """
+        self.task.save()
+        Task.remove_assignments([(self.task.id, self.user.id)])
+        kinds = list(TaskChange.objects.filter(user=self.user).values_list('kind', flat=True))
+        self.assertEqual(kinds, ['U', 'U', 'R'])
+
+    def test_noop_assignments_are_not_recorded(self) -> None:
+        """
+        Test re-adding an existing pair or removing a missing one logs nothing.
+
+        Verifies:
+        - add_assignments skips pairs that are already assigned
+        - remove_assignments skips pairs that were never assigned
+        """
+        other = User.objects.create(username="otheruser", email="other@test.com")
+        before = TaskChange.objects.count()
+        self.assertEqual(Task.add_assignments([(self.task.id, self.user.id)]), 0)
+        self.assertEqual(Task.remove_assignments([(self.task.id, other.id)]), 0)
+        self.assertEqual(TaskChange.objects.count(), before)
+
+        self.assertEqual(Task.add_assignments([(self.task.id, self.user.id), (self.task.id, other.id)]), 1)
+        # The new assignee, then the existing one whose listing shows them
+        self.assertEqual(
+            list(TaskChange.objects.order_by('pk').values_list('user_id', flat=True)[before:]),
+            [other.id, self.user.id]
+        )
+
+    def test_user_saves_fan_out_only_rendered_changes(self) -> None:
+        """
+        Test saving a co-assigned user records changes only when rendered fields change.
+
+        Verifies:
+        - a password change or a save without changes records nothing
+          and leaves the task's updated_at alone
+        - a rename records an upsert for every assignee of the task
+        """
+        other = User.objects.create(username="coassignee", email="co@test.com")
+        self.task.assigned_users.add(other)
+        updated_at = Task.objects.get(pk=self.task.pk).updated_at
+        before = TaskChange.objects.count()
+
+        other = User.objects.get(pk=other.pk)
+        other.set_password('newpass123')
+        other.save()
+        other.save()
+        self.assertEqual(TaskChange.objects.count(), before)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).updated_at, updated_at)
+
+        other.first_name = 'Renamed'
+        other.save()
+        self.assertEqual(
+            set(TaskChange.objects.order_by('pk').values_list('user_id', flat=True)[before:]),
+            {self.user.id, other.id}
+        )
+        self.assertGreater(Task.objects.get(pk=self.task.pk).updated_at, updated_at)
+
+    def test_purge_command(self) -> None:
+        """
+        Test purge_task_changes deletes rows older than the retention.
+        """
+        TaskChange.objects.update(created_at=timezone.now() - timedelta(days=40))
+        self.task.save()
+        call_command('purge_task_changes', days=30, stdout=StringIO())
+        self.assertEqual(TaskChange.objects.count(), 1)
+
+
+class SeedTasksCommandTest(TestCase):
+    """Test suite for the seed_tasks management command."""
+
+    def _seed(self):
+        call_command(
+            'seed_tasks', tasks=50, assignments=200, users=20, chunk_size=20, seed=7, stdout=StringIO()
+        )
+        return sorted(
+            TaskAssignment.objects.values_list('task__name', 'user__username')
+        )
+
+    def test_seed_is_deterministic(self) -> None:
+        """
+        Test seeding creates the requested data and repeats with the same seed.
+
+        Verifies:
+        - task and seed user counts, and every task has an assignment
+        - the same seed gives the same tasks and assignments
+        """
+        first = self._seed()
+        self.assertEqual(Task.objects.count(), 50)
+        self.assertEqual(User.objects.filter(username__startswith='seed-user-').count(), 20)
+        self.assertFalse(Task.objects.filter(assigned_users__isnull=True).exists())
+        self.assertGreater(len(first), 50)
+
+        Task.objects.all().delete()
+        self.assertEqual(self._seed(), first)
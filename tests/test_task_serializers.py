@@ -90,6 +90,24 @@ class TaskCreateSerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn('task_type', serializer.errors)
 
+    def test_assigned_users_on_create(self) -> None:
+        """
+        Test optional assigned users on task creation.
+
+        Verifies:
+        - existing user IDs are assigned
+        - unknown user IDs are rejected
+        """
+        user = User.objects.create_user(username='create_assignee')
+        serializer = TaskCreateSerializer(data={'name': 'Assigned', 'assigned_users': [user.id]})
+        self.assertTrue(serializer.is_valid())
+        task = serializer.save()
+        self.assertEqual(list(task.assigned_users.all()), [user])
+
+        serializer = TaskCreateSerializer(data={'name': 'Assigned', 'assigned_users': [99999]})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('assigned_users', serializer.errors)
+
 class TaskAssignSerializerTest(TestCase):
     """Test suite for TaskAssignSerializer user assignment validation."""
 
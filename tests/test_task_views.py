@@ -1,9 +1,14 @@
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from tasks.models import Task
+from tasks.models import Task, TaskChange
 from users.models import User
 from django.utils import timezone
+from django.test import override_settings
+from django.core.management import call_command
+from datetime import timedelta
+from io import StringIO
 
 class TaskViewTests(APITestCase):
     """Test suite for core task management endpoints."""
@@ -153,4 +158,687 @@ class EdgeCaseTests(APITestCase):
         response = self.client.post(url, {'user_ids': [99999]}, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('99999', str(response.data))
-        self.assertEqual(task.assigned_users.count(), 0)
\ No newline at end of file
+        self.assertEqual(task.assigned_users.count(), 0)
+
+class TaskPaginationTests(APITestCase):
+    """Test suite for keyset pagination on the user task listing."""
+
+    def setUp(self) -> None:
+        """Create a user with five assigned tasks and authenticate."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='pageuser', password='pagepass')
+        self.tasks = []
+        for i in range(5):
+            task = Task.objects.create(name=f'Task {i}')
+            task.assigned_users.add(self.user)
+            self.tasks.append(task)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    def test_unpaginated_by_default(self) -> None:
+        """
+        Test the listing stays a full list without pagination parameters.
+
+        Verifies:
+        - All tasks and the total count are returned
+        - No next cursor is included
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tasks']), 5)
+        self.assertEqual(response.data['count'], 5)
+        self.assertNotIn('next', response.data)
+
+    def test_cursor_walks_all_pages(self) -> None:
+        """
+        Test following next cursors returns every task exactly once.
+
+        Verifies:
+        - Pages respect page_size
+        - Tasks are ordered by (created_at, id)
+        - The last page has no next cursor
+        """
+        seen = []
+        url = f'{self.url}?page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['tasks']), 2)
+            self.assertNotIn('count', response.data)
+            seen.extend(task['id'] for task in response.data['tasks'])
+            url = response.data['next']
+        self.assertEqual(seen, [task.id for task in self.tasks])
+
+    def test_optional_count(self) -> None:
+        """
+        Test the total is only computed when requested.
+
+        Verifies:
+        - count=true returns the exact total
+        - count=estimate returns the capped total
+        """
+        response = self.client.get(self.url, {'page_size': 2, 'count': 'true'})
+        self.assertEqual(response.data['count'], 5)
+        response = self.client.get(self.url, {'page_size': 2, 'count': 'estimate'})
+        self.assertEqual(response.data['count'], 5)
+
+    def test_invalid_cursor(self) -> None:
+        """
+        Test a malformed cursor is rejected.
+
+        Verifies:
+        - 404 Not Found status
+        """
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskListingQueryBudgetTests(APITestCase):
+    """Regression tests for the number of SQL queries used by the task listing."""
+
+    # Throttle counter + ETag fingerprint (also checks the user exists) + tasks + prefetched assigned users
+    QUERY_BUDGET = 4
+
+    def setUp(self) -> None:
+        """Create an authenticated user and a pool of users to assign."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='budgetuser', password='budgetpass')
+        self.others = [
+            User.objects.create_user(username=f'budget{i}', first_name='Budget', last_name=str(i))
+            for i in range(3)
+        ]
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    def _create_tasks(self, count: int) -> None:
+        """Create tasks assigned to the user and all other users."""
+        for i in range(count):
+            task = Task.objects.create(name=f'Budget Task {i}')
+            task.assigned_users.add(self.user, *self.others)
+
+    def test_listing_query_count_is_constant(self) -> None:
+        """
+        Test the listing does not issue a query per task.
+
+        Verifies:
+        - The query budget holds for small and large listings
+        - Nested assigned users are still rendered
+        """
+        for count in (2, 25):
+            with self.subTest(tasks=count):
+                Task.objects.all().delete()
+                self._create_tasks(count)
+                with self.assertNumQueries(self.QUERY_BUDGET):
+                    response = self.client.get(self.url)
+                self.assertEqual(len(response.data['tasks']), count)
+                self.assertEqual(len(response.data['tasks'][0]['assigned_users']), 4)
+
+    def test_paginated_listing_query_count(self) -> None:
+        """
+        Test a paginated page stays within the same query budget.
+        """
+        self._create_tasks(10)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            response = self.client.get(self.url, {'page_size': 5})
+        self.assertEqual(len(response.data['tasks']), 5)
+
+
+class TaskBulkCreateTests(APITestCase):
+    """Test suite for the bulk task creation endpoint."""
+
+    def setUp(self) -> None:
+        """Create and authenticate a user plus an assignee."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='bulkuser', password='bulkpass')
+        self.assignee = User.objects.create_user(username='assignee', password='assigneepass')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('task-bulk-create')
+
+    def test_bulk_create_with_assignments(self) -> None:
+        """
+        Test creating a batch of tasks with per-item assignments.
+
+        Verifies:
+        - 201 status with one created entry per item
+        - assignments are written to the through table
+        - the number of queries does not grow with the batch size
+        """
+        data = [
+            {'name': f'Bulk {i}', 'task_type': 'W', 'assigned_users': [self.assignee.id]}
+            for i in range(50)
+        ]
+        with self.assertNumQueries(7):  # throttle, users check, savepoint, tasks, assignments, changes, release
+            response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['created']), 50)
+        self.assertEqual(self.assignee.tasks.count(), 50)
+
+    def test_partial_batch(self) -> None:
+        """
+        Test invalid items are reported without aborting the batch.
+
+        Verifies:
+        - 207 status code
+        - valid items are created, invalid ones reported by index
+        """
+        data = [
+            {'name': 'Good', 'task_type': 'W'},
+            {'name': 'Bad type', 'task_type': 'X'},
+            {'name': 'Missing user', 'assigned_users': [99999]},
+        ]
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([item['index'] for item in response.data['created']], [0])
+        self.assertEqual([item['index'] for item in response.data['errors']], [1, 2])
+        self.assertEqual(Task.objects.filter(name='Good').count(), 1)
+
+    def test_atomic_batch(self) -> None:
+        """
+        Test atomic=true rejects the whole batch on any invalid item.
+
+        Verifies:
+        - 400 status code
+        - no tasks are created
+        """
+        data = [
+            {'name': 'Good', 'task_type': 'W'},
+            {'name': 'Bad type', 'task_type': 'X'},
+        ]
+        response = self.client.post(f'{self.url}?atomic=true', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.exists())
+
+
+class TaskBulkAssignTests(APITestCase):
+    """Test suite for bulk assignment and unassignment across tasks."""
+
+    def setUp(self) -> None:
+        """Create users and tasks, with one pre-existing assignment."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='assigner', password='assignerpass')
+        self.members = [User.objects.create_user(username=f'member{i}') for i in range(3)]
+        self.tasks = [Task.objects.create(name=f'Shared {i}') for i in range(3)]
+        self.tasks[0].assigned_users.add(self.members[0])
+        self.client.force_authenticate(user=self.user)
+
+    def _mapping(self) -> dict:
+        """Assign every member to every task."""
+        return {
+            'assignments': {
+                str(task.id): [member.id for member in self.members] for task in self.tasks
+            }
+        }
+
+    def test_bulk_assign(self) -> None:
+        """
+        Test assigning many users across many tasks.
+
+        Verifies:
+        - 200 status code
+        - existing assignments are kept without duplicates
+        - one query per table for validation and one insert
+        """
+        url = reverse('task-bulk-assign')
+        with self.assertNumQueries(11):  # throttle, tasks, users, savepoint, existing, assignments, changes, touch, co-assignees, their changes, release
+            response = self.client.post(url, self._mapping(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for task in self.tasks:
+            self.assertEqual(task.assigned_users.count(), 3)
+
+    def test_bulk_unassign(self) -> None:
+        """
+        Test removing users from many tasks.
+
+        Verifies:
+        - 200 status code
+        - removed count matches the existing assignments
+        """
+        url = reverse('task-bulk-unassign')
+        response = self.client.post(url, self._mapping(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['removed'], 1)
+        self.assertFalse(self.tasks[0].assigned_users.exists())
+
+    def test_unknown_ids_rejected(self) -> None:
+        """
+        Test unknown task or user IDs reject the whole batch.
+
+        Verifies:
+        - 400 status code
+        - missing IDs are reported
+        - no assignments are written
+        """
+        url = reverse('task-bulk-assign')
+        data = {'assignments': {str(self.tasks[1].id): [99999], '88888': [self.members[1].id]}}
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('99999', str(response.data))
+        self.assertIn('88888', str(response.data))
+        self.assertFalse(self.tasks[1].assigned_users.exists())
+
+
+class TaskListFilterTests(APITestCase):
+    """Test suite for filtering and ordering the user task listing."""
+
+    def setUp(self) -> None:
+        """Create tasks with different statuses, types and dates."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='filteruser', password='filterpass')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+        specs = [
+            ('Pending work', 'P', 'W', None),
+            ('Pending personal', 'P', 'P', None),
+            ('Done work', 'C', 'W', timezone.now()),
+            ('In progress work', 'I', 'W', None),
+        ]
+        self.tasks = {}
+        for name, task_status, task_type, completed_at in specs:
+            task = Task.objects.create(
+                name=name, status=task_status, task_type=task_type, completed_at=completed_at
+            )
+            task.assigned_users.add(self.user)
+            self.tasks[name] = task
+
+    def _names(self, response) -> list:
+        """Task names in response order."""
+        return [task['name'] for task in response.data['tasks']]
+
+    def test_status_and_type_filters(self) -> None:
+        """
+        Test filtering by status and task type.
+
+        Verifies:
+        - only matching tasks are returned
+        - comma-separated values are accepted
+        """
+        response = self.client.get(self.url, {'status': 'P', 'task_type': 'W'})
+        self.assertEqual(self._names(response), ['Pending work'])
+        response = self.client.get(self.url, {'status': 'P,I', 'task_type': 'W'})
+        self.assertEqual(self._names(response), ['Pending work', 'In progress work'])
+
+    def test_date_range_filters(self) -> None:
+        """
+        Test filtering by completed_at and created_at ranges.
+
+        Verifies:
+        - completed_after matches completed tasks only
+        - created_before in the past matches nothing
+        """
+        today = timezone.now().date().isoformat()
+        response = self.client.get(self.url, {'completed_after': today})
+        self.assertEqual(self._names(response), ['Done work'])
+        response = self.client.get(self.url, {'created_before': '2000-01-01'})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_descending_ordering_with_pagination(self) -> None:
+        """
+        Test -created_at ordering, including across cursor pages.
+
+        Verifies:
+        - newest tasks come first
+        - following next cursors keeps the descending order
+        """
+        seen = []
+        url = f'{self.url}?ordering=-created_at&page_size=3'
+        while url:
+            response = self.client.get(url)
+            seen.extend(self._names(response))
+            url = response.data['next']
+        self.assertEqual(seen, list(reversed(list(self.tasks))))
+
+    def test_invalid_filters(self) -> None:
+        """
+        Test invalid filter values are rejected.
+
+        Verifies:
+        - 400 status code for each invalid parameter
+        """
+        for params in ({'status': 'X'}, {'created_after': 'yesterday'}, {'ordering': 'name'}):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskListCacheTests(APITestCase):
+    """Test suite for the per-user task listing cache and its invalidation."""
+
+    def setUp(self) -> None:
+        """Create a user with one task, a teammate, and warm the cache."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='cacheuser', password='cachepass')
+        self.teammate = User.objects.create_user(username='teammate', first_name='Team')
+        self.task = Task.objects.create(name='Cached Task')
+        self.task.assigned_users.add(self.user, self.teammate)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_repeat_listing_is_served_from_cache(self) -> None:
+        """
+        Test an unchanged listing is served without loading any task.
+
+        Verifies:
+        - X-Cache HIT header
+        - only the throttle counter and ETag fingerprint queries run
+        - different query strings are cached separately
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(self.client.get(self.url, {'status': 'C'})['X-Cache'], 'MISS')
+
+    def test_writes_invalidate_listing(self) -> None:
+        """
+        Test every kind of write invalidates the affected listing.
+
+        Cases tested:
+        - Assignment through the API
+        - Task update
+        - Profile change of a co-assigned user
+        - Bulk unassignment
+        """
+        new_task = Task.objects.create(name='New Task')
+        self.client.post(
+            reverse('task-assign', kwargs={'pk': new_task.id}),
+            {'user_ids': [self.user.id]},
+            format='json'
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 2)
+
+        self.task.status = 'C'
+        self.task.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['tasks'][0]['status'], 'C')
+
+        self.teammate.first_name = 'Renamed'
+        self.teammate.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('Renamed', str(response.data['tasks'][0]['assigned_users']))
+
+        self.client.post(
+            reverse('task-bulk-unassign'),
+            {'assignments': {str(new_task.id): [self.user.id]}},
+            format='json'
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 1)
+
+    def test_co_assignee_changes_invalidate_listing(self) -> None:
+        """
+        Test (un)assigning another user on a shared task invalidates the listing.
+
+        Cases tested:
+        - Assignment of a new user through the API
+        - Bulk unassignment of the teammate
+        - Unassignment through the related manager
+        """
+        newcomer = User.objects.create_user(username='newcomer', first_name='New')
+        self.client.post(
+            reverse('task-assign', kwargs={'pk': self.task.id}),
+            {'user_ids': [newcomer.id]},
+            format='json'
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn('newcomer', str(response.data['tasks'][0]['assigned_users']))
+
+        self.client.post(
+            reverse('task-bulk-unassign'),
+            {'assignments': {str(self.task.id): [self.teammate.id]}},
+            format='json'
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertNotIn('teammate', str(response.data['tasks'][0]['assigned_users']))
+
+        newcomer.tasks.remove(self.task)
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data['tasks'][0]['assigned_users']), 1)
+
+    def test_other_users_listing_not_invalidated(self) -> None:
+        """
+        Test a write only invalidates the users it touches.
+        """
+        other = User.objects.create_user(username='unrelated')
+        Task.objects.create(name='Unrelated').assigned_users.add(other)
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'HIT')
+
+    def test_stats_endpoint(self) -> None:
+        """
+        Test cache counters are exposed to staff only.
+
+        Verifies:
+        - 403 for regular users
+        - counters for staff
+        """
+        url = reverse('task-cache-stats')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(user=User.objects.create_user(username='staff', is_staff=True))
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('hit_rate', response.data['stats'])
+
+
+class TaskListETagTests(APITestCase):
+    """Test suite for conditional GETs on the user task listing."""
+
+    def setUp(self) -> None:
+        """Create a user with one task and fetch the initial ETag."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='etaguser', password='etagpass')
+        self.task = Task.objects.create(name='ETag Task')
+        self.task.assigned_users.add(self.user)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+        self.etag = self.client.get(self.url)['ETag']
+
+    def _conditional_get(self, **params):
+        """GET the listing with the initial ETag."""
+        return self.client.get(self.url, params, HTTP_IF_NONE_MATCH=self.etag)
+
+    def test_unchanged_listing_returns_304(self) -> None:
+        """
+        Test a matching If-None-Match short-circuits the listing.
+
+        Verifies:
+        - 304 status with the same ETag and no body
+        - only the throttle counter and ETag fingerprint queries run
+        """
+        with self.assertNumQueries(2):
+            response = self._conditional_get()
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], self.etag)
+        self.assertFalse(response.content)
+
+    def test_deleted_user_is_not_modified_404(self) -> None:
+        """
+        Test a stale If-None-Match for a deleted user is not answered with 304.
+
+        Verifies:
+        - 404 status once the user is gone, even with the previous ETag
+        """
+        self.client.force_authenticate(user=User.objects.create_user(username='viewer'))
+        self.task.assigned_users.clear()
+        self.etag = self.client.get(self.url)['ETag']
+        self.user.delete()
+        self.assertEqual(self._conditional_get().status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_changes_produce_new_etag(self) -> None:
+        """
+        Test task updates and assignment changes change the ETag.
+
+        Cases tested:
+        - Different query string
+        - Task update
+        - New assignment
+        - Unassignment
+        """
+        self.assertEqual(self._conditional_get(status='P').status_code, status.HTTP_200_OK)
+
+        self.task.status = 'I'
+        self.task.save()
+        response = self._conditional_get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], self.etag)
+
+        self.etag = response['ETag']
+        other = Task.objects.create(name='Other Task')
+        other.assigned_users.add(self.user)
+        response = self._conditional_get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.etag = response['ETag']
+        other.assigned_users.remove(self.user)
+        self.assertEqual(self._conditional_get().status_code, status.HTTP_200_OK)
+
+
+    def test_co_assignee_changes_produce_new_etag(self) -> None:
+        """
+        Test (un)assigning another user on the user's task changes the ETag.
+
+        Cases tested:
+        - Assignment of a second user through the API
+        - Bulk unassignment of that user
+        - Assignment through the reverse related manager
+        """
+        second = User.objects.create_user(username='seconduser')
+        self.client.post(
+            reverse('task-assign', kwargs={'pk': self.task.id}),
+            {'user_ids': [second.id]},
+            format='json'
+        )
+        response = self._conditional_get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], self.etag)
+
+        self.etag = response['ETag']
+        Task.remove_assignments([(self.task.id, second.id)])
+        response = self._conditional_get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.etag = response['ETag']
+        second.tasks.add(self.task)
+        self.assertEqual(self._conditional_get().status_code, status.HTTP_200_OK)
+
+
+class UserTaskChangesTests(APITestCase):
+    """Test suite for delta sync of a user's task listing."""
+
+    def setUp(self) -> None:
+        """Create a user with two tasks and take an initial snapshot."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.user = User.objects.create_user(username='syncuser', password='syncpass')
+        self.tasks = [Task.objects.create(name=f'Sync {i}') for i in range(2)]
+        for task in self.tasks:
+            task.assigned_users.add(self.user)
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-task-changes', kwargs={'user_id': self.user.id})
+
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['changed']), 2)
+        self.token = response.data['sync_token']
+
+    def _sync(self, **params):
+        """Fetch changes since the current token and advance it."""
+        response = self.client.get(self.url, {'since': self.token, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.token = response.data['sync_token']
+        return response.data
+
+    def test_no_changes(self) -> None:
+        """
+        Test a steady-state sync returns nothing.
+        """
+        data = self._sync()
+        self.assertEqual((data['changed'], data['removed']), ([], []))
+
+    def test_updates_assignments_and_tombstones(self) -> None:
+        """
+        Test updates, new assignments, unassignments and deletes are reported.
+
+        Verifies:
+        - updated and newly assigned tasks are in changed
+        - unassigned and deleted tasks are in removed
+        - a second sync after that is empty
+        """
+        self.tasks[0].status = 'C'
+        self.tasks[0].save()
+        new_task = Task.objects.create(name='Sync new')
+        new_task.assigned_users.add(self.user)
+        data = self._sync()
+        self.assertEqual({task['id'] for task in data['changed']}, {self.tasks[0].id, new_task.id})
+        self.assertEqual(data['removed'], [])
+
+        self.tasks[0].assigned_users.remove(self.user)
+        removed_id = self.tasks[1].id
+        self.tasks[1].delete()
+        data = self._sync()
+        self.assertEqual(data['changed'], [])
+        self.assertEqual(data['removed'], sorted([self.tasks[0].id, removed_id]))
+        self.assertEqual(self._sync()['removed'], [])
+
+    def test_co_assignee_changes_are_reported(self) -> None:
+        """
+        Test (un)assigning another user on the user's task is reported.
+
+        Verifies:
+        - assigning a second user reports the task as changed
+        - unassigning that user reports it as changed, not removed
+        - the same holds for the related managers
+        """
+        second = User.objects.create_user(username='syncsecond')
+        Task.add_assignments([(self.tasks[0].id, second.id)])
+        data = self._sync()
+        self.assertEqual([task['id'] for task in data['changed']], [self.tasks[0].id])
+        self.assertEqual(len(data['changed'][0]['assigned_users']), 2)
+
+        Task.remove_assignments([(self.tasks[0].id, second.id)])
+        data = self._sync()
+        self.assertEqual([task['id'] for task in data['changed']], [self.tasks[0].id])
+        self.assertEqual(data['removed'], [])
+
+        second.tasks.add(self.tasks[1])
+        self.assertEqual([task['id'] for task in self._sync()['changed']], [self.tasks[1].id])
+        self.tasks[1].assigned_users.remove(second)
+        data = self._sync()
+        self.assertEqual(([task['id'] for task in data['changed']], data['removed']), ([self.tasks[1].id], []))
+
+    def test_limit_pages_through_changes(self) -> None:
+        """
+        Test has_more is set when changes exceed the limit.
+        """
+        for task in self.tasks:
+            task.save()
+        data = self._sync(limit=1)
+        self.assertTrue(data['has_more'])
+        data = self._sync(limit=1)
+        self.assertFalse(data['has_more'])
+
+    def test_invalid_and_expired_tokens(self) -> None:
+        """
+        Test malformed tokens give 400 and expired tokens 410.
+
+        Verifies:
+        - a freshly issued token whose position precedes purged changes is expired
+        - a new initial sync returns a usable token
+        """
+        response = self.client.get(self.url, {'since': 'garbage'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.tasks[0].save()
+        TaskChange.objects.update(created_at=timezone.now() - timedelta(days=40))
+        call_command('purge_task_changes', days=30, stdout=StringIO())
+        response = self.client.get(self.url, {'since': self.token})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+        self.token = self.client.get(self.url).data['sync_token']
+        self.assertEqual(self._sync()['changed'], [])
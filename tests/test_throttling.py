@@ -0,0 +1,133 @@
+from io import StringIO
+from unittest import mock
+from django.db import connection
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.settings import api_settings
+from rest_framework.test import APITestCase
+from throttling.models import ThrottleCounter
+from users.models import User
+
+
+class ThrottleCounterTest(TestCase):
+    """Test suite for the shared sliding-window counter."""
+
+    def test_sliding_window(self) -> None:
+        """
+        Test requests are limited across the current and previous window.
+
+        Verifies:
+        - requests up to the limit pass, the next one is rejected
+        - the previous window's count is weighted by how much of it overlaps
+        - a gap of two windows resets the counter
+        """
+        for _ in range(3):
+            self.assertTrue(ThrottleCounter.hit('k', 3, 60, now=600)[0])
+        allowed, wait = ThrottleCounter.hit('k', 3, 60, now=630)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 30 + 60 * (1 - 2 / 3))
+
+        # Halfway into the next window: 3 previous requests at half weight + 1 = 2.5
+        self.assertTrue(ThrottleCounter.hit('k', 3, 60, now=690)[0])
+        self.assertFalse(ThrottleCounter.hit('k', 3, 60, now=690)[0])
+
+        self.assertTrue(ThrottleCounter.hit('k', 3, 60, now=900)[0])
+        counter = ThrottleCounter.objects.get(key='k')
+        self.assertEqual((counter.current_count, counter.previous_count), (1, 0))
+
+    def test_retrying_client_is_not_locked_out(self) -> None:
+        """
+        Test a client that keeps retrying while throttled still gets through.
+
+        Verifies:
+        - rejected requests are not counted
+        - a steady over-limit client gets about ``limit`` requests per window
+        """
+        allowed_per_window = {}
+        for tick in range(0, 600):  # One request per second against 10/minute
+            if ThrottleCounter.hit('retry', 10, 60, now=6000 + tick)[0]:
+                window = tick // 60
+                allowed_per_window[window] = allowed_per_window.get(window, 0) + 1
+        self.assertEqual(set(allowed_per_window), set(range(10)))
+        for window, allowed in allowed_per_window.items():
+            self.assertLessEqual(allowed, 10)
+            self.assertGreaterEqual(allowed, 5 if window else 10)
+        self.assertLessEqual(ThrottleCounter.objects.get(key='retry').current_count, 10)
+
+    def test_purge_removes_stale_counters(self) -> None:
+        """
+        Test purge_throttle_counters deletes rows two windows old.
+        """
+        ThrottleCounter.hit('old', 10, 60, now=0)
+        ThrottleCounter.hit('recent', 10, 60, now=100)
+        ThrottleCounter.hit('hourly', 10, 3600, now=0)
+        self.assertEqual(ThrottleCounter.purge(now=119), 0)
+        self.assertEqual(ThrottleCounter.purge(now=120), 1)
+        self.assertEqual(
+            set(ThrottleCounter.objects.values_list('key', flat=True)), {'recent', 'hourly'}
+        )
+        out = StringIO()
+        call_command('purge_throttle_counters', stdout=out)
+        self.assertIn('Removed 2', out.getvalue())
+
+    def test_one_row_per_key(self) -> None:
+        """Test each check updates the same row with a single query."""
+        ThrottleCounter.hit('a', 10, 60, now=0)
+        with self.assertNumQueries(1):
+            ThrottleCounter.hit('a', 10, 60, now=1)
+        ThrottleCounter.hit('b', 10, 60, now=1)
+        self.assertEqual(ThrottleCounter.objects.count(), 2)
+        self.assertEqual(ThrottleCounter.objects.get(key='a').current_count, 2)
+
+
+class ThrottleCounterWithoutReturningTest(ThrottleCounterTest):
+    """
+    The same suite on the UPDATE-then-SELECT path used by SQLite < 3.35,
+    which has no RETURNING.
+    """
+
+    def setUp(self) -> None:
+        """Report the database as unable to return columns from INSERT."""
+        patcher = mock.patch.object(connection.features, 'can_return_columns_from_insert', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_row_per_key(self) -> None:
+        """Test each allowed check of an existing key is a single UPDATE."""
+        ThrottleCounter.hit('a', 10, 60, now=0)
+        with self.assertNumQueries(3):  # savepoint, update, release
+            ThrottleCounter.hit('a', 10, 60, now=1)
+        ThrottleCounter.hit('b', 10, 60, now=1)
+        self.assertEqual(ThrottleCounter.objects.count(), 2)
+        self.assertEqual(ThrottleCounter.objects.get(key='a').current_count, 2)
+
+
+class ScopedThrottleTest(APITestCase):
+    """Test suite for per-scope rates on the task views."""
+
+    def setUp(self) -> None:
+        """Create an authenticated user."""
+        self.user = User.objects.create_user(username='throttleduser', password='throttledpass')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user-tasks', kwargs={'user_id': self.user.id})
+
+    @override_settings(REST_FRAMEWORK={
+        'DEFAULT_THROTTLE_RATES': {'anon': '50/minute', 'user': '50/minute', 'tasks': '2/minute'},
+    })
+    def test_task_views_use_tasks_rate(self) -> None:
+        """
+        Test views with throttle_scope = 'tasks' get the 'tasks' rate.
+
+        Verifies:
+        - the third request in a minute is rejected with the custom 429 body
+        - the counter is keyed by the scope
+        """
+        self.assertEqual(api_settings.DEFAULT_THROTTLE_RATES['tasks'], '2/minute')
+        for _ in range(2):
+            self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertTrue(ThrottleCounter.objects.filter(key=f'throttle_tasks_{self.user.pk}').exists())
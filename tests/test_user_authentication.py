@@ -0,0 +1,135 @@
+import time
+from unittest import mock
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+from users.authentication import CachedJWTAuthentication, VerifiedTokenCache, verified_token_cache
+from users.models import User
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """Test suite for JWT authentication with a cached user lookup."""
+
+    def setUp(self) -> None:
+        """Create a user and a request carrying their access token."""
+        caches['auth'].clear()
+        self.user = User.objects.create_user(username='cacheduser', password='cachedpass123')
+        self.authenticator = CachedJWTAuthentication()
+        self.request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}'
+        )
+
+    def test_user_is_loaded_once(self) -> None:
+        """
+        Test repeated requests reuse the cached user.
+
+        Verifies:
+        - first request runs one query
+        - later requests run none
+        """
+        with self.assertNumQueries(1):
+            user, _ = self.authenticator.authenticate(self.request)
+        with self.assertNumQueries(0):
+            cached, _ = self.authenticator.authenticate(self.request)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(cached.pk, self.user.pk)
+
+    def test_deactivation_takes_effect_immediately(self) -> None:
+        """
+        Test saving the user drops the cached row.
+        """
+        self.authenticator.authenticate(self.request)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticator.authenticate(self.request)
+
+    def test_deleted_user_is_rejected(self) -> None:
+        """
+        Test a deleted user cannot authenticate with a cached entry.
+        """
+        self.authenticator.authenticate(self.request)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticator.authenticate(self.request)
+
+    async def test_async_lookup_uses_the_cache(self) -> None:
+        """
+        Test aauthenticate() resolves the same user through the cache.
+        """
+        user, _ = await self.authenticator.aauthenticate(self.request)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual((await caches['auth'].aget(f'auth:user:{self.user.pk}')).pk, self.user.pk)
+
+
+class VerifiedTokenCacheTest(APITestCase):
+    """Test suite for the in-process cache of verified access tokens."""
+
+    def setUp(self) -> None:
+        """Create a user and reset the shared token cache."""
+        caches['auth'].clear()
+        verified_token_cache.clear()
+        verified_token_cache.reset_stats()
+        self.user = User.objects.create_user(username='tokenuser', password='tokenpass123')
+
+    def test_signature_is_verified_once(self) -> None:
+        """
+        Test a repeated token skips decoding and signature verification.
+
+        Verifies:
+        - the token backend decodes the token once
+        - the repeat is counted as a hit
+        """
+        request = APIRequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}'
+        )
+        authenticator = CachedJWTAuthentication()
+        with mock.patch.object(TokenBackend, 'decode', autospec=True,
+                               side_effect=TokenBackend.decode) as decode:
+            for _ in range(3):
+                user, _ = authenticator.authenticate(request)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(verified_token_cache.stats()['hits'], 2)
+
+    def test_lru_eviction_and_expiry(self) -> None:
+        """
+        Test the cache is bounded and never returns expired tokens.
+
+        Verifies:
+        - least recently used entries are evicted first
+        - an expired entry is a miss and is removed
+        """
+        tokens = VerifiedTokenCache(maxsize=2)
+        valid = {'exp': time.time() + 60}
+        tokens.set(b'a', valid)
+        tokens.set(b'b', valid)
+        tokens.get(b'a')
+        tokens.set(b'c', valid)
+        self.assertIsNone(tokens.get(b'b'))
+        self.assertIs(tokens.get(b'a'), valid)
+        self.assertEqual(tokens.stats()['evictions'], 1)
+
+        tokens.set(b'old', {'exp': time.time() - 1})
+        self.assertIsNone(tokens.get(b'old'))
+        self.assertEqual(tokens.stats()['size'], 1)  # 'old' evicted 'c', then expired
+
+    def test_stats_endpoint_is_staff_only(self) -> None:
+        """
+        Test the token cache stats endpoint requires a staff user.
+        """
+        url = reverse('token-cache-stats')
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('hit_rate', response.data['stats'])
@@ -94,3 +94,40 @@ class UserModelTest(TestCase):
         user = User.objects.create_user(**self.valid_data)
         self.assertTrue(check_password(raw_password, user.password))
         self.assertNotEqual(raw_password, user.password)
+
+    def test_has_changed(self) -> None:
+        """
+        Test change tracking against the loaded and last saved values
+
+        Verifies:
+        - A loaded user is unchanged until a field is set to a new value
+        - Saving makes the saved values the new baseline
+        - Deferred fields that were never set are unchanged
+        """
+        User.objects.create_user(**self.valid_data)
+        user = User.objects.get(username='testuser')
+        self.assertFalse(user.has_changed('first_name', 'email'))
+        user.first_name = 'Test'
+        self.assertFalse(user.has_changed('first_name'))
+        user.first_name = 'Renamed'
+        self.assertTrue(user.has_changed('first_name', 'email'))
+        user.save()
+        self.assertFalse(user.has_changed('first_name'))
+
+        user = User.objects.only('id', 'username').get(username='testuser')
+        self.assertFalse(user.has_changed('first_name'))
+        user.first_name = 'Again'
+        self.assertTrue(user.has_changed('first_name'))
+
+    def test_with_email_uses_upper_index(self) -> None:
+        """
+        Test the case-insensitive email lookup
+
+        Verifies:
+        - Emails match regardless of case
+        - The lookup is served by user_email_upper_idx
+        """
+        user = User.objects.create_user(**self.valid_data)
+        self.assertEqual(list(User.with_email('TEST@Example.com')), [user])
+        self.assertFalse(User.with_email('other@example.com').exists())
+        self.assertIn('user_email_upper_idx', User.with_email('test@example.com').explain())
@@ -1,9 +1,17 @@
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from users.models import User
 from django.utils import timezone
 from django.test import override_settings
+from django.contrib.auth.hashers import check_password, PBKDF2PasswordHasher
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from unittest import mock
+from io import StringIO
+import time
+from django.core.management import call_command
+from users.blacklist import token_blacklist
 
 class AuthViewTests(APITestCase):
     """Test suite for authentication-related API endpoints."""
@@ -153,4 +161,250 @@ class AuthViewTests(APITestCase):
             'password': 'wrongpassword'  # Incorrect
         }
         response = self.client.post(url, data)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_login_verifies_password_once(self) -> None:
+        """
+        Test a login runs the password hasher exactly once.
+
+        Verifies:
+        - 200 status code
+        - check_password called a single time
+        - one token pair with the custom claims is returned
+        """
+        url = reverse('token_obtain_pair')
+        data = {
+            'username': 'testuser',
+            'password': 'testpass123'
+        }
+        with mock.patch('django.contrib.auth.base_user.check_password', wraps=check_password) as checker:
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(checker.call_count, 1)
+
+        tokens = response.data['tokens']
+        self.assertEqual(set(tokens), {'refresh', 'access', 'user'})
+        access = AccessToken(tokens['access'])
+        self.assertEqual(access['email'], 'test@example.com')
+        self.assertEqual(access['name'], 'Test User')
+        self.assertEqual(tokens['user']['id'], self.user.id)
+
+    def test_registration_hashes_password_once(self) -> None:
+        """
+        Test registration hashes the password and writes the user once.
+
+        Verifies:
+        - 201 status code
+        - the password hasher runs a single time
+        - stored password validates
+        """
+        url = reverse('user-register')
+        data = {
+            'username': 'hashonce',
+            'password': 'newpass123',
+            'password2': 'newpass123',
+            'email': 'hashonce@example.com',
+            'first_name': 'Hash',
+            'last_name': 'Once'
+        }
+        encode = PBKDF2PasswordHasher.encode
+        with mock.patch.object(PBKDF2PasswordHasher, 'encode', autospec=True, side_effect=encode) as hasher:
+            response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(hasher.call_count, 1)
+        self.assertTrue(User.objects.get(username='hashonce').check_password('newpass123'))
+
+
+class BulkRegistrationTests(APITestCase):
+    """Test suite for the staff-only bulk onboarding endpoint."""
+
+    def setUp(self) -> None:
+        """Create a staff user and the endpoint URL."""
+        cache.clear()  # Cached listings and users outlive each test
+        self.admin = User.objects.create_user(username='admin', password='adminpass', is_staff=True)
+        self.url = reverse('user-register-bulk')
+
+    def _payload(self, index: int) -> dict:
+        """Build one valid registration item."""
+        return {
+            'username': f'bulk{index}',
+            'password': 'bulkpass123',
+            'password2': 'bulkpass123',
+            'email': f'bulk{index}@example.com',
+            'first_name': 'Bulk',
+            'last_name': str(index)
+        }
+
+    def test_bulk_registration(self) -> None:
+        """
+        Test staff can register several users in one request.
+
+        Verifies:
+        - 201 status code
+        - every user is created with a usable password
+        """
+        self.client.force_authenticate(user=self.admin)
+        data = [self._payload(i) for i in range(3)]
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['users']), 3)
+        self.assertTrue(User.objects.get(username='bulk2').check_password('bulkpass123'))
+
+    def test_duplicate_in_batch_rejected(self) -> None:
+        """
+        Test a batch with duplicate emails is rejected as a whole.
+
+        Verifies:
+        - 400 status code
+        - no users from the batch are created
+        """
+        self.client.force_authenticate(user=self.admin)
+        first, second = self._payload(1), self._payload(2)
+        second['email'] = first['email'].upper()
+        response = self.client.post(self.url, [first, second], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.filter(username__startswith='bulk').exists())
+
+    def test_existing_users_checked_in_one_query(self) -> None:
+        """
+        Test uniqueness against existing users does not scale with batch size.
+
+        Verifies:
+        - items clashing with existing users get per-item errors
+        - a batch of 2 and a batch of 10 run the same number of queries
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        User.objects.create_user(username='taken', email='taken@example.com', mobile='+1234567890')
+        self.client.force_authenticate(user=self.admin)
+        clash = self._payload(99)
+        clash.update(username='taken', email='TAKEN@example.com', mobile='+1234567890')
+
+        counts = []
+        for size in (2, 10):
+            data = [self._payload(i) for i in range(size)] + [clash]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(self.url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(set(response.data['non_field_errors'][-1]), {'username', 'email', 'mobile'})
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_concurrent_registration_returns_400(self) -> None:
+        """
+        Test a user inserted between validation and bulk_create is a 400.
+
+        Verifies:
+        - the IntegrityError from bulk_create becomes a 400, not a 500
+        - no users from the batch are created
+        """
+        from users.serializers import UserRegistrationSerializer
+
+        build_user = UserRegistrationSerializer.build_user
+
+        def racing_build_user(serializer, validated_data):
+            if not User.objects.filter(username='bulk1').exists():
+                User.objects.create_user(username='bulk1', password='racepass123')
+            return build_user(serializer, validated_data)
+
+        self.client.force_authenticate(user=self.admin)
+        with mock.patch.object(UserRegistrationSerializer, 'build_user', autospec=True,
+                               side_effect=racing_build_user):
+            response = self.client.post(self.url, [self._payload(i) for i in range(3)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(User.objects.filter(username__startswith='bulk').values_list('username', flat=True)), ['bulk1'])
+
+    def test_requires_staff(self) -> None:
+        """
+        Test non-staff users cannot bulk register.
+
+        Verifies:
+        - 403 status code
+        """
+        user = User.objects.create_user(username='regular', password='regularpass')
+        self.client.force_authenticate(user=user)
+        response = self.client.post(self.url, [self._payload(1)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TokenRefreshBlacklistTests(APITestCase):
+    """Test suite for refresh token rotation with the table-backed blacklist."""
+
+    def setUp(self) -> None:
+        """Create a user and a refresh token for them."""
+        cache.clear()
+        self.user = User.objects.create_user(username='refreshuser', password='refreshpass123')
+        self.refresh = str(RefreshToken.for_user(self.user))
+        self.url = reverse('token_refresh')
+
+    def test_rotated_token_is_blacklisted(self) -> None:
+        """
+        Test a refresh token cannot be used again after rotation.
+
+        Verifies:
+        - first refresh returns a new access and refresh token
+        - reusing the old refresh token returns 401
+        - the rotated refresh token still works
+        """
+        response = self.client.post(self.url, {'refresh': self.refresh})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        rotated = response.data['refresh']
+        self.assertNotEqual(rotated, self.refresh)
+
+        response = self.client.post(self.url, {'refresh': self.refresh})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.post(self.url, {'refresh': rotated})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh_query_budget(self) -> None:
+        """
+        Test a refresh checks and revokes the token with one query each.
+
+        Besides the anon and user throttle counters and simplejwt's
+        active-user lookup, only the blacklist SELECT and the INSERT (in a
+        savepoint) run; simplejwt's outstanding token tables are not used.
+        """
+        with self.assertNumQueries(7):
+            response = self.client.post(self.url, {'refresh': self.refresh})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_blacklist_survives_cache_eviction(self) -> None:
+        """
+        Test a revoked token stays revoked when the default cache fills up.
+
+        Verifies:
+        - 400 unrelated cache entries (past locmem's MAX_ENTRIES) do not
+          make the rotated token usable again
+        """
+        response = self.client.post(self.url, {'refresh': self.refresh})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for index in range(400):
+            cache.set(f'filler:{index}', index)
+        response = self.client.post(self.url, {'refresh': self.refresh})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_blacklist_add_is_atomic_and_purged(self) -> None:
+        """
+        Test the blacklist rejects a second insert and purges expired entries.
+
+        Verifies:
+        - add() returns False for a revoked JTI
+        - purge_token_blacklist removes entries once their tokens expired
+        """
+        exp = int(time.time()) + 60
+        self.assertTrue(token_blacklist.add('jti-1', exp))
+        self.assertFalse(token_blacklist.add('jti-1', exp))
+        self.assertTrue(token_blacklist.contains('jti-1'))
+
+        self.assertEqual(token_blacklist.purge(now=time.time()), 0)
+        self.assertTrue(token_blacklist.contains('jti-1'))
+
+        self.assertEqual(token_blacklist.purge(now=exp), 1)
+        self.assertFalse(token_blacklist.contains('jti-1'))
+
+        out = StringIO()
+        call_command('purge_token_blacklist', stdout=out)
+        self.assertIn('Removed 0', out.getvalue())
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from throttling.models import ThrottleCounter
+
+
+class Command(BaseCommand):
+    """
+    Delete throttle counters that no longer affect any decision.
+
+    Every throttle key (scope plus user ID or client IP) keeps one row, so
+    anonymous clients alone add a row per IP address. A row whose window is
+    two or more windows old counts as empty and is recreated on the key's
+    next request. Run this periodically (e.g. hourly from cron).
+    """
+
+    help = "Delete ThrottleCounter rows whose windows have expired"
+
+    def handle(self, *args, **options):
+        removed = ThrottleCounter.purge()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} stale throttle counters"))
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('throttling', '0001_initial'),
+    ]
+
+    operations = [
+        # Existing rows get 0, which makes them stale for purge_throttle_counters
+        migrations.AddField(
+            model_name='throttlecounter',
+            name='duration',
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+    ]
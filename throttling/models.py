@@ -0,0 +1,223 @@
+import time
+from typing import Optional, Tuple
+from django.db import connection, models, transaction
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Value, When
+
+
+class ThrottleCounter(models.Model):
+    """
+    Sliding-window request counter of one throttle key, shared by every
+    worker process through the database.
+
+    Only the current and the previous fixed window are kept, so each key is
+    a single row and a check is a single statement regardless of the rate.
+    The request rate is estimated as::
+
+        previous_count * (share of the previous window still in range) + current_count
+
+    Attributes:
+        key (str): Throttle key (scope and user ID or client IP)
+        slot (int): Index of the current window (epoch seconds // duration)
+        duration (int): Window length in seconds, used to purge stale rows
+        current_count (int): Requests allowed in the current window
+        previous_count (int): Requests allowed in the window before it
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    slot = models.BigIntegerField()
+    duration = models.PositiveIntegerField()
+    current_count = models.PositiveIntegerField()
+    previous_count = models.PositiveIntegerField()
+
+    def __str__(self) -> str:
+        """String representation of the counter"""
+        return f"{self.key}: {self.current_count} (+{self.previous_count} previous)"
+
+    @classmethod
+    def hit(cls, key: str, limit: int, duration: int,
+            now: Optional[float] = None) -> Tuple[bool, Optional[float]]:
+        """
+        Count a request for ``key`` if it is within the rate.
+
+        Only allowed requests are counted. Counting rejected ones too would
+        let a client that keeps retrying fill every window, and through the
+        previous-window weight stay throttled for good.
+
+        Returns:
+            (allowed, seconds to wait before the next request can pass, or None)
+        """
+        now = time.time() if now is None else now
+        slot = int(now // duration)
+        elapsed = now / duration - slot  # Share of the current window that has passed
+        rejected = cls._count(key, slot, duration, limit, 1 - elapsed)
+        if rejected is None:
+            return True, None
+        current, previous = rejected
+        return False, cls._wait(limit, duration, elapsed, current, previous)
+
+    @classmethod
+    def purge(cls, now: Optional[float] = None) -> int:
+        """
+        Delete counters whose windows no longer affect any decision.
+
+        A row whose slot is two or more windows old counts as empty, so it
+        can go; the next request for its key inserts a fresh one.
+
+        Returns:
+            Number of counters removed
+        """
+        now = time.time() if now is None else now
+        # slot <= now // duration - 2, without dividing in SQL
+        deleted, _ = cls.objects.alias(
+            stale_at=(F('slot') + 2) * F('duration')
+        ).filter(stale_at__lte=now).delete()
+        return deleted
+
+    @classmethod
+    def _count(cls, key: str, slot: int, duration: int, limit: int,
+               weight: float) -> Optional[Tuple[int, int]]:
+        """
+        Atomically count one request in ``slot`` if it fits, rolling the
+        window if needed.
+
+        Returns:
+            None if the request was counted, otherwise the (current, previous)
+            counts it was rejected against
+        """
+        if connection.vendor in ('sqlite', 'postgresql'):
+            # RETURNING needs SQLite 3.35+, while Django supports older versions
+            if connection.features.can_return_columns_from_insert:
+                if cls._upsert(key, slot, duration, limit, weight):
+                    return None
+                return cls._window(key, slot)
+            return cls._update_or_create(key, slot, duration, limit, weight)
+
+        with transaction.atomic():
+            counter, created = cls.objects.select_for_update().get_or_create(
+                key=key,
+                defaults={'slot': slot, 'duration': duration, 'current_count': 1, 'previous_count': 0}
+            )
+            if created:
+                return None
+            previous = cls._rolled_previous(counter.slot, counter.current_count, counter.previous_count, slot)
+            current = counter.current_count if counter.slot == slot else 0
+            if previous * weight + current + 1 > limit:
+                return current, previous
+            counter.slot, counter.duration = slot, duration
+            counter.current_count, counter.previous_count = current + 1, previous
+            counter.save(update_fields=['slot', 'duration', 'current_count', 'previous_count'])
+        return None
+
+    @classmethod
+    def _update_or_create(cls, key: str, slot: int, duration: int, limit: int,
+                          weight: float) -> Optional[Tuple[int, int]]:
+        """
+        UPDATE-then-SELECT fallback of _upsert() for SQLite without RETURNING.
+
+        The conditional UPDATE rolls the window, checks the rate and counts
+        the request in one statement, like _upsert(). If it matched no row,
+        the key is new or the request is over the rate, which the following
+        get_or_create() tells apart. The UPDATE takes SQLite's write lock for
+        the rest of the transaction, so no other request can insert or count
+        in between.
+
+        Returns:
+            None if the request was counted, otherwise the (current, previous)
+            counts it was rejected against
+        """
+        previous = Case(
+            When(slot=slot, then=F('previous_count')),
+            When(slot=slot - 1, then=F('current_count')),
+            default=Value(0)
+        )
+        current = Case(When(slot=slot, then=F('current_count') + 1), default=Value(1))
+        with transaction.atomic():
+            counted = cls.objects.alias(
+                rate=ExpressionWrapper(previous * Value(weight) + current, output_field=FloatField())
+            ).filter(key=key, rate__lte=limit).update(
+                previous_count=previous, current_count=current, slot=slot, duration=duration
+            )
+            if counted:
+                return None
+            counter, created = cls.objects.get_or_create(
+                key=key,
+                defaults={'slot': slot, 'duration': duration, 'current_count': 1, 'previous_count': 0}
+            )
+        if created:
+            return None
+        return (
+            counter.current_count if counter.slot == slot else 0,
+            cls._rolled_previous(counter.slot, counter.current_count, counter.previous_count, slot)
+        )
+
+    @classmethod
+    def _window(cls, key: str, slot: int) -> Tuple[int, int]:
+        """(current, previous) counts of ``key`` as seen from ``slot``"""
+        row_slot, current, previous = cls.objects.filter(key=key).values_list(
+            'slot', 'current_count', 'previous_count'
+        ).get()
+        return (
+            current if row_slot == slot else 0,
+            cls._rolled_previous(row_slot, current, previous, slot)
+        )
+
+    @staticmethod
+    def _rolled_previous(row_slot: int, current: int, previous: int, slot: int) -> int:
+        if row_slot == slot:
+            return previous
+        if row_slot == slot - 1:
+            return current
+        return 0
+
+    @classmethod
+    def _upsert(cls, key: str, slot: int, duration: int, limit: int, weight: float) -> bool:
+        """
+        Single INSERT .. ON CONFLICT DO UPDATE .. WHERE .. RETURNING statement.
+
+        The SET and WHERE expressions all read the row's old values, so the
+        window roll-over, the rate check and the increment happen in one
+        atomic write. A request over the rate leaves the row untouched (the
+        roll-over is recomputed by the next statement) and returns no row.
+
+        Returns:
+            Whether the request was counted
+        """
+        q = connection.ops.quote_name
+        table, key_col, slot_col, duration_col = (
+            q(cls._meta.db_table), q('key'), q('slot'), q('duration')
+        )
+        current_col, previous_col = q('current_count'), q('previous_count')
+        previous = f"""CASE
+                    WHEN {table}.{slot_col} = excluded.{slot_col} THEN {table}.{previous_col}
+                    WHEN {table}.{slot_col} = excluded.{slot_col} - 1 THEN {table}.{current_col}
+                    ELSE 0
+                END"""
+        current = f"""CASE
+                    WHEN {table}.{slot_col} = excluded.{slot_col} THEN {table}.{current_col} + 1
+                    ELSE 1
+                END"""
+        sql = f"""
+            INSERT INTO {table} ({key_col}, {slot_col}, {duration_col}, {current_col}, {previous_col})
+            VALUES (%s, %s, %s, 1, 0)
+            ON CONFLICT ({key_col}) DO UPDATE SET
+                {previous_col} = {previous},
+                {current_col} = {current},
+                {slot_col} = excluded.{slot_col},
+                {duration_col} = excluded.{duration_col}
+            WHERE ({previous}) * %s + ({current}) <= %s
+            RETURNING {current_col}
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [key, slot, duration, weight, limit])
+            return cursor.fetchone() is not None
+
+    @staticmethod
+    def _wait(limit: int, duration: int, elapsed: float, current: int, previous: int) -> float:
+        """Seconds until one more request fits, assuming no other requests arrive"""
+        room = limit - 1 - current  # Room left for the weighted previous window
+        if room >= 0 and previous:
+            # Still in this window, once enough of the previous one has slid out
+            return max((1 - room / previous - elapsed) * duration, 0.0)
+        # Only in the next window, once enough of this one has slid out
+        share = max(1 - (limit - 1) / current, 0.0) if current else 0.0
+        return (1 - elapsed + share) * duration
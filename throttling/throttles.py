@@ -0,0 +1,90 @@
+from typing import Optional
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+from metrics.instruments import route_name, throttled_total
+from .models import ThrottleCounter
+
+
+class SharedRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle counted in the database instead of the Django cache.
+
+    DRF's stock throttles keep a list of request timestamps per client in the
+    cache: every check reads and rewrites the whole list (O(rate) work), and
+    with the default local-memory cache every worker process counts on its
+    own, so N workers allow N times the configured rate. Here each client is
+    one ThrottleCounter row updated by one statement per check, shared by all
+    processes, using a sliding-window estimate over the current and previous
+    windows.
+
+    Only allowed requests are counted, so a client retrying while throttled
+    gets through again as soon as its allowed rate drops below the limit.
+    """
+
+    def get_rate(self) -> Optional[str]:
+        # Read live so override_settings() applies without re-importing DRF settings
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, self._wait = ThrottleCounter.hit(
+            self.key, self.num_requests, self.duration, now=self.timer()
+        )
+        if not allowed:
+            throttled_total.inc(route=route_name(request), scope=self.scope)
+        return allowed
+
+    def wait(self) -> Optional[float]:
+        return getattr(self, '_wait', None)
+
+
+class AnonRateThrottle(SharedRateThrottle):
+    """Limits unauthenticated clients by IP, at the 'anon' rate"""
+
+    scope = 'anon'
+
+    def get_cache_key(self, request, view) -> Optional[str]:
+        if request.user and request.user.is_authenticated:
+            return None  # Only throttle unauthenticated requests
+
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class UserRateThrottle(SharedRateThrottle):
+    """
+    Limits authenticated users by ID (anonymous ones by IP).
+
+    A view's ``throttle_scope`` selects its own rate and counter, e.g.
+    ``throttle_scope = 'tasks'`` uses DEFAULT_THROTTLE_RATES['tasks'].
+    Views without one, or whose scope has no configured rate, use the
+    'user' rate.
+    """
+
+    scope = 'user'
+
+    def __init__(self) -> None:
+        # The rate depends on the view, so it is resolved in allow_request()
+        pass
+
+    def allow_request(self, request, view) -> bool:
+        scope = getattr(view, 'throttle_scope', None)
+        rates = api_settings.DEFAULT_THROTTLE_RATES
+        self.scope = scope if scope in rates else type(self).scope
+        self.rate = self.get_rate()
+        if self.rate is not None:
+            self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view) -> str:
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
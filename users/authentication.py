@@ -0,0 +1,228 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from .models import User
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication usable from async views.
+
+    Token validation is pure CPU work; only the user lookup touches the
+    database, and aauthenticate() performs it with the async ORM. The
+    synchronous authenticate() is inherited unchanged, so the class can also
+    be listed in sync views.
+    """
+
+    async def aauthenticate(self, request) -> Optional[Tuple[User, Token]]:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token: Token) -> User:
+        """Async counterpart of JWTAuthentication.get_user()"""
+        user_id = self.get_user_id(validated_token)
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        return self.check_user(user, validated_token)
+
+    def get_user_id(self, validated_token: Token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def check_user(self, user: User, validated_token: Token) -> User:
+        """Reject inactive users and, if enabled, tokens issued before a password change"""
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+def _user_cache():
+    return caches[getattr(settings, 'JWT_USER_CACHE_ALIAS', 'auth')]
+
+
+def _user_cache_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+def invalidate_cached_user(user_id) -> None:
+    """
+    Drop the cached user now and again once the transaction commits, so a
+    request racing the write cannot re-cache the old row for long.
+    """
+    key = _user_cache_key(user_id)
+    _user_cache().delete(key)
+    transaction.on_commit(lambda: _user_cache().delete(key))
+
+
+class VerifiedTokenCache:
+    """
+    Bounded in-process LRU of access tokens whose signature was verified.
+
+    Clients reuse one access token for many requests, so decoding it and
+    checking its HMAC signature again on each of them is repeated work.
+    Entries are keyed by a SHA-256 digest of the raw token (the token itself
+    is not kept as a key) and are dropped once the token's ``exp`` passes.
+    Only successfully validated tokens are stored.
+
+    The size is read from JWT_VERIFIED_TOKEN_CACHE_SIZE; 0 disables the
+    cache. Counters are kept per process and reported by stats().
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[bytes, Token]' = OrderedDict()
+        self._counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return getattr(settings, 'JWT_VERIFIED_TOKEN_CACHE_SIZE', 10000)
+
+    @staticmethod
+    def _key(raw_token: bytes) -> bytes:
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode('utf-8')
+        return hashlib.sha256(raw_token).digest()
+
+    def get(self, raw_token: bytes) -> Optional[Token]:
+        """Return the validated token, or None if unknown or expired"""
+        if self.maxsize <= 0:
+            return None
+        key = self._key(raw_token)
+        with self._lock:
+            token = self._entries.get(key)
+            if token is not None:
+                if token.get('exp', 0) <= time.time():
+                    del self._entries[key]
+                    token = None
+                else:
+                    self._entries.move_to_end(key)
+            self._counters['misses' if token is None else 'hits'] += 1
+        return token
+
+    def set(self, raw_token: bytes, token: Token) -> None:
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+        key = self._key(raw_token)
+        with self._lock:
+            self._entries[key] = token
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of this process"""
+        with self._lock:
+            counters: Dict[str, Any] = dict(self._counters)
+            counters['size'] = len(self._entries)
+        counters['maxsize'] = self.maxsize
+        lookups = counters['hits'] + counters['misses']
+        counters['hit_rate'] = counters['hits'] / lookups if lookups else 0.0
+        return counters
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+class CachedJWTAuthentication(AsyncJWTAuthentication):
+    """
+    JWT authentication that caches the user row for a short time.
+
+    Saves the User SELECT on most authenticated requests. Entries live in
+    the JWT_USER_CACHE_ALIAS cache, expire after JWT_USER_CACHE_TIMEOUT
+    seconds and are dropped whenever the user is saved or deleted
+    (users.signals). With a shared cache backend, deactivation and password
+    changes therefore take effect on the next request; with a per-process
+    backend (local memory), other workers may keep authenticating the old
+    row for up to the timeout. Writes that skip the signals, such as
+    QuerySet.update() or raw SQL, must call invalidate_cached_user()
+    themselves or are only seen after the timeout. The active and
+    revocation checks run on every request, against the cached row.
+
+    The user is cached rather than rebuilt from the token's claims, because
+    claims are only as fresh as the token (days) and views need the full
+    row (is_staff, is_active).
+
+    Validated tokens are kept in ``verified_token_cache`` so a token seen
+    before is not decoded and verified again.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        token = verified_token_cache.get(raw_token)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            verified_token_cache.set(raw_token, token)
+        return token
+
+    def get_user(self, validated_token: Token) -> User:
+        user_id = self.get_user_id(validated_token)
+        key = _user_cache_key(user_id)
+        user = _user_cache().get(key)
+        if user is None:
+            try:
+                user = self.user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            _user_cache().set(key, user, self.cache_timeout)
+        return self.check_user(user, validated_token)
+
+    async def aget_user(self, validated_token: Token) -> User:
+        user_id = self.get_user_id(validated_token)
+        key = _user_cache_key(user_id)
+        user = await _user_cache().aget(key)
+        if user is None:
+            try:
+                user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            await _user_cache().aset(key, user, self.cache_timeout)
+        return self.check_user(user, validated_token)
+
+    @property
+    def cache_timeout(self) -> int:
+        return getattr(settings, 'JWT_USER_CACHE_TIMEOUT', 60)
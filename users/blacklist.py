@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import Optional
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .models import BlacklistedToken
+
+
+class TokenBlacklist:
+    """
+    Set of revoked token JTIs, stored in the BlacklistedToken table.
+
+    The table is shared by every process and never drops a row before its
+    token expires. A bounded cache would not be safe here: once full it
+    evicts entries, and an evicted JTI makes its revoked token valid again.
+    A check is one indexed SELECT and a revocation one INSERT; the unique
+    jti column makes concurrent revocations of the same token fail.
+
+    Rows of expired tokens are no longer needed, since an expired token
+    fails verification on its own, and are deleted by purge().
+    """
+
+    def add(self, jti: str, exp: int) -> bool:
+        """
+        Revoke ``jti`` until ``exp`` (epoch seconds).
+
+        Returns:
+            False if the JTI was already revoked. The check and the insert
+            are one INSERT against a unique column, so a token cannot be
+            rotated twice by concurrent requests.
+        """
+        try:
+            with transaction.atomic():
+                BlacklistedToken.objects.create(
+                    jti=jti, expires_at=datetime.fromtimestamp(exp, tz=timezone.utc)
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def contains(self, jti: str) -> bool:
+        return BlacklistedToken.objects.filter(jti=jti).exists()
+
+    def purge(self, now: Optional[float] = None) -> int:
+        """
+        Delete the entries of every token that has expired.
+
+        Returns:
+            Number of JTIs removed
+        """
+        cutoff = datetime.fromtimestamp(now, tz=timezone.utc) if now is not None else datetime.now(timezone.utc)
+        removed, _ = BlacklistedToken.objects.filter(expires_at__lte=cutoff).delete()
+        return removed
+
+
+token_blacklist = TokenBlacklist()
+
+
+class BlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token checked against and revoked in ``token_blacklist``.
+
+    Used in place of simplejwt's token_blacklist app, whose outstanding and
+    blacklisted token tables add database writes to every refresh and a
+    query to every check.
+    """
+
+    def verify(self) -> None:
+        super().verify()
+        if token_blacklist.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def outstand(self) -> None:
+        """
+        No outstanding token list is kept; the blacklist only needs JTIs.
+
+        (The inherited method writes to the token_blacklist app's table and
+        fails when that app is not installed.)
+        """
+        return None
+
+    def blacklist(self) -> None:
+        """
+        Revoke this token until it expires.
+
+        Raises:
+            TokenError: If it was revoked concurrently
+        """
+        if not token_blacklist.add(self.payload[api_settings.JTI_CLAIM], self.payload['exp']):
+            raise TokenError(_("Token is blacklisted"))
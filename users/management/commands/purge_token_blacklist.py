@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from users.blacklist import token_blacklist
+
+
+class Command(BaseCommand):
+    """
+    Delete blacklisted refresh token JTIs whose tokens have expired.
+
+    An expired token fails verification on its own, so its blacklist entry
+    is no longer needed. Run this periodically (e.g. hourly from cron) to
+    keep the blacklist table small.
+    """
+
+    help = "Delete expired entries from the refresh token blacklist"
+
+    def handle(self, *args, **options):
+        removed = token_blacklist.purge()
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} expired blacklist entries"))
@@ -1,4 +1,7 @@
+from typing import Any, Dict
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 
@@ -42,6 +45,82 @@ class User(AbstractUser):
         # Prevent clashes with default User model
         swappable = 'AUTH_USER_MODEL'
 
+        indexes = [
+            # Backs the case-insensitive email checks on registration (User.with_email).
+            # email__iexact compiles to LIKE on SQLite, which cannot use it
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+        ]
+
     def __str__(self) -> str:
         """String representation for the user model"""
-        return self.name or self.username
\ No newline at end of file
+        return self.name or self.username
+
+    @classmethod
+    def with_email(cls, email: str) -> models.QuerySet:
+        """
+        Users whose email matches ``email`` case-insensitively.
+
+        Compares UPPER(email) to UPPER(value) explicitly so the lookup can
+        use user_email_upper_idx; email__iexact compiles to LIKE on SQLite.
+        Both sides are folded by the database, so case folding matches the
+        index exactly.
+        """
+        return cls.objects.alias(email_upper=Upper('email')).filter(email_upper=Upper(Value(email)))
+
+    @classmethod
+    def from_db(cls, db, field_names, values) -> 'User':
+        """Remember the loaded field values, so has_changed() can compare against them"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        """Save, then treat the saved values as the loaded ones"""
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        saved = self._current_values()
+        if update_fields is not None:
+            saved = {name: value for name, value in saved.items() if name in set(update_fields)}
+        self._loaded_values = {**getattr(self, '_loaded_values', {}), **saved}
+
+    def has_changed(self, *fields: str) -> bool:
+        """
+        Whether any of ``fields`` differs from its value when the user was
+        loaded or last saved.
+
+        Fields that are deferred and were never set are not saved, so they
+        count as unchanged; fields of a user that was never loaded count as
+        changed.
+
+        Returns:
+            True if at least one of the fields changed
+        """
+        loaded = getattr(self, '_loaded_values', {})
+        current = self._current_values()
+        return any(
+            field in current and (field not in loaded or loaded[field] != current[field])
+            for field in fields
+        )
+
+    def _current_values(self) -> Dict[str, Any]:
+        """Attribute values of the concrete fields that are not deferred"""
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields if field.attname in self.__dict__
+        }
+
+class BlacklistedToken(models.Model):
+    """
+    A revoked refresh token, kept until the token expires (users.blacklist).
+
+    Attributes:
+        jti (str): The token's unique identifier (jti claim)
+        expires_at (datetime): When the token expires; later rows are purged
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        """String representation for the blacklisted token"""
+        return self.jti
@@ -1,7 +1,12 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from .models import User
-from typing import Dict, Any
+from .blacklist import BlacklistRefreshToken
+from typing import Dict, Any, List
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Upper
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.translation import gettext as _
@@ -28,6 +33,89 @@ class UserSerializer(serializers.ModelSerializer):
         """Return combined first and last name"""
         return obj.name
 
+class BulkUserRegistrationListSerializer(serializers.ListSerializer):
+    """
+    List serializer used by UserRegistrationSerializer(many=True)
+
+    Features:
+    - Rejects duplicate usernames/emails/mobiles within one batch
+    - Checks the batch against existing users with a single query
+    - Creates all users with a single bulk_create in one transaction
+    """
+
+    UNIQUE_FIELDS = ('username', 'email', 'mobile')
+
+    def validate(self, attrs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Ensure the batch does not contain the same identity twice"""
+        errors = [{} for _ in attrs]
+        for field in self.UNIQUE_FIELDS:
+            seen = set()
+            for index, item in enumerate(attrs):
+                value = item.get(field)
+                if not value:
+                    continue
+                key = value.lower() if field == 'email' else value
+                if key in seen:
+                    errors[index][field] = [_("Duplicate value in this batch")]
+                seen.add(key)
+
+        self._validate_not_registered(attrs, errors)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def _validate_not_registered(self, attrs: List[Dict[str, Any]], errors: List[Dict]) -> None:
+        """
+        Check the whole batch against existing users with one query.
+
+        Replaces the per-item uniqueness queries of the child serializer.
+        """
+        usernames = {item['username'] for item in attrs if item.get('username')}
+        emails = {item['email'].upper() for item in attrs if item.get('email')}
+        mobiles = {item['mobile'] for item in attrs if item.get('mobile')}
+        if not (usernames or emails or mobiles):
+            return
+
+        existing = {'username': set(), 'email': set(), 'mobile': set()}
+        rows = User.objects.annotate(email_upper=Upper('email')).filter(
+            Q(username__in=usernames) | Q(email_upper__in=emails) | Q(mobile__in=mobiles)
+        ).values_list('username', 'email_upper', 'mobile')
+        for username, email_upper, mobile in rows:
+            existing['username'].add(username)
+            existing['email'].add(email_upper)
+            existing['mobile'].add(mobile)
+
+        messages = {
+            'username': _("A user with that username already exists."),
+            'email': _("This email is already registered"),
+            'mobile': _("This mobile number is already registered"),
+        }
+        for index, item in enumerate(attrs):
+            for field in self.UNIQUE_FIELDS:
+                value = item.get(field)
+                if not value or field in errors[index]:
+                    continue
+                key = value.upper() if field == 'email' else value
+                if key in existing[field]:
+                    errors[index][field] = [messages[field]]
+
+    def create(self, validated_data: List[Dict[str, Any]]) -> List[User]:
+        """
+        Hash each password once and insert all users in one statement.
+
+        A user registered concurrently between validation and the insert
+        surfaces as an IntegrityError, reported as a 400 for the whole batch.
+        """
+        users = [self.child.build_user(dict(item)) for item in validated_data]
+        try:
+            with transaction.atomic():
+                return User.objects.bulk_create(users)
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'detail': _("One or more users were registered concurrently; no users were created")
+            })
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     Handles user registration with password validation
@@ -64,12 +152,33 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'last_name': {'required': True},
             'email': {'required': True}
         }
+        list_serializer_class = BulkUserRegistrationListSerializer
+
+    @property
+    def in_bulk(self) -> bool:
+        """True when validating one item of a bulk registration batch"""
+        return isinstance(self.parent, BulkUserRegistrationListSerializer)
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        """
+        Drop per-field unique validators in bulk mode; the list serializer
+        checks the whole batch with a single query instead.
+        """
+        fields = super().get_fields()
+        if self.in_bulk:
+            for name in BulkUserRegistrationListSerializer.UNIQUE_FIELDS:
+                fields[name].validators = [
+                    validator for validator in fields[name].validators
+                    if not isinstance(validator, UniqueValidator)
+                ]
+        return fields
     
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         """Main validation entry point"""
         self._validate_passwords(attrs)
-        self._validate_unique_email(attrs.get('email'))
-        self._validate_unique_mobile(attrs.get('mobile'))
+        if not self.in_bulk:
+            self._validate_unique_email(attrs.get('email'))
+            self._validate_unique_mobile(attrs.get('mobile'))
         return attrs
 
     def _validate_passwords(self, attrs: Dict[str, Any]) -> None:
@@ -87,7 +196,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def _validate_unique_email(self, email: str) -> None:
         """Ensure email uniqueness"""
-        if email and User.objects.filter(email__iexact=email).exists():
+        if email and User.with_email(email).exists():
             raise serializers.ValidationError({
                 'email': _("This email is already registered")
             })
@@ -100,11 +209,22 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             })
     
     def create(self, validated_data: Dict[str, Any]) -> User:
-        """Create user with proper password handling"""
+        """Create user, hashing the password and writing the row once"""
         validated_data.pop('password2')
-        user = User.objects.create_user(**validated_data)
-        user.set_password(validated_data['password'])
-        user.save()
+        return User.objects.create_user(**validated_data)
+
+    def build_user(self, validated_data: Dict[str, Any]) -> User:
+        """
+        Build an unsaved user the same way create_user() would.
+
+        Used for bulk registration, where rows are inserted with bulk_create.
+        """
+        validated_data.pop('password2')
+        password = validated_data.pop('password')
+        validated_data['username'] = User.normalize_username(validated_data['username'])
+        validated_data['email'] = User.objects.normalize_email(validated_data.get('email'))
+        user = User(**validated_data)
+        user.set_password(password)
         return user
 
 
@@ -129,13 +249,15 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
-        """Add user data to token response"""
+        """
+        Add user data to token response.
+
+        The parent already authenticates the user and issues the token pair
+        through get_token(), so no extra tokens are minted here.
+        """
         data = super().validate(attrs)
-        refresh = self.get_token(self.user)
 
         data.update({
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
             'user': {
                 'id': self.user.id,
                 'name': self.user.name,
@@ -144,4 +266,16 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             }
         })
 
-        return data
\ No newline at end of file
+        return data
+
+
+class BlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer used by TokenRefreshView (SIMPLE_JWT setting
+    TOKEN_REFRESH_SERIALIZER).
+
+    Rejects blacklisted refresh tokens and, with ROTATE_REFRESH_TOKENS and
+    BLACKLIST_AFTER_ROTATION, blacklists the rotated token in the
+    table-backed users.blacklist.token_blacklist.
+    """
+    token_class = BlacklistRefreshToken
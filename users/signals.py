@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .authentication import invalidate_cached_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance: User, **kwargs) -> None:
+    """Authentication must see deactivation and password changes at once"""
+    invalidate_cached_user(instance.pk)
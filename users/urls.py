@@ -1,6 +1,8 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import CustomTokenObtainPairView, UserRegistrationView
+from .views import (
+    CustomTokenObtainPairView, UserRegistrationView, BulkUserRegistrationView, TokenCacheStatsView
+)
 
 
 urlpatterns = [
@@ -18,4 +20,12 @@ urlpatterns = [
     # Body: { username, password, email, etc. }
     # Returns: User details or success message
     path('register/', UserRegistrationView.as_view(), name='user-register'),
+
+    # POST - Register many users in one transaction (staff only)
+    # Body: [ { username, password, email, etc. }, ... ]
+    # Returns: Created user IDs
+    path('register/bulk/', BulkUserRegistrationView.as_view(), name='user-register-bulk'),
+
+    # GET - Verified access token cache counters (staff only)
+    path('token-cache/stats/', TokenCacheStatsView.as_view(), name='token-cache-stats'),
 ]
\ No newline at end of file
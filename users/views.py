@@ -1,9 +1,11 @@
 from rest_framework import generics, status
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from .serializers import UserRegistrationSerializer, CustomTokenObtainPairSerializer
-from rest_framework.throttling import AnonRateThrottle
-from rest_framework.exceptions import Throttled
+from .authentication import verified_token_cache
+from throttling.throttles import AnonRateThrottle, UserRateThrottle
+from rest_framework.exceptions import Throttled, ValidationError
 from rest_framework.response import Response
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -24,15 +26,22 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
     def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
+        """
+        Validate credentials once and wrap the issued token pair.
+
+        The serializer runs the password hasher and mints the tokens, so it
+        must only be validated a single time per request.
+        """
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.user
-        
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
         return Response({
             'status': 'success',
             'message': 'Authentication successful',
-            'tokens': response.data,
+            'tokens': serializer.validated_data,
         }, status=status.HTTP_200_OK)
 
     def handle_exception(self, exc):
@@ -69,7 +78,7 @@ class UserRegistrationView(generics.CreateAPIView):
     
     def perform_create(self, serializer) -> None:
         """
-        Handles user creation and securely sets the password.
+        Handles user creation; the password is hashed by the serializer.
 
         Method: Internal
 
@@ -93,9 +102,8 @@ class UserRegistrationView(generics.CreateAPIView):
             if not password:
                 raise ValidationError({"Password": "Password is required."})
             
-            instance = serializer.save()
-            instance.set_password(serializer.validated_data['password'])
-            instance.save()
+            # The serializer hashes the password and saves the user once
+            serializer.save()
 
         except ValidationError as e:
             raise ValidationError(
@@ -137,4 +145,71 @@ class UserRegistrationView(generics.CreateAPIView):
                 'detail': 'You are making too many requests. Please wait.',
                 'wait_time': f"{exc.wait} seconds"
             }, status=429)
-        return super().handle_exception(exc)
\ No newline at end of file
+        return super().handle_exception(exc)
+
+
+class BulkUserRegistrationView(generics.CreateAPIView):
+    """
+    API endpoint for onboarding many users in one request (staff only).
+    
+    Method: POST
+
+    Request Body:
+    - JSON array of registration payloads (same fields as /register/)
+    
+    Returns:
+    - 201 Created: All users registered in a single transaction
+    - 400 Bad Request: Per-item errors; no users are created
+    - 403 Forbidden: Requesting user is not staff
+    """
+    throttle_classes = [UserRateThrottle]
+    serializer_class = UserRegistrationSerializer
+    permission_classes = [IsAdminUser]
+    max_batch_size = 100
+
+    def create(self, request, *args, **kwargs):
+        """Validate the whole batch, then bulk insert it"""
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=self.max_batch_size
+        )
+        serializer.is_valid(raise_exception=True)
+        users = serializer.save()
+
+        return Response({
+            'status': 'success',
+            'message': f'{len(users)} users registered successfully',
+            'users': [
+                {'user_id': user.id, 'username': user.username, 'email': user.email}
+                for user in users
+            ]
+        }, status=status.HTTP_201_CREATED)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            # Custom response when throttled
+            return Response({
+                'detail': 'You are making too many requests. Please wait.',
+                'wait_time': f"{exc.wait} seconds"
+            }, status=429)
+        return super().handle_exception(exc)
+
+
+class TokenCacheStatsView(generics.GenericAPIView):
+    """
+    API endpoint exposing verified access token cache counters for monitoring
+    
+    Method: GET
+
+    Returns:
+    - 200 OK: Hit/miss/eviction counters and size of the serving process
+    - 403 Forbidden: Requesting user is not staff
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response({
+            'status': 'success',
+            'stats': verified_token_cache.stats()
+        }, status=status.HTTP_200_OK)